@@ -4,6 +4,11 @@ from fastapi import FastAPI
 from app.routes import user, job, resume, application, match, auth, ai_optimization, ats, dashboard, download, job_search, integration, jdi, user_profile
 from fastapi.middleware.cors import CORSMiddleware
 from app.database.connection import engine
+from app.services.jdi.run_queue import run_workers
+from app.services.jdi.scheduler import jdi_scheduler
+from app.services.job_batch_parser import shutdown_pool as shutdown_jd_parse_pool
+from app.services.outbound_http import outbound_http
+from app.utils.nlp_provider import NLP_PRELOAD, nlp_provider
 from sqlalchemy import text
 import logging
 import sys
@@ -11,7 +16,6 @@ import os
 from datetime import datetime
 from app.config.settings import PROJECT_ROOT
 from dotenv import load_dotenv
-import httpx
 import asyncio
 
 load_dotenv()
@@ -61,17 +65,35 @@ async def startup_event():
     for route in app.routes:
         app_logger.info(f"{route.path} → {route.methods}")
 
+    # ✅ Shared pooled client for outbound HTTP from async handlers (closed on shutdown)
+    await outbound_http.start()
+    # ✅ Background workers for queued JDI ingestion runs (JDI_RUN_WORKERS, default 2)
+    run_workers.start()
+    # ✅ Background scans for connected users + daily pruning (JDI_SCHEDULER_ENABLED)
+    jdi_scheduler.start()
+    # ✅ spaCy is loaded on first use unless NLP_PRELOAD=true (loaded off the event loop)
+    if NLP_PRELOAD:
+        await asyncio.to_thread(nlp_provider.preload)
+
     # 🚀 Only ping in production
     if os.getenv("ENVIRONMENT") == "production":
         await asyncio.sleep(3)
         try:
-            async with httpx.AsyncClient() as client:
-                res = await client.get("https://findmydreamjobs.onrender.com") 
-                app_logger.info(f"🌐 Self-ping OK: {res.status_code}")
+            res = await outbound_http.get("https://findmydreamjobs.onrender.com")
+            app_logger.info(f"🌐 Self-ping OK: {res.status_code}")
         except Exception as e:
             app_logger.warning(f"🚫 Failed self-ping: {e}")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    jdi_scheduler.stop()
+    run_workers.stop()
+    shutdown_jd_parse_pool()
+    app_logger.info(f"Outbound HTTP per host: {outbound_http.stats()}")
+    await outbound_http.aclose()
+
+
 # Register API routes
 app.include_router(ai_optimization.router)  # ✅ AI Resume Optimization API
 app.include_router(application.router)
@@ -115,4 +137,10 @@ def health_check():
     except Exception as e:
         app_logger.warning(f"Health check DB ping failed: {e}")
 
-    return {"status": "ok", "db": db_status}
\ No newline at end of file
+    return {"status": "ok", "db": db_status}
+
+
+@app.get("/health/outbound")
+def outbound_health():
+    """Outbound HTTP counters per upstream host since startup (requests, retries, errors, latency)."""
+    return {"hosts": outbound_http.stats()}
\ No newline at end of file
@@ -0,0 +1,30 @@
+"""add_jdi_candidate_dedup_indexes
+
+Revision ID: 3f8d2c91a7e4
+Revises: 616310ff25ce
+Create Date: 2026-10-18 10:12:41.503219
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8d2c91a7e4'
+down_revision: Union[str, None] = '616310ff25ce'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_jdi_user_jd_hash', 'jdi_candidates', ['user_id', 'jd_hash'], unique=False)
+    op.create_index('ix_jdi_user_title_company', 'jdi_candidates', ['user_id', 'title', 'company'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_jdi_user_title_company', table_name='jdi_candidates')
+    op.drop_index('ix_jdi_user_jd_hash', table_name='jdi_candidates')
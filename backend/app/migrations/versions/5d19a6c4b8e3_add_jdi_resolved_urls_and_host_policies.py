@@ -0,0 +1,48 @@
+"""add_jdi_resolved_urls_and_host_policies
+
+Revision ID: 5d19a6c4b8e3
+Revises: e7b3f95a0c62
+Create Date: 2026-10-18 14:10:27.518342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d19a6c4b8e3'
+down_revision: Union[str, None] = 'e7b3f95a0c62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('jdi_resolved_urls',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('raw_url_hash', sa.String(length=64), nullable=False),
+    sa.Column('raw_url', sa.Text(), nullable=False),
+    sa.Column('resolved_url', sa.Text(), nullable=False),
+    sa.Column('resolved_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('raw_url_hash')
+    )
+    op.create_table('jdi_host_policies',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('host', sa.String(length=255), nullable=False),
+    sa.Column('consecutive_blocked', sa.Integer(), nullable=False),
+    sa.Column('blocked_total', sa.Integer(), nullable=False),
+    sa.Column('success_total', sa.Integer(), nullable=False),
+    sa.Column('email_only_until', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('host')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('jdi_host_policies')
+    op.drop_table('jdi_resolved_urls')
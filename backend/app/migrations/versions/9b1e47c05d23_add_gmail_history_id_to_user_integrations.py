@@ -0,0 +1,28 @@
+"""add_gmail_history_id_to_user_integrations
+
+Revision ID: 9b1e47c05d23
+Revises: 3f8d2c91a7e4
+Create Date: 2026-10-18 11:03:27.918442
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b1e47c05d23'
+down_revision: Union[str, None] = '3f8d2c91a7e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('user_integrations', sa.Column('gmail_history_id', sa.String(length=32), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('user_integrations', 'gmail_history_id')
@@ -0,0 +1,53 @@
+"""add_jdi_runs_table
+
+Revision ID: a8e2c7d41f90
+Revises: 5d19a6c4b8e3
+Create Date: 2026-10-18 15:21:09.664180
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8e2c7d41f90'
+down_revision: Union[str, None] = '5d19a6c4b8e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('jdi_runs',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('params', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('stage', sa.String(length=30), nullable=True),
+    sa.Column('emails_scanned', sa.Integer(), nullable=False),
+    sa.Column('cards_found', sa.Integer(), nullable=False),
+    sa.Column('cards_processed', sa.Integer(), nullable=False),
+    sa.Column('new_candidates', sa.Integer(), nullable=False),
+    sa.Column('message', sa.Text(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('worker_id', sa.String(length=64), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('heartbeat_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('uq_jdi_runs_user_active', 'jdi_runs', ['user_id'], unique=True,
+                    postgresql_where=sa.text("status IN ('queued', 'running')"))
+    op.create_index('ix_jdi_runs_status_created', 'jdi_runs', ['status', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_jdi_runs_status_created', table_name='jdi_runs')
+    op.drop_index('uq_jdi_runs_user_active', table_name='jdi_runs')
+    op.drop_table('jdi_runs')
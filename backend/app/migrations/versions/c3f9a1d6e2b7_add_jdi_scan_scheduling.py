@@ -0,0 +1,32 @@
+"""add_jdi_scan_scheduling
+
+Revision ID: c3f9a1d6e2b7
+Revises: a8e2c7d41f90
+Create Date: 2026-10-18 16:02:44.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f9a1d6e2b7'
+down_revision: Union[str, None] = 'a8e2c7d41f90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('user_integrations', sa.Column('sync_failures', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('user_integrations', sa.Column('next_scan_at', sa.DateTime(), nullable=True))
+    op.add_column('jdi_runs', sa.Column('trigger', sa.String(length=20), server_default='manual', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('jdi_runs', 'trigger')
+    op.drop_column('user_integrations', 'next_scan_at')
+    op.drop_column('user_integrations', 'sync_failures')
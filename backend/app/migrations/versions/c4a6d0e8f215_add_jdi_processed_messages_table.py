@@ -0,0 +1,37 @@
+"""add_jdi_processed_messages_table
+
+Revision ID: c4a6d0e8f215
+Revises: 9b1e47c05d23
+Create Date: 2026-10-18 11:48:05.331870
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a6d0e8f215'
+down_revision: Union[str, None] = '9b1e47c05d23'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('jdi_processed_messages',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('message_id', sa.String(), nullable=False),
+    sa.Column('card_count', sa.Integer(), nullable=False),
+    sa.Column('processed_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id', 'message_id', name='uq_jdi_processed_user_message')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('jdi_processed_messages')
@@ -0,0 +1,49 @@
+"""add_precomputed_extraction_columns
+
+Revision ID: d8a3f6c1b947
+Revises: f1d48b2c7a95
+Create Date: 2026-10-18 19:02:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8a3f6c1b947'
+down_revision: Union[str, None] = 'f1d48b2c7a95'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('jobs', sa.Column('salary_min', sa.Float(), nullable=True))
+    op.add_column('jobs', sa.Column('salary_max', sa.Float(), nullable=True))
+    op.add_column('jobs', sa.Column('salary_currency', sa.String(length=10), nullable=True))
+    op.add_column('jobs', sa.Column('salary_frequency', sa.String(length=20), nullable=True))
+    op.add_column('jobs', sa.Column('extracted_at', sa.DateTime(), nullable=True))
+    op.add_column('saved_jobs', sa.Column('extracted_skills', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.add_column('saved_jobs', sa.Column('salary_min', sa.Float(), nullable=True))
+    op.add_column('saved_jobs', sa.Column('salary_max', sa.Float(), nullable=True))
+    op.add_column('saved_jobs', sa.Column('salary_currency', sa.String(length=10), nullable=True))
+    op.add_column('saved_jobs', sa.Column('salary_frequency', sa.String(length=20), nullable=True))
+    op.add_column('saved_jobs', sa.Column('extracted_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('saved_jobs', 'extracted_at')
+    op.drop_column('saved_jobs', 'salary_frequency')
+    op.drop_column('saved_jobs', 'salary_currency')
+    op.drop_column('saved_jobs', 'salary_max')
+    op.drop_column('saved_jobs', 'salary_min')
+    op.drop_column('saved_jobs', 'extracted_skills')
+    op.drop_column('jobs', 'extracted_at')
+    op.drop_column('jobs', 'salary_frequency')
+    op.drop_column('jobs', 'salary_currency')
+    op.drop_column('jobs', 'salary_max')
+    op.drop_column('jobs', 'salary_min')
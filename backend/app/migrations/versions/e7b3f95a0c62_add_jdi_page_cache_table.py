@@ -0,0 +1,41 @@
+"""add_jdi_page_cache_table
+
+Revision ID: e7b3f95a0c62
+Revises: c4a6d0e8f215
+Create Date: 2026-10-18 13:02:41.907215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b3f95a0c62'
+down_revision: Union[str, None] = 'c4a6d0e8f215'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('jdi_page_cache',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('url_hash', sa.String(length=64), nullable=False),
+    sa.Column('url', sa.Text(), nullable=False),
+    sa.Column('status_code', sa.Integer(), nullable=True),
+    sa.Column('etag', sa.String(length=255), nullable=True),
+    sa.Column('last_modified', sa.String(length=64), nullable=True),
+    sa.Column('jd_text', sa.Text(), nullable=True),
+    sa.Column('extraction_confidence', sa.Integer(), nullable=False),
+    sa.Column('fetched_at', sa.DateTime(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('url_hash')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('jdi_page_cache')
@@ -0,0 +1,39 @@
+"""add_jdi_run_events_table
+
+Revision ID: f1d48b2c7a95
+Revises: c3f9a1d6e2b7
+Create Date: 2026-10-18 17:12:05.551840
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1d48b2c7a95'
+down_revision: Union[str, None] = 'c3f9a1d6e2b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('jdi_run_events',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('run_id', sa.String(length=36), nullable=False),
+    sa.Column('seq', sa.Integer(), nullable=False),
+    sa.Column('type', sa.String(length=30), nullable=False),
+    sa.Column('data', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['run_id'], ['jdi_runs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('run_id', 'seq', name='uq_jdi_run_events_run_seq')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('jdi_run_events')
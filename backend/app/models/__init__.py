@@ -6,4 +6,10 @@ from .match import JobMatch
 from .saved_job import SavedJob
 from .user_profile import UserProfile
 from .user_integration import UserIntegration
-from .jdi_candidate import JDICandidate
\ No newline at end of file
+from .jdi_candidate import JDICandidate
+from .jdi_processed_message import JDIProcessedMessage
+from .jdi_page_cache import JDIPageCache
+from .jdi_resolved_url import JDIResolvedURL
+from .jdi_host_policy import JDIHostPolicy
+from .jdi_run import JDIRun
+from .jdi_run_event import JDIRunEvent
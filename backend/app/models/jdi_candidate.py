@@ -42,6 +42,9 @@ class JDICandidate(Base):
         Index("ix_jdi_user_status_score", "user_id", "status", "match_score"),
         # Unread tracking
         Index("ix_jdi_user_seen", "user_id", "seen_at"),
+        # Ingestion dedup: same content / same posting across alert emails
+        Index("ix_jdi_user_jd_hash", "user_id", "jd_hash"),
+        Index("ix_jdi_user_title_company", "user_id", "title", "company"),
     )
 
     # Relationships
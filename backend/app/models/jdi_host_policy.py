@@ -0,0 +1,23 @@
+# File: backend/app/models/jdi_host_policy.py
+# Learned per-host fetch policy: hosts that keep answering 403 / login walls go email-only
+from sqlalchemy import Column, Integer, String, DateTime
+from app.database.connection import Base
+from datetime import datetime, timezone
+import uuid
+
+
+class JDIHostPolicy(Base):
+    __tablename__ = "jdi_host_policies"
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    host = Column(String(255), nullable=False, unique=True)
+    consecutive_blocked = Column(Integer, default=0, nullable=False)  # Reset by any successful fetch
+    blocked_total = Column(Integer, default=0, nullable=False)
+    success_total = Column(Integer, default=0, nullable=False)
+    email_only_until = Column(DateTime, nullable=True)  # Skip network fetches until then (naive UTC)
+    updated_at = Column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
@@ -0,0 +1,21 @@
+# File: backend/app/models/jdi_page_cache.py
+# Cache of fetched + extracted JD pages, keyed by resolved URL (shared by all users)
+from sqlalchemy import Column, Integer, String, Text, DateTime
+from app.database.connection import Base
+from datetime import datetime, timezone
+import uuid
+
+
+class JDIPageCache(Base):
+    __tablename__ = "jdi_page_cache"
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    url_hash = Column(String(64), nullable=False, unique=True)  # SHA-256 of url (urls exceed index limits)
+    url = Column(Text, nullable=False)                          # Resolved job page URL
+    status_code = Column(Integer, nullable=True)                # HTTP status of the last full fetch
+    etag = Column(String(255), nullable=True)                   # Validators for conditional requests
+    last_modified = Column(String(64), nullable=True)
+    jd_text = Column(Text, nullable=True)                       # NULL = negative entry (blocked / no JD)
+    extraction_confidence = Column(Integer, default=0, nullable=False)
+    fetched_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    expires_at = Column(DateTime, nullable=False)
@@ -0,0 +1,21 @@
+# File: backend/app/models/jdi_processed_message.py
+# Ledger of Gmail messages already run through JDI ingestion
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, UniqueConstraint
+from app.database.connection import Base
+from datetime import datetime, timezone
+import uuid
+
+
+class JDIProcessedMessage(Base):
+    __tablename__ = "jdi_processed_messages"
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    message_id = Column(String, nullable=False)             # Gmail message ID
+    card_count = Column(Integer, default=0, nullable=False)  # Job cards parsed from the email
+    processed_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+
+    __table_args__ = (
+        # One ledger row per user per Gmail message (also the lookup index)
+        UniqueConstraint("user_id", "message_id", name="uq_jdi_processed_user_message"),
+    )
@@ -0,0 +1,16 @@
+# File: backend/app/models/jdi_resolved_url.py
+# Memoized redirect resolution: normalized raw apply link → final job page URL
+from sqlalchemy import Column, String, Text, DateTime
+from app.database.connection import Base
+from datetime import datetime, timezone
+import uuid
+
+
+class JDIResolvedURL(Base):
+    __tablename__ = "jdi_resolved_urls"
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    raw_url_hash = Column(String(64), nullable=False, unique=True)  # SHA-256 of normalized raw URL
+    raw_url = Column(Text, nullable=False)                          # normalize_url(apply link)
+    resolved_url = Column(Text, nullable=False)
+    resolved_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
@@ -0,0 +1,40 @@
+# File: backend/app/models/jdi_run.py
+# DB-backed queue of JDI ingestion runs (POST /api/jdi/run enqueues, workers execute)
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
+from app.database.connection import Base
+from datetime import datetime, timezone
+import uuid
+
+
+class JDIRun(Base):
+    __tablename__ = "jdi_runs"
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    status = Column(String(20), default="queued", nullable=False)  # queued | running | succeeded | failed
+    trigger = Column(String(20), default="manual", nullable=False)  # manual | scheduled
+    params = Column(JSONB, nullable=True)                # run_jdi_ingestion keyword arguments
+    stage = Column(String(30), nullable=True)            # Current pipeline stage (progress)
+    emails_scanned = Column(Integer, default=0, nullable=False)
+    cards_found = Column(Integer, default=0, nullable=False)
+    cards_processed = Column(Integer, default=0, nullable=False)
+    new_candidates = Column(Integer, default=0, nullable=False)
+    message = Column(Text, nullable=True)
+    error = Column(Text, nullable=True)
+    worker_id = Column(String(64), nullable=True)
+
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)       # Bumped on every progress update
+    finished_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # One queued/running run per user — concurrent POSTs collapse onto it
+        Index(
+            "uq_jdi_runs_user_active", "user_id", unique=True,
+            postgresql_where=text("status IN ('queued', 'running')"),
+        ),
+        # Workers claim the oldest queued run
+        Index("ix_jdi_runs_status_created", "status", "created_at"),
+    )
@@ -0,0 +1,22 @@
+# File: backend/app/models/jdi_run_event.py
+# Ordered progress events of a JDI ingestion run (streamed by GET /api/jdi/runs/{id}/events)
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from app.database.connection import Base
+from datetime import datetime, timezone
+import uuid
+
+
+class JDIRunEvent(Base):
+    __tablename__ = "jdi_run_events"
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    run_id = Column(String(36), ForeignKey("jdi_runs.id", ondelete="CASCADE"), nullable=False)
+    seq = Column(Integer, nullable=False)                # 1-based, per run (SSE event id)
+    type = Column(String(30), nullable=False)            # stage | emails_fetched | cards_parsed | ...
+    data = Column(JSONB, nullable=True)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("run_id", "seq", name="uq_jdi_run_events_run_seq"),
+    )
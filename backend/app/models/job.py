@@ -1,5 +1,5 @@
 # backend/app/models/job.py
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Float
 from sqlalchemy.orm import relationship
 from app.database.connection import Base
 from datetime import datetime, timezone
@@ -20,6 +20,12 @@ class Job(Base):
     extracted_skills = Column(JSONB, nullable=True)  # ✅ Store as an 2D array /w skills/frequency
     required_experience = Column(String, nullable=True) # ✅ Adding this for tracking experienve
     salary = Column(String, nullable=True)  # ✅ New field for salary information
+    # ✅ Derived from the JD once at write time (see services/job_precompute.py)
+    salary_min = Column(Float, nullable=True)
+    salary_max = Column(Float, nullable=True)
+    salary_currency = Column(String(10), nullable=True)
+    salary_frequency = Column(String(20), nullable=True)  # annual, hourly, weekly, bi-weekly, monthly
+    extracted_at = Column(DateTime, nullable=True)  # NULL = not extracted yet (backfill picks it up)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
     updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=True)
 
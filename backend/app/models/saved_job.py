@@ -3,9 +3,9 @@
 
 # File: app/models/saved_job.py
 
-from sqlalchemy import Column, Integer, String, Boolean, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, Text, DateTime, ForeignKey, Float
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.schema import UniqueConstraint
 from datetime import datetime, timezone
 import uuid
@@ -32,6 +32,13 @@ class SavedJob(Base):
     job_apply_link = Column(String, nullable=False)  # from job["job_google_link"]
     job_posted_at = Column(DateTime, nullable=False)  # from job["job_posted_at_datetime_utc"]
     saved_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    # ✅ Derived from the JD once at write time (see services/job_precompute.py)
+    extracted_skills = Column(JSONB, nullable=True)
+    salary_min = Column(Float, nullable=True)
+    salary_max = Column(Float, nullable=True)
+    salary_currency = Column(String(10), nullable=True)
+    salary_frequency = Column(String(20), nullable=True)
+    extracted_at = Column(DateTime, nullable=True)  # NULL = not extracted yet (backfill picks it up)
 
     # Define this argument to ensure that the search_id + user_id combination is unique:
     __table_args__ = (
@@ -20,6 +20,9 @@ class UserIntegration(Base):
     expires_at = Column(DateTime, nullable=True)             # Access token expiry
     status = Column(String(20), default="active", nullable=False)  # active | revoked | error
     last_sync_at = Column(DateTime, nullable=True)           # Last successful Gmail scan
+    gmail_history_id = Column(String(32), nullable=True)     # Mailbox historyId at last scan (incremental sync)
+    sync_failures = Column(Integer, default=0, nullable=False)  # Consecutive failed scans (scheduler backoff)
+    next_scan_at = Column(DateTime, nullable=True)           # Next scheduled background scan (NULL = not yet scheduled)
 
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
     updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc),
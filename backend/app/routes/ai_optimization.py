@@ -9,6 +9,7 @@ from app.models.match import JobMatch
 from app.models.job import Job
 from app.services.resume_optimizer import optimize_resume_with_skills_service
 from app.services.score_calc import calculate_scores
+from app.services.resume_features import invalidate_resume_features
 from app.utils.job_extraction import extract_skills_with_frequency
 from typing import List
 import logging
@@ -144,4 +145,5 @@ def approve_resume(payload: dict, db: Session = Depends(get_db)):
     resume.updated_at = datetime.now(timezone.utc)
 
     db.commit()
+    invalidate_resume_features(resume_id)
     return {"message": "Resume approved and updated successfully."}
@@ -1,7 +1,11 @@
 # File: backend/app/routes/jdi.py
 # API routes for JDI (Job Daily Intelligence) candidate feed and actions
+import asyncio
+import json
 from datetime import datetime, timezone
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 
@@ -17,9 +21,12 @@ from app.schemas.jdi import (
     JDIPromoteRequest,
     JDIPromoteResponse,
     JDIRunRequest,
-    JDIRunResponse,
+    JDIRunStatus,
 )
-from app.services.jdi.ingestion import run_jdi_ingestion
+from app.models.jdi_run import JDIRun
+from app.models.jdi_run_event import JDIRunEvent
+from app.services.jdi.run_queue import ACTIVE_STATUSES, enqueue_run
+from app.services.job_precompute import precompute_job, precompute_saved_job
 import logging
 
 logger = logging.getLogger(__name__)
@@ -179,6 +186,7 @@ def promote_candidate(
         job_link=candidate.job_url_raw,
         salary=candidate.salary_text,
     )
+    precompute_job(job)
     db.add(job)
     db.flush()  # Get the job.id
 
@@ -195,6 +203,7 @@ def promote_candidate(
             job_apply_link=candidate.job_url_raw or "",
             job_posted_at=candidate.created_at,
         )
+        precompute_saved_job(saved_job)
         db.add(saved_job)
 
     # Step 3: Update candidate status
@@ -206,14 +215,18 @@ def promote_candidate(
     return JDIPromoteResponse(job_id=job.id, status="promoted")
 
 
-@router.post("/run", response_model=JDIRunResponse)
+@router.post("/run", response_model=JDIRunStatus, status_code=202)
 def run_ingestion(
     body: JDIRunRequest = None,
     user_id: int = Query(...),
     db: Session = Depends(get_db),
 ):
     """
-    Trigger JDI ingestion: scan Gmail for job alerts, extract, score, and persist.
+    Queue JDI ingestion (scan Gmail for job alerts, extract, score, and persist).
+
+    Returns immediately with a run_id; poll GET /api/jdi/runs/{run_id} for
+    progress. While the user already has a queued or running run, that run
+    is returned instead of starting another one.
     """
     body = body or JDIRunRequest()  # ensures fields exist if request body omitted
 
@@ -249,17 +262,145 @@ def run_ingestion(
         user_id, window_hours, sources_enabled, custom_source_patterns
     )
 
-    try:
-        result = run_jdi_ingestion(
-            user_id=user_id,
-            db=db,
-            window_hours=window_hours,
-            sources_enabled=sources_enabled,
-            custom_source_patterns=custom_source_patterns,
-            force_full_window=force_full_window,
-        )
-        return JDIRunResponse(**result)
-    except Exception as e:
-        logger.exception("JDI ingestion error for user_id=%s", user_id)
-        raise HTTPException(status_code=500, detail=f"Ingestion failed: {str(e)}")
+    run, created = enqueue_run(
+        user_id,
+        {
+            "window_hours": window_hours,
+            "sources_enabled": sources_enabled,
+            "custom_source_patterns": custom_source_patterns,
+            "force_full_window": force_full_window,
+        },
+        db,
+    )
+    return _run_status(run, deduplicated=not created)
+
+
+@router.get("/runs/{run_id}", response_model=JDIRunStatus)
+def get_run_status(
+    run_id: str,
+    user_id: int = Query(...),
+    db: Session = Depends(get_db),
+):
+    """Progress of an ingestion run (emails scanned, cards processed, new candidates)."""
+    run = db.query(JDIRun).filter_by(id=run_id, user_id=user_id).first()
+    if not run:
+        raise HTTPException(status_code=404, detail="Run not found")
+    return _run_status(run)
+
+
+# Event stream polling: new events are picked up within RUN_EVENTS_POLL_SECONDS;
+# a comment line keeps idle proxies from closing the stream
+RUN_EVENTS_POLL_SECONDS = 0.5
+RUN_EVENTS_KEEPALIVE_SECONDS = 15
 
+
+@router.get("/runs/{run_id}/events")
+def stream_run_events(
+    run_id: str,
+    user_id: int = Query(...),
+    after: int = Query(0, ge=0),
+    last_event_id: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    """
+    Server-Sent Events stream of an ingestion run's progress.
+
+    Each event is `id: <seq>`, `event: <type>` (stage, emails_fetched,
+    cards_parsed, cards_scored, candidate_created, done, failed) and a JSON
+    `data:` line. candidate_created carries the new candidate's feed fields,
+    so the feed can render results while the run continues. The stream ends
+    after done/failed; reconnects resume after Last-Event-ID (or ?after=).
+    A run that finished without logging done/failed (a stale run failed by
+    the sweep, a lost final write) gets one built from its row.
+    """
+    if not db.query(JDIRun.id).filter_by(id=run_id, user_id=user_id).first():
+        raise HTTPException(status_code=404, detail="Run not found")
+    if last_event_id and last_event_id.isdigit():
+        after = max(after, int(last_event_id))
+
+    return StreamingResponse(
+        _run_event_stream(run_id, after, db),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _poll_run_events(db: Session, run_id: str, after: int) -> tuple[list, Optional[dict]]:
+    """Events after seq `after`, and the run's terminal event (from its row) once it has finished."""
+    # Row first: a finished run's last event was committed with its status
+    run = (
+        db.query(JDIRun.status, JDIRun.error, JDIRun.message, JDIRun.emails_scanned, JDIRun.new_candidates)
+        .filter_by(id=run_id)
+        .first()
+    )
+    events = (
+        db.query(JDIRunEvent.seq, JDIRunEvent.type, JDIRunEvent.data)
+        .filter(JDIRunEvent.run_id == run_id, JDIRunEvent.seq > after)
+        .order_by(JDIRunEvent.seq)
+        .all()
+    )
+    # End the read transaction so the connection goes back to the pool between polls
+    db.commit()
+    if run is not None and run.status in ACTIVE_STATUSES:
+        return events, None
+    return events, _terminal_event(run)
+
+
+def _terminal_event(run) -> dict:
+    """done/failed event data matching what execute_run logs, rebuilt from the run row."""
+    if run is not None and run.status == "succeeded":
+        return {"type": "done", "stage": "done", "result": {
+            "new_candidates": run.new_candidates or 0,
+            "total_emails_scanned": run.emails_scanned or 0,
+            "message": run.message,
+        }}
+    return {"type": "failed", "error": (run.error if run is not None else None) or "Ingestion failed"}
+
+
+def _sse_event(seq: int, type_: str, data: Optional[dict]) -> str:
+    return f"id: {seq}\nevent: {type_}\ndata: {json.dumps(data or {}, default=str)}\n\n"
+
+
+async def _run_event_stream(run_id: str, after: int, db: Session):
+    idle = 0.0
+    try:
+        while True:
+            events, terminal = await asyncio.to_thread(_poll_run_events, db, run_id, after)
+            for seq, type_, data in events:
+                after = seq
+                yield _sse_event(seq, type_, data)
+                if type_ in ("done", "failed"):
+                    return
+            if terminal:
+                # Finished without a logged done/failed event — without one the
+                # client's EventSource would reconnect to an empty stream forever
+                type_ = terminal.pop("type")
+                yield _sse_event(after + 1, type_, terminal)
+                return
+            if events:
+                idle = 0.0
+            elif idle >= RUN_EVENTS_KEEPALIVE_SECONDS:
+                idle = 0.0
+                yield ": keepalive\n\n"
+            await asyncio.sleep(RUN_EVENTS_POLL_SECONDS)
+            idle += RUN_EVENTS_POLL_SECONDS
+    finally:
+        await asyncio.to_thread(db.close)
+
+
+def _run_status(run: JDIRun, deduplicated: bool = False) -> JDIRunStatus:
+    return JDIRunStatus(
+        run_id=run.id,
+        status=run.status,
+        stage=run.stage,
+        emails_scanned=run.emails_scanned or 0,
+        cards_found=run.cards_found or 0,
+        cards_processed=run.cards_processed or 0,
+        new_candidates=run.new_candidates or 0,
+        message=run.message,
+        error=run.error,
+        deduplicated=deduplicated,
+        created_at=run.created_at,
+        started_at=run.started_at,
+        finished_at=run.finished_at,
+    )
@@ -1,15 +1,22 @@
 # ✅ File: //backend/app/routes/job.py
-import requests
+# Handlers that must await (outbound fetch, raw request body) are async and
+# run their extraction + DB work with asyncio.to_thread; the rest are plain
+# def, which FastAPI runs in its threadpool. Never call sync SQLAlchemy,
+# spaCy or the regex extractors directly on the event loop.
+import asyncio
 from bs4 import BeautifulSoup
 from fastapi import APIRouter, HTTPException, Depends, Request
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.database.connection import get_db
 from app.models.job import Job
 from app.models.saved_job import SavedJob
 from datetime import datetime, timezone
-import spacy
-from app.schemas.job import JobInput, JobOut, JobIn, SaveJobIn, UnsaveJobIn  # centeralized JobInput and JobOut to schemas/job.py
-from app.utils.salary_extractor import extract_salary  # Import salary extraction utility
+from app.schemas.job import JobInput, JobOut, JobIn, SaveJobIn, UnsaveJobIn, JobBatchInput  # centeralized JobInput and JobOut to schemas/job.py
+from app.services.job_batch_parser import parse_job_descriptions
+from app.services.job_precompute import clear_job_salary, precompute_job, precompute_saved_job
+from app.services.outbound_http import outbound_http
+from app.utils.salary_extractor import salary_fields  # raw salary text + structured min/max/currency/frequency
 from app.utils.job_extraction import (
     extract_title,
     extract_company_name,
@@ -20,8 +27,8 @@ from app.utils.job_extraction import (
 
 router = APIRouter()
 
-# Load spaCy model
-nlp = spacy.load("en_core_web_sm")
+# Max JDs per /parse-job-descriptions/batch request
+JD_BATCH_MAX = 100
 
 from pydantic import BaseModel
 from typing import Optional
@@ -41,14 +48,26 @@ def update_job(job_id: int, payload: JobUpdateIn, db: Session = Depends(get_db))
         raise HTTPException(status_code=404, detail="Job not found")
 
     # Update only provided fields
-    for field, value in payload.dict(exclude_unset=True).items():
+    updates = payload.dict(exclude_unset=True)
+    for field, value in updates.items():
         setattr(job, field, value)
+    if updates.get("salary"):
+        precompute_job(job)  # re-derive salary_min/max/... from the edited salary
+    elif "salary" in updates:
+        clear_job_salary(job)  # cleared by the user — don't re-extract it from the JD
 
     db.commit()
     db.refresh(job)
     return job
 
 
+def _description_from_html(html: str) -> str:
+    soup = BeautifulSoup(html, "html.parser")
+    # Simple strategy: Get largest <p> or all text content
+    paragraphs = soup.find_all("p")
+    return max(paragraphs, key=lambda p: len(p.text)).text if paragraphs else soup.get_text()
+
+
 @router.post("/parse-job-description", tags=["Jobs"])
 async def parse_job_description(job: JobInput, db: Session = Depends(get_db)):
     if not job.job_link and not job.job_description:
@@ -59,25 +78,26 @@ async def parse_job_description(job: JobInput, db: Session = Depends(get_db)):
     description = job.job_description
     if not description and job.job_link:
         try:
-            response = requests.get(job.job_link, timeout=5)
-            soup = BeautifulSoup(response.text, "html.parser")
-            # Simple strategy: Get largest <p> or all text content
-            paragraphs = soup.find_all("p")
-            description = max(paragraphs, key=lambda p: len(p.text)).text if paragraphs else soup.get_text()
+            response = await outbound_http.get(job.job_link, timeout=5)
+            description = await asyncio.to_thread(_description_from_html, response.text)
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Failed to extract job description from link: {str(e)}")
 
     if not description:
         raise HTTPException(status_code=400, detail="Job description could not be extracted.")
 
+    return await asyncio.to_thread(_parse_and_save_job, job, description, db)
+
 
+def _parse_and_save_job(job: JobInput, description: str, db: Session) -> dict:
     # 🧠 mostly using spaCy to extract:
     skills = extract_skills_with_frequency(description)
     title = extract_title(description)
     experience = extract_experience(description)
     location = extract_location(description)
     company = extract_company_name(description)
-    salary = extract_salary(description) # Extract salary if available, else None
+    salary_columns = salary_fields(description)  # raw text + min/max/currency/frequency
+    salary = salary_columns.pop("salary")
 
     # 🧾 Save to DB
     new_job = Job(
@@ -90,6 +110,8 @@ async def parse_job_description(job: JobInput, db: Session = Depends(get_db)):
         company_name=company or "Unknown Company",  # ✅ Fallback if extract company return nothing
         location=location,
         salary=salary,
+        **salary_columns,
+        extracted_at=datetime.now(timezone.utc),
         created_at=datetime.now(timezone.utc),
         updated_at=datetime.now(timezone.utc),
     )
@@ -109,6 +131,78 @@ async def parse_job_description(job: JobInput, db: Session = Depends(get_db)):
         "salary": salary,
     }
 
+@router.post("/parse-job-descriptions/batch", tags=["Jobs"])
+def parse_job_descriptions_batch(batch: JobBatchInput, db: Session = Depends(get_db)):
+    """
+    Parse and save many JDs in one request (bulk import of saved postings or search results).
+
+    Every item gets a result at its index: the saved job_id and extracted
+    fields, or an error. A failed item doesn't stop the others; the saved
+    jobs go in with one bulk INSERT and one commit. Links are not fetched
+    here — each item needs its job_description.
+    """
+    if not batch.jobs:
+        raise HTTPException(status_code=400, detail="At least one job description is required.")
+    if len(batch.jobs) > JD_BATCH_MAX:
+        raise HTTPException(status_code=400, detail=f"At most {JD_BATCH_MAX} job descriptions per batch.")
+
+    results = [
+        {"index": i, "job_id": None, "error": "Job description is required."}
+        for i in range(len(batch.jobs))
+    ]
+    valid = [i for i, item in enumerate(batch.jobs) if item.job_description and item.job_description.strip()]
+    parsed = parse_job_descriptions([batch.jobs[i].job_description for i in valid])
+
+    now = datetime.now(timezone.utc)
+    rows, saved = [], []
+    for i, fields in zip(valid, parsed):
+        if "error" in fields:
+            results[i]["error"] = fields["error"]
+            continue
+        item = batch.jobs[i]
+        rows.append({
+            "user_id": batch.user_id,
+            "job_link": item.job_link or "N/A",
+            "job_description": item.job_description,
+            "job_title": fields["title"],
+            "extracted_skills": fields["skills"],
+            "required_experience": fields["experience"],
+            "company_name": fields["company"] or "Unknown Company",
+            "location": fields["location"],
+            "salary": fields["salary"],
+            "salary_min": fields["salary_min"],
+            "salary_max": fields["salary_max"],
+            "salary_currency": fields["salary_currency"],
+            "salary_frequency": fields["salary_frequency"],
+            "extracted_at": now,
+            "created_at": now,
+            "updated_at": now,
+        })
+        saved.append(i)
+        results[i].update({
+            "error": None,
+            "title": fields["title"],
+            "company_name": fields["company"],
+            "skills": fields["skills"],
+            "experience": fields["experience"],
+            "location": fields["location"],
+            "salary": fields["salary"],
+        })
+
+    # 🧾 One bulk INSERT ... RETURNING for the whole batch
+    if rows:
+        job_ids = db.scalars(insert(Job).returning(Job.id, sort_by_parameter_order=True), rows).all()
+        db.commit()
+        for i, job_id in zip(saved, job_ids):
+            results[i]["job_id"] = job_id
+
+    return {
+        "message": f"✅ Parsed and saved {len(saved)} of {len(batch.jobs)} jobs.",
+        "saved": len(saved),
+        "failed": len(batch.jobs) - len(saved),
+        "results": results,
+    }
+
 @router.post("/analyze-searched-job", tags=["Jobs"])
 async def analyze_searched_job(request: Request, db: Session = Depends(get_db)):
     """
@@ -120,13 +214,17 @@ async def analyze_searched_job(request: Request, db: Session = Depends(get_db)):
         if field not in payload:
             raise HTTPException(status_code=400, detail=f"Missing required field: {field}")
 
+    return await asyncio.to_thread(_save_searched_job, payload, db)
+
+
+def _save_searched_job(payload: dict, db: Session) -> Job:
     job_title = payload["job_title"]
     employer_name = payload["employer_name"]
     job_description = payload["job_description"]
     job_location = payload.get("job_location") or extract_location(job_description)
     user_id = payload["user_id"]
     job_link = payload.get("job_link")
-    salary = payload.get("salary") or extract_salary(job_description)
+    salary = payload.get("salary")  # extracted from the JD by precompute_job when missing
 
     extracted_skills: dict[str, list[str]] = extract_skills_with_frequency(job_description)
 
@@ -141,6 +239,7 @@ async def analyze_searched_job(request: Request, db: Session = Depends(get_db)):
         extracted_skills=extracted_skills,
         created_at=datetime.now(timezone.utc),
     )
+    precompute_job(new_job)
     db.add(new_job)
     db.commit()
     db.refresh(new_job)
@@ -207,6 +306,7 @@ def save_job(payload: SaveJobIn, db: Session = Depends(get_db)):
         job_apply_link=job_data.job_google_link,
         job_posted_at=parsed_posted_at,
     )
+    precompute_saved_job(new_saved)  # salary/location/skills extracted once, here
 
     db.add(new_saved)
     db.commit()
@@ -229,7 +329,7 @@ def unsave_job(payload: UnsaveJobIn, db: Session = Depends(get_db)):
     return {"message": "Job unsaved successfully."}
 
 @router.get("/saved-jobs/{user_id}", tags=["Jobs"])
-async def get_saved_jobs(user_id: int, db: Session = Depends(get_db)):
+def get_saved_jobs(user_id: int, db: Session = Depends(get_db)):
     saved = db.query(SavedJob).filter(SavedJob.user_id == user_id).all()
 
     # Return full job data for frontend display
@@ -244,10 +344,24 @@ async def get_saved_jobs(user_id: int, db: Session = Depends(get_db)):
             "job_location": s.job_location,
             "job_is_remote": s.job_is_remote,
             "job_employment_type": s.job_employment_type,
-            "job_salary": s.job_salary or extract_salary(s.job_description or ""),
+            **_saved_salary(s),
             "job_google_link": s.job_apply_link,
             "job_description": s.job_description,
             "job_posted_at_datetime_utc": (s.job_posted_at.isoformat() if s.job_posted_at else datetime.utcnow().isoformat()),
         }
         for s in saved
     ]
+
+
+def _saved_salary(s: SavedJob) -> dict:
+    if s.extracted_at is None:
+        # Not backfilled yet (see services/job_precompute.py) — extract on read
+        fields = salary_fields(s.job_description or "", s.job_salary)
+        return {"job_salary": fields.pop("salary"), **fields}
+    return {
+        "job_salary": s.job_salary,
+        "salary_min": s.salary_min,
+        "salary_max": s.salary_max,
+        "salary_currency": s.salary_currency,
+        "salary_frequency": s.salary_frequency,
+    }
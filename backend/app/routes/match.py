@@ -11,6 +11,7 @@ from pydantic import BaseModel
 from app.utils.job_extraction import extract_skills_with_frequency
 from app.config.skills_config import SKILL_KEYWORDS
 from app.services.score_calc import calculate_scores
+from app.services.resume_features import get_resume_features
 
 
 router = APIRouter()
@@ -42,7 +43,8 @@ def calculate_match(request: MatchRequest, db: Session = Depends(get_db)):
     if not resume or not job:
         raise HTTPException(status_code=404, detail="Resume or Job not found.")
 
-    resume_text = resume.parsed_text.lower()
+    resume_features = get_resume_features(resume)
+    resume_text = resume_features.text_lower
 
     # ✅ Extract structured skills from job.extracted_skills JSONB
     extracted = job.extracted_skills or {}
@@ -60,7 +62,9 @@ def calculate_match(request: MatchRequest, db: Session = Depends(get_db)):
     missing_skills = [skill_map[kw] for kw in jd_keywords if kw not in resume_text]
 
     # ✅ Compute scores
-    ats_score_after,match_score, _  = calculate_scores(resume_text,job_description, list(jd_keywords))
+    ats_score_after,match_score, _  = calculate_scores(
+        resume_text, job_description, list(jd_keywords), resume_terms=resume_features.term_counts
+    )
 
     # ✅ Cast to Python float to avoid psycopg2 schema error
     match_score = match_score
@@ -162,7 +166,7 @@ def quick_match_score(request: QuickMatchRequest, db: Session = Depends(get_db))
     if not resume:
         return {"match_score": 0, "message": "No resume found for user"}
 
-    resume_text = resume.parsed_text or ""
+    resume_features = get_resume_features(resume)
     job_description = request.job_description or ""
 
     # Extract keywords from job description
@@ -170,7 +174,10 @@ def quick_match_score(request: QuickMatchRequest, db: Session = Depends(get_db))
     jd_keyword_strings = [skill["skill"] if isinstance(skill, dict) else skill for skill in jd_keywords]
 
     # Calculate scores using same logic as JDI
-    _, match_score, _ = calculate_scores(resume_text, job_description, jd_keyword_strings)
+    _, match_score, _ = calculate_scores(
+        resume.parsed_text or "", job_description, jd_keyword_strings,
+        resume_terms=resume_features.term_counts,
+    )
 
     return {
         "match_score": round(match_score),
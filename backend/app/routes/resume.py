@@ -1,6 +1,7 @@
 # ✅ File: backend/app/routes/resume.py
 # Resume Management APIs:
 import os
+import shutil
 import uuid
 import pdfplumber  # 👈 Install it using: pip install pdfplumber
 from docx import Document  # DOCX Support
@@ -13,6 +14,7 @@ from app.config.settings import UPLOAD_DIR
 from fastapi.responses import FileResponse
 from app.services.file_utils import generate_resume_file, cleanup_file
 from app.services.score_calc import calculate_scores  # 👈 Import ATS scoring function
+from app.services.resume_features import invalidate_resume_features
 
 
 router = APIRouter()
@@ -60,8 +62,10 @@ def extract_text_from_file(file_path: str) -> str:
         return f"❌ Error processing file: {str(e)}"
 
 # 🔹 1. Upload Resume
+# Plain def: FastAPI runs it in the threadpool, so pdfplumber parsing and ATS
+# scoring of a large upload no longer stall every other request on the worker
 @router.post("/upload-resume", tags=["Resumes"])
-async def upload_resume(
+def upload_resume(
     user_id: int = Form(...),  # 👈 FIXED HERE
     file: UploadFile = File(...),
     resume_name: str = Form(None),  # ✅ add this
@@ -91,7 +95,7 @@ async def upload_resume(
 
     os.makedirs(UPLOAD_DIR, exist_ok=True)
     with open(file_path, "wb") as f:
-        f.write(await file.read())
+        shutil.copyfileobj(file.file, f)
 
     # 🔹 Extract text from PDF, DOCX, or TXT
     extracted_text = extract_text_from_file(file_path)
@@ -119,6 +123,7 @@ async def upload_resume(
     db.add(new_resume)
     db.commit()
     db.refresh(new_resume)
+    invalidate_resume_features(new_resume.id)
 
     return {
         "message": "✅ Resume uploaded successfully",
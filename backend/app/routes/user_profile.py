@@ -7,6 +7,7 @@ from app.database.connection import SessionLocal
 from app.models.user_profile import UserProfile
 from app.models.user import User
 from app.schemas.user_profile import UserProfileCreate, UserProfileUpdate, UserProfileOut
+from app.services.jdi.ingestion import LEDGER_FILTER_FIELDS, reset_processed_messages
 import logging
 
 logger = logging.getLogger(__name__)
@@ -44,18 +45,24 @@ def update_profile(user_id: int, body: UserProfileUpdate, db: Session = Depends(
         raise HTTPException(status_code=404, detail="User not found")
 
     profile = db.query(UserProfile).filter_by(user_id=user_id).first()
+    update_data = body.model_dump(exclude_none=True)
+    # Ingestion without a profile filters with the schema defaults
+    previous = {f: getattr(profile, f) if profile else UserProfileCreate.model_fields[f].default
+                for f in LEDGER_FILTER_FIELDS}
 
     if not profile:
         # Create new profile with defaults + provided fields
-        profile_data = body.model_dump(exclude_none=True)
-        profile = UserProfile(user_id=user_id, **profile_data)
+        profile = UserProfile(user_id=user_id, **update_data)
         db.add(profile)
     else:
         # Update only provided fields
-        update_data = body.model_dump(exclude_none=True)
         for field, value in update_data.items():
             setattr(profile, field, value)
 
+    # New title / min-score filters: emails skipped under the old ones get re-checked
+    if any(f in update_data and update_data[f] != previous[f] for f in LEDGER_FILTER_FIELDS):
+        reset_processed_messages(user_id, db)
+
     db.commit()
     db.refresh(profile)
     return profile
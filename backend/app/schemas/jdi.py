@@ -62,8 +62,18 @@ class JDIPromoteResponse(BaseModel):
     status: str = "promoted"
 
 
-class JDIRunResponse(BaseModel):
-    """Response after triggering ingestion."""
-    new_candidates: int
-    total_emails_scanned: int
-    message: str = "Ingestion complete"
+class JDIRunStatus(BaseModel):
+    """A queued/running/finished ingestion run and its progress."""
+    run_id: str
+    status: str                      # queued | running | succeeded | failed
+    stage: Optional[str] = None      # fetching_emails | parsing | scoring | done
+    emails_scanned: int = 0
+    cards_found: int = 0
+    cards_processed: int = 0
+    new_candidates: int = 0
+    message: Optional[str] = None
+    error: Optional[str] = None
+    deduplicated: bool = False       # POST joined the user's already active run
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
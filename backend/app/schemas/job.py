@@ -8,6 +8,14 @@ class JobInput(BaseModel):
     job_description: str | None = None
     user_id: int  # Required to track which user added this job
 
+class JobBatchItem(BaseModel):
+    job_description: str | None = None
+    job_link: str | None = None
+
+class JobBatchInput(BaseModel):
+    user_id: int
+    jobs: list[JobBatchItem]
+
 class JobOut(BaseModel):
     id: int
     job_title: str
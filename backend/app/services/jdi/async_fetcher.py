@@ -0,0 +1,311 @@
+# File: backend/app/services/jdi/async_fetcher.py
+# Concurrent JD fetch stage for JDI ingestion.
+#
+# "Other"-source cards (Talent.com, Trabajo.org, ...) used to be resolved
+# (requests.head) and fetched (requests.get) one after another with a fresh
+# connection each time, so one slow page stalled the whole run. All pages of
+# a run are now fetched concurrently through one pooled httpx.AsyncClient,
+# with a cap per host and a deadline for the whole stage. With a DB session,
+# redirect resolutions are memoized (resolved_urls.py), pages go through the
+# persistent page cache (page_cache.py) and hosts that keep blocking us are
+# learned as email-only (host_policy.py).
+import asyncio
+import logging
+import re
+from typing import Optional
+from urllib.parse import urlparse
+
+import httpx
+from sqlalchemy.orm import Session
+
+from app.services.jdi.host_policy import load_email_only_hosts, record_host_outcomes, url_host
+from app.services.jdi.jd_fetcher import REQUEST_HEADERS, extract_jd_text
+from app.services.jdi.link_extractor import normalize_url, resolved_url_cache
+from app.services.jdi.page_cache import CachedPage, load_cached_pages, store_cached_pages
+from app.services.jdi.resolved_urls import load_resolved_urls, store_resolved_urls
+
+logger = logging.getLogger(__name__)
+
+JD_FETCH_MAX_CONNECTIONS = 20     # keep-alive pool shared by every host
+JD_FETCH_PER_HOST = 4             # concurrent requests to any single host
+JD_FETCH_TIMEOUT = httpx.Timeout(15.0, connect=5.0)
+JD_FETCH_DEADLINE = 60.0          # seconds for the whole fetch stage
+
+_NO_JD: tuple[Optional[str], int] = (None, 0)
+
+# Responses that mean "this page is blocked / gone for us" — cached as negative.
+# 429 is rate limiting, not a refusal: it is treated as transient (not cached).
+_NEGATIVE_STATUSES = {401, 403, 404, 410}
+# ...of which these mean the host is refusing us (fed into host_policy)
+_BLOCKED_STATUSES = {401, 403}
+
+# Redirect targets that are login walls rather than job pages
+_LOGIN_WALL_RE = re.compile(r"/(login|signin|sign-in|authwall|auth/|account/login)", re.IGNORECASE)
+
+
+class JDFetcher:
+    """
+    Pooled async fetcher: resolve redirects, download and extract JD pages.
+
+    Use as an async context manager — the client (and its connection pool)
+    lives for one fetch stage:
+
+        async with JDFetcher() as fetcher:
+            results = await fetcher.fetch_all({url: source, ...})
+    """
+
+    def __init__(
+        self,
+        per_host: int = JD_FETCH_PER_HOST,
+        max_connections: int = JD_FETCH_MAX_CONNECTIONS,
+        timeout: httpx.Timeout = JD_FETCH_TIMEOUT,
+        deadline: float = JD_FETCH_DEADLINE,
+    ):
+        self.per_host = per_host
+        self.deadline = deadline
+        self._client_kwargs = {
+            "headers": REQUEST_HEADERS,
+            "timeout": timeout,
+            "follow_redirects": True,
+            "limits": httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        }
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+        # Network outcome per fetched page url: True = blocked, False = JD extracted
+        self._blocked: dict[str, bool] = {}
+
+    async def __aenter__(self) -> "JDFetcher":
+        self._client = httpx.AsyncClient(**self._client_kwargs)
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self._client.aclose()
+        self._client = None
+
+    def _slot(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc.lower()
+        if host not in self._host_slots:
+            self._host_slots[host] = asyncio.Semaphore(self.per_host)
+        return self._host_slots[host]
+
+    async def _head_resolve(self, raw_url: str) -> Optional[str]:
+        """Final URL after following redirects with a HEAD, None on failure."""
+        try:
+            async with self._slot(raw_url):
+                resp = await self._client.head(raw_url)
+            final_url = str(resp.url)
+            logger.debug(f"Resolved: {raw_url[:80]} → {final_url[:80]}")
+            return final_url
+        except httpx.HTTPError as e:
+            logger.warning(f"Failed to resolve URL {raw_url[:80]}: {e}")
+            return None
+
+    async def resolve(self, raw_url: str) -> str:
+        """Async resolve_canonical_url: follow redirects, keep raw_url on failure."""
+        if "linkedin.com" in (raw_url or ""):
+            # LinkedIn redirects often lead to auth/login pages, destroying the real target
+            return raw_url
+        return await self._head_resolve(raw_url) or raw_url
+
+    async def resolve_all(
+        self, raw_urls: list[str], db: Optional[Session], loop_deadline: float
+    ) -> dict[str, str]:
+        """
+        Memoized resolve() for a batch: in-process LRU, then the persisted
+        table (one query), then concurrent HEADs for what is still unknown.
+        Failed resolutions keep the raw URL and are not memoized.
+        """
+        resolved: dict[str, str] = {}
+        keys: dict[str, str] = {}
+        for url in raw_urls:
+            if "linkedin.com" in url:
+                resolved[url] = url
+                continue
+            keys[url] = normalize_url(url)
+            hit = resolved_url_cache.get(keys[url])
+            if hit:
+                resolved[url] = hit
+
+        misses = [u for u in keys if u not in resolved]
+        if misses and db is not None:
+            stored = load_resolved_urls(db, {keys[u] for u in misses})
+            for url in misses:
+                if keys[url] in stored:
+                    resolved[url] = stored[keys[url]]
+                    resolved_url_cache.put(keys[url], resolved[url])
+
+        to_resolve = [u for u in misses if u not in resolved]
+        finals = await self._gather({u: self._head_resolve(u) for u in to_resolve}, loop_deadline)
+        learned = {}
+        for url in to_resolve:
+            final_url = finals.get(url)
+            resolved[url] = final_url or url
+            if final_url:
+                learned[keys[url]] = final_url
+                resolved_url_cache.put(keys[url], final_url)
+        if learned and db is not None:
+            store_resolved_urls(db, learned)
+        logger.debug(
+            f"Resolved {len(raw_urls)} links: {len(raw_urls) - len(to_resolve)} memoized, "
+            f"{len(to_resolve)} via HEAD"
+        )
+        return resolved
+
+    async def fetch_page(
+        self, url: str, source: str, cached: Optional[CachedPage] = None
+    ) -> Optional[CachedPage]:
+        """
+        Fetch and extract one resolved JD page.
+
+        A fresh cache entry is returned as-is; a stale one is revalidated with
+        If-None-Match / If-Modified-Since and kept on 304. Blocked pages come
+        back as negative entries (jd_text=None). Returns None on transient
+        failures (network errors, timeouts, 5xx), which are not cached.
+        """
+        if cached is not None and cached.is_fresh():
+            return cached
+        try:
+            async with self._slot(url):
+                resp = await self._client.get(url, headers=cached.validators() if cached else None)
+        except httpx.HTTPError as e:
+            logger.warning(f"Failed to fetch JD from {url[:80]}: {e}")
+            return None
+
+        if resp.status_code == 304 and cached is not None:
+            logger.debug(f"JD page not modified: {url[:80]}")
+            self._blocked[url] = False
+            return cached.stamped()
+
+        negative = CachedPage(url=url, jd_text=None, extraction_confidence=0, status_code=resp.status_code)
+        if resp.status_code in _NEGATIVE_STATUSES:
+            logger.warning(f"JD page blocked ({resp.status_code}): {url[:80]}")
+            if resp.status_code in _BLOCKED_STATUSES:
+                self._blocked[url] = True
+            return negative.stamped()
+        if resp.status_code >= 400:
+            logger.warning(f"Failed to fetch JD from {url[:80]}: HTTP {resp.status_code}")
+            return None
+        if _LOGIN_WALL_RE.search(resp.url.path):
+            logger.debug(f"JD page redirected to a login wall: {url[:80]}")
+            self._blocked[url] = True
+            return negative.stamped()
+
+        # Extraction is CPU-bound bs4 work — keep it off the event loop
+        jd_text, confidence = await asyncio.to_thread(extract_jd_text, resp.text, source)
+        if jd_text:
+            self._blocked[url] = False
+        return CachedPage(
+            url=url,
+            jd_text=jd_text,
+            extraction_confidence=confidence if jd_text else 0,
+            status_code=resp.status_code,
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+        ).stamped()
+
+    async def _gather(self, coros: dict, loop_deadline: float) -> dict:
+        """Run {key: coroutine} concurrently until loop_deadline; missing keys = cancelled/failed."""
+        tasks = {asyncio.ensure_future(coro): key for key, coro in coros.items()}
+        if not tasks:
+            return {}
+        timeout = max(0.0, loop_deadline - asyncio.get_running_loop().time())
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            logger.warning(f"JD fetch deadline ({self.deadline}s) hit: {len(pending)} requests cancelled")
+        results = {}
+        for task in done:
+            if task.exception() is None:
+                results[tasks[task]] = task.result()
+            else:
+                logger.debug(f"URL fetch failed for {str(tasks[task])[:60]}: {task.exception()}")
+        return results
+
+    async def fetch_all(
+        self, urls: dict[str, str], db: Optional[Session] = None
+    ) -> dict[str, tuple[Optional[str], int]]:
+        """
+        Fetch every {apply_link: source} concurrently.
+
+        Apply links are resolved first (memoized); with a db session the
+        resolved URLs are then looked up in the page cache in one query, and
+        new or revalidated pages are written back (caller commits). Links on
+        hosts learned as email-only are skipped without a request. Links still
+        in flight when the stage deadline passes are cancelled and reported
+        as (None, 0), like any other failed fetch.
+        """
+        if not urls:
+            return {}
+        loop_deadline = asyncio.get_running_loop().time() + self.deadline
+        email_only = load_email_only_hosts(db, {url_host(u) for u in urls}) if db is not None else set()
+
+        active = [u for u in urls if url_host(u) not in email_only]
+        resolved = await self.resolve_all(active, db, loop_deadline)
+        if db is not None:
+            email_only |= load_email_only_hosts(db, {url_host(r) for r in resolved.values()} - email_only)
+        resolved = {u: r for u, r in resolved.items() if url_host(r) not in email_only}
+        if len(resolved) < len(urls):
+            logger.info(f"Skipped {len(urls) - len(resolved)} links on email-only hosts")
+
+        cached = load_cached_pages(db, set(resolved.values())) if db is not None else {}
+        targets = {r: urls[url] for url, r in resolved.items()}  # resolved url → source
+        pages = await self._gather(
+            {r: self.fetch_page(r, source, cached.get(r)) for r, source in targets.items()},
+            loop_deadline,
+        )
+        if db is not None:
+            # Fresh hits are returned unchanged — only write what was (re)fetched
+            store_cached_pages(db, [
+                page for r, page in pages.items() if page is not None and page is not cached.get(r)
+            ])
+            hits = sum(1 for r, page in pages.items() if page is not None and page is cached.get(r))
+            logger.info(f"JD page cache: {hits}/{len(targets)} fresh hits")
+            record_host_outcomes(db, self._host_outcomes(resolved))
+
+        results = {}
+        for url in urls:
+            page = pages.get(resolved.get(url))
+            results[url] = (page.jd_text, page.extraction_confidence) if page and page.jd_text else _NO_JD
+        return results
+
+    def _host_outcomes(self, resolved: dict[str, str]) -> dict[str, list[bool]]:
+        """
+        Network outcomes per host, one per fetched page, credited to the final
+        host only — a shared redirector (click.indeed.com, appcast) isn't the
+        one refusing us, and marking it email-only would skip every link
+        through it before resolution.
+        """
+        outcomes: dict[str, list[bool]] = {}
+        for r in dict.fromkeys(resolved.values()):
+            if r in self._blocked:
+                outcomes.setdefault(url_host(r), []).append(self._blocked[r])
+        return outcomes
+
+
+def fetch_jd_texts(
+    urls: dict[str, str], db: Optional[Session] = None, **fetcher_kwargs
+) -> dict[str, tuple[Optional[str], int]]:
+    """
+    Synchronous entry point for the ingestion pipeline.
+
+    Args:
+        urls: {apply_link: source} for every card that needs its JD fetched.
+        db: Session for the persistent page cache; no caching when omitted.
+        fetcher_kwargs: JDFetcher overrides (per_host, timeout, deadline, ...).
+
+    Returns:
+        {apply_link: (jd_text, extraction_confidence)}, (None, 0) for failures.
+    """
+    if not urls:
+        return {}
+
+    async def _run():
+        async with JDFetcher(**fetcher_kwargs) as fetcher:
+            return await fetcher.fetch_all(urls, db=db)
+
+    return asyncio.run(_run())
@@ -5,6 +5,12 @@ from datetime import datetime, timezone, timedelta
 from sqlalchemy.orm import Session
 
 from app.models.jdi_candidate import JDICandidate
+from app.models.jdi_processed_message import JDIProcessedMessage
+from app.models.jdi_page_cache import JDIPageCache
+from app.models.jdi_resolved_url import JDIResolvedURL
+from app.models.jdi_run import JDIRun
+from app.services.jdi.page_cache import JD_CACHE_TTL
+from app.services.jdi.resolved_urls import RESOLVED_URL_TTL
 
 logger = logging.getLogger(__name__)
 
@@ -16,12 +22,21 @@ def prune_expired_candidates(db: Session) -> dict:
     - status=ignored AND updated_at < 14 days ago → DELETE
     - status=promoted AND updated_at < 14 days ago → DELETE
     - status=new AND created_at < 90 days ago → DELETE (safety cap)
+    - processed-message ledger rows older than 14 days → DELETE
+      (Gmail scans never look back more than 7 days, so older IDs can't recur)
+    - JD page cache entries expired for longer than the cache TTL → DELETE
+      (recently expired entries are kept for conditional revalidation)
+    - memoized redirect resolutions older than RESOLVED_URL_TTL → DELETE
+    - finished ingestion runs older than 14 days → DELETE (events cascade)
 
     Returns:
-        Dict with counts of deleted candidates per category.
+        Dict with counts of deleted rows per category.
     """
     now = datetime.now(timezone.utc)
-    results = {"ignored": 0, "promoted": 0, "stale_new": 0}
+    results = {
+        "ignored": 0, "promoted": 0, "stale_new": 0,
+        "processed_messages": 0, "page_cache": 0, "resolved_urls": 0, "runs": 0,
+    }
 
     # Prune ignored candidates (14 days)
     cutoff_14d = now - timedelta(days=14)
@@ -60,10 +75,46 @@ def prune_expired_candidates(db: Session) -> dict:
     )
     results["stale_new"] = stale_count
 
+    # Prune processed-message ledger (14 days)
+    ledger_count = (
+        db.query(JDIProcessedMessage)
+        .filter(JDIProcessedMessage.processed_at < cutoff_14d)
+        .delete(synchronize_session="fetch")
+    )
+    results["processed_messages"] = ledger_count
+
+    # Prune long-expired JD page cache entries (naive UTC timestamps)
+    cache_cutoff = now.replace(tzinfo=None) - JD_CACHE_TTL
+    cache_count = (
+        db.query(JDIPageCache)
+        .filter(JDIPageCache.expires_at < cache_cutoff)
+        .delete(synchronize_session="fetch")
+    )
+    results["page_cache"] = cache_count
+
+    # Prune expired redirect resolutions
+    resolved_count = (
+        db.query(JDIResolvedURL)
+        .filter(JDIResolvedURL.resolved_at < now.replace(tzinfo=None) - RESOLVED_URL_TTL)
+        .delete(synchronize_session="fetch")
+    )
+    results["resolved_urls"] = resolved_count
+
+    # Prune finished ingestion runs (14 days); their events go with them
+    runs_count = (
+        db.query(JDIRun)
+        .filter(
+            JDIRun.status.in_(("succeeded", "failed")),
+            JDIRun.created_at < cutoff_14d,
+        )
+        .delete(synchronize_session="fetch")
+    )
+    results["runs"] = runs_count
+
     db.commit()
 
     total = sum(results.values())
     if total > 0:
-        logger.info(f"Pruned {total} JDI candidates: {results}")
+        logger.info(f"Pruned {total} JDI rows: {results}")
 
     return results
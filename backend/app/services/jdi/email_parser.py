@@ -5,11 +5,13 @@
 import re
 import logging
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Optional, List
 
 from bs4 import BeautifulSoup, Tag
 
-from app.services.jdi.link_extractor import JOB_URL_PATTERNS, EXCLUDE_PATTERNS
+from app.services.jdi.html_backend import TextLengthIndex, parse_html
+from app.services.jdi.link_extractor import HREF_IGNORED, HREF_JOB, classify_href
 
 logger = logging.getLogger(__name__)
 
@@ -138,6 +140,69 @@ class EmailJobCard:
         return bool(self.title or self.snippet)
 
 
+# Anchor classification on top of link_extractor's href kinds: a job URL
+# whose anchor text is a call-to-action ("View more jobs") is not a card.
+ANCHOR_NAVIGATION = "navigation"
+
+
+@dataclass
+class EmailAnchor:
+    """One <a href> of an email and how the pipeline classified it."""
+    tag: Tag
+    href: str
+    kind: str  # link_extractor.HREF_* or ANCHOR_NAVIGATION
+
+
+class ParsedEmail:
+    """
+    A job alert email parsed once, shared by link extraction and card parsing.
+
+    The HTML is parsed into a single tree on first use and every anchor is
+    classified once (one combined exclude regex + one combined job-URL regex
+    per source); `anchors`, `job_links` and `cards` are all derived from it.
+    """
+
+    def __init__(self, html_body: str, source: str = "other", email_subject: str = ""):
+        self.html_body = html_body or ""
+        self.source = source
+        self.email_subject = email_subject
+
+    @cached_property
+    def soup(self) -> BeautifulSoup:
+        return parse_html(self.html_body)
+
+    @cached_property
+    def anchors(self) -> List[EmailAnchor]:
+        """Every <a href> in document order, classified."""
+        if not self.html_body:
+            return []
+        anchors = []
+        for a_tag in self.soup.find_all("a", href=True):
+            href: str = a_tag["href"].strip()
+            kind = classify_href(href, self.source)
+            # Anchor text is only needed for job URLs — navigation/footer CTAs
+            # ("View more jobs", "Manage settings") share job-like URLs
+            if kind == HREF_JOB and _NAVIGATION_ANCHOR_RE.match(a_tag.get_text(strip=True)):
+                kind = ANCHOR_NAVIGATION
+            if kind != HREF_IGNORED:
+                anchors.append(EmailAnchor(tag=a_tag, href=href, kind=kind))
+        return anchors
+
+    @cached_property
+    def job_links(self) -> List[str]:
+        """Unique raw job URLs in document order (same set as extract_job_links)."""
+        links = (a.href for a in self.anchors if a.kind in (HREF_JOB, ANCHOR_NAVIGATION))
+        return list(dict.fromkeys(links))
+
+    @cached_property
+    def cards(self) -> List[EmailJobCard]:
+        if not self.html_body:
+            return []
+        cards = _extract_cards_generic(self, email_subject=self.email_subject)
+        logger.info(f"Parsed {len(cards)} job cards from {self.source} email")
+        return cards
+
+
 def parse_job_cards(
     html_body: str,
     source: str = "other",
@@ -157,61 +222,42 @@ def parse_job_cards(
     Returns:
         List of EmailJobCard objects.
     """
-    if not html_body:
-        return []
-
-    soup = BeautifulSoup(html_body, "html.parser")
-    cards = _extract_cards_generic(soup, source, email_subject=email_subject)
-    logger.info(f"Parsed {len(cards)} job cards from {source} email")
-    return cards
+    return ParsedEmail(html_body, source, email_subject=email_subject).cards
 
 
 def _extract_cards_generic(
-    soup: BeautifulSoup,
-    source: str,
+    parsed: ParsedEmail,
     email_subject: str = "",
 ) -> List[EmailJobCard]:
     """
-    Generic card extractor: find all job-matching <a> tags, then harvest
+    Generic card extractor: take every job-URL anchor of the email, then harvest
     the surrounding context for title / company / location / salary / snippet.
 
     Works for LinkedIn, Indeed, TrueUp, and aggregator emails because the
     job link itself is the anchor, and nearby DOM text has the metadata.
     """
-    source_patterns = JOB_URL_PATTERNS.get(source, [])
     cards: List[EmailJobCard] = []
     seen_links: set = set()
+    text_lengths: Optional[TextLengthIndex] = None  # shared memo, created on first candidate anchor
 
-    for a_tag in soup.find_all("a", href=True):
-        href: str = a_tag["href"].strip()
-        if not href or href.startswith("mailto:"):
-            continue
-        if any(p.search(href) for p in EXCLUDE_PATTERNS):
-            continue
-
-        # Reject navigation/footer anchors early — before any URL check.
-        # This catches "View more jobs", "Manage settings", "See all jobs" etc.
-        link_text = a_tag.get_text(strip=True)
-        if _NAVIGATION_ANCHOR_RE.match(link_text):
+    for anchor in parsed.anchors:
+        # Excluded URLs, navigation/footer CTAs and (for "other" sources) URLs
+        # without job-related keywords never become cards. Link text is not
+        # consulted for "other" sources — it let "View more jobs" buttons through.
+        if anchor.kind != HREF_JOB:
             continue
 
-        # For known sources, only accept matching URL patterns
-        if source_patterns:
-            if not any(p.search(href) for p in source_patterns):
-                continue
-        else:
-            # For "other" sources: require job-related keywords in the URL only.
-            # Accepting based on link text was letting navigation buttons through
-            # (e.g. "View more jobs" → text has "jobs" → garbage card created).
-            if not re.search(r"(job|career|position|apply|opening|vacancy)", href, re.IGNORECASE):
-                continue
-
         # Deduplicate on link
-        if href in seen_links:
+        if anchor.href in seen_links:
             continue
-        seen_links.add(href)
-
-        card = _card_from_anchor(a_tag, href, source, email_subject=email_subject)
+        seen_links.add(anchor.href)
+
+        if text_lengths is None:
+            text_lengths = TextLengthIndex(parsed.soup)
+        card = _card_from_anchor(
+            anchor.tag, anchor.href, parsed.source,
+            email_subject=email_subject, text_lengths=text_lengths,
+        )
         if card and card.has_enough_info():
             cards.append(card)
 
@@ -223,6 +269,7 @@ def _card_from_anchor(
     href: str,
     source: str,
     email_subject: str = "",
+    text_lengths: Optional[TextLengthIndex] = None,
 ) -> Optional[EmailJobCard]:
     """
     Build an EmailJobCard by inspecting an <a> tag and its surrounding context.
@@ -276,7 +323,7 @@ def _card_from_anchor(
     anchor_context = anchor_lines[1:] if len(anchor_lines) > 1 else []
 
     # Crawl up to find the smallest container that has more text than just the title
-    container = _find_container(a_tag, title)
+    container = _find_container(a_tag, title, text_lengths)
 
     if container is not None:
         container_lines = [
@@ -305,7 +352,11 @@ def _card_from_anchor(
     )
 
 
-def _find_container(a_tag: Tag, title: Optional[str]) -> Optional[Tag]:
+def _find_container(
+    a_tag: Tag,
+    title: Optional[str],
+    text_lengths: Optional[TextLengthIndex] = None,
+) -> Optional[Tag]:
     """
     Walk up the DOM from the <a> tag to find the smallest block element
     that contains more text than just the title alone.
@@ -315,6 +366,9 @@ def _find_container(a_tag: Tag, title: Optional[str]) -> Optional[Tag]:
     inner job table) are handled correctly.  We stop only at <body>/<html>.
     A max-length cap (_MAX_CONTAINER_LEN) prevents us from grabbing the
     whole email body.
+
+    text_lengths: per-node text lengths memoized across all anchors of the email;
+    without it each ancestor's text is re-extracted.
     """
     title_len = len(title or "")
     for parent in a_tag.parents:
@@ -322,9 +376,12 @@ def _find_container(a_tag: Tag, title: Optional[str]) -> Optional[Tag]:
         if name in ("body", "html"):
             break
         if name in _CONTAINER_TAGS:
-            text = parent.get_text(strip=True)
+            if text_lengths is not None:
+                text_len = text_lengths.text_len(parent)
+            else:
+                text_len = len(parent.get_text(strip=True))
             # Must have meaningfully more text, but not be the whole email
-            if title_len + 10 < len(text) < _MAX_CONTAINER_LEN:
+            if title_len + 10 < text_len < _MAX_CONTAINER_LEN:
                 return parent
     return None
 
@@ -5,10 +5,15 @@ import base64
 from datetime import datetime, timezone
 from typing import Optional
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 from google.oauth2.credentials import Credentials
 
 logger = logging.getLogger(__name__)
 
+# Gmail accepts up to 100 calls per batch request but starts rate-limiting
+# (429) large batches; 50 keeps a 200-message scan to 4 round trips.
+_GMAIL_BATCH_SIZE = 50
+
 # Known job alert sender patterns per source
 SOURCE_EMAIL_PATTERNS = {
     "linkedin": [
@@ -136,6 +141,9 @@ def fetch_job_alert_emails(
     window_hours: int = 168,
     max_results: int = 200,
     custom_patterns: Optional[list[str]] = None,
+    start_history_id: Optional[str] = None,
+    skip_message_ids: Optional[set[str]] = None,
+    failed_message_ids: Optional[set[str]] = None,
 ) -> list[dict]:
     """
     Fetch job alert emails from Gmail.
@@ -146,6 +154,14 @@ def fetch_job_alert_emails(
         window_hours: How far back to search.
         max_results: Max emails to fetch.
         custom_patterns: Additional email patterns from user profile.
+        start_history_id: Mailbox historyId from the previous sync. When set,
+            only messages added since then are downloaded; falls back to the
+            plain windowed query if Gmail no longer has that history.
+        skip_message_ids: Message IDs already processed (the JDI ledger); these
+            are neither downloaded nor returned.
+        failed_message_ids: If given, filled with the IDs of matching messages
+            that could not be downloaded (429, 5xx, transport errors) — the
+            caller must not advance its history checkpoint past them.
 
     Returns:
         List of dicts with keys:
@@ -179,45 +195,152 @@ def fetch_job_alert_emails(
         return []
 
     logger.info(f"Found {len(messages)} matching emails")
+
+    # Incremental sync: keep only messages added since the last checkpoint.
+    # history.list can't filter by sender, so intersect with the query results.
+    if start_history_id:
+        added_ids = _list_added_message_ids(service, start_history_id)
+        if added_ids is not None:
+            messages = [m for m in messages if m["id"] in added_ids]
+            logger.info(
+                f"History sync since {start_history_id}: {len(messages)} new matching emails"
+            )
+            if not messages:
+                return []
+
+    # Skip messages already processed by a previous run — no get, no parse
+    if skip_message_ids:
+        before = len(messages)
+        messages = [m for m in messages if m["id"] not in skip_message_ids]
+        if before != len(messages):
+            logger.info(f"Skipping {before - len(messages)} already-processed emails")
+        if not messages:
+            return []
     logger.debug("sources(normalized)=%s", sources)
     #logger.debug("from_addresses=%s", from_addresses)  # remove unless actually defined here
     logger.info(f"JDI gmail query = {query}")
 
-    # Fetch each message's full content
+    # Fetch every message's full content via the Gmail batch endpoint
+    fetched, failed = _batch_get_messages(service, [m["id"] for m in messages])
+    if failed_message_ids is not None:
+        failed_message_ids.update(failed)
+
     email_list = []
     for msg_ref in messages:
-        msg_id = msg_ref["id"]
-        try:
-            msg = service.users().messages().get(
+        msg = fetched.get(msg_ref["id"])
+        if msg is not None:
+            email_list.append(_message_to_email(msg_ref["id"], msg))
+
+    return email_list
+
+
+def get_mailbox_history_id(credentials: Credentials) -> Optional[str]:
+    """
+    Return the mailbox's current historyId — the checkpoint for the next sync.
+
+    Returns None (caller keeps its old checkpoint) if the profile can't be read.
+    """
+    try:
+        service = build("gmail", "v1", credentials=credentials)
+        profile = service.users().getProfile(userId="me").execute()
+    except Exception as e:
+        logger.warning(f"Gmail getProfile failed, history checkpoint not updated: {e}")
+        return None
+    history_id = profile.get("historyId")
+    return str(history_id) if history_id else None
+
+
+def _list_added_message_ids(service, start_history_id: str) -> Optional[set[str]]:
+    """
+    IDs of messages added to the mailbox since start_history_id (users.history.list).
+
+    Returns None when the history is unavailable — Gmail keeps roughly a week
+    and answers 404 for older IDs — so the caller can fall back to the window.
+    """
+    added_ids: set[str] = set()
+    page_token = None
+    try:
+        while True:
+            response = service.users().history().list(
                 userId="me",
-                id=msg_id,
-                format="full",
+                startHistoryId=start_history_id,
+                historyTypes=["messageAdded"],
+                pageToken=page_token,
             ).execute()
+            for record in response.get("history", []):
+                for added in record.get("messagesAdded", []):
+                    added_ids.add(added["message"]["id"])
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return added_ids
+    except HttpError as e:
+        if e.resp.status == 404:
+            logger.info(f"Gmail historyId {start_history_id} expired — using windowed query")
+        else:
+            logger.warning(f"Gmail history.list error, using windowed query: {e}")
+    except Exception as e:
+        logger.warning(f"Gmail history.list error, using windowed query: {e}")
+    return None
+
+
+def _batch_get_messages(service, message_ids: list[str]) -> tuple[dict[str, dict], set[str]]:
+    """
+    Fetch messages(format="full") in batches of _GMAIL_BATCH_SIZE.
+
+    One HTTP round trip per batch instead of one per message. Each message
+    still succeeds or fails on its own: a failed get is logged and skipped.
+
+    Returns ({message_id: message resource} for the messages that were
+    fetched, IDs of the messages that failed).
+    """
+    fetched: dict[str, dict] = {}
+    failed: set[str] = set()
+
+    def _on_response(request_id, response, exception):
+        if exception is not None:
+            logger.warning(f"Failed to fetch message {request_id}: {exception}")
+            failed.add(request_id)
+            return
+        fetched[request_id] = response
+
+    for start in range(0, len(message_ids), _GMAIL_BATCH_SIZE):
+        batch_ids = message_ids[start:start + _GMAIL_BATCH_SIZE]
+        batch = service.new_batch_http_request(callback=_on_response)
+        for msg_id in batch_ids:
+            batch.add(
+                service.users().messages().get(userId="me", id=msg_id, format="full"),
+                request_id=msg_id,
+            )
+        try:
+            batch.execute()
         except Exception as e:
-            logger.warning(f"Failed to fetch message {msg_id}: {e}")
-            continue
+            # Whole-batch transport failure — skip these messages, keep going
+            logger.warning(f"Gmail batch fetch failed ({start}..{start + _GMAIL_BATCH_SIZE}): {e}")
+            failed.update(i for i in batch_ids if i not in fetched)
 
-        payload = msg.get("payload", {})
-        headers = payload.get("headers", [])
+    return fetched, failed
 
-        subject = _get_header(headers, "Subject")
-        from_addr = _get_header(headers, "From")
-        date_str = _get_header(headers, "Date")
-        body_html = _get_message_body_html(payload)
 
-        # Parse received_at — Gmail internal date is in ms since epoch
-        internal_date = msg.get("internalDate")
-        if internal_date:
-            received_at = datetime.fromtimestamp(int(internal_date) / 1000, tz=timezone.utc)
-        else:
-            received_at = datetime.now(timezone.utc)
+def _message_to_email(msg_id: str, msg: dict) -> dict:
+    """Convert a Gmail message resource into the dict shape returned by fetch_job_alert_emails."""
+    payload = msg.get("payload", {})
+    headers = payload.get("headers", [])
 
-        email_list.append({
-            "message_id": msg_id,
-            "subject": subject,
-            "from_addr": from_addr,
-            "body_html": body_html,
-            "received_at": received_at,
-        })
+    subject = _get_header(headers, "Subject")
+    from_addr = _get_header(headers, "From")
+    body_html = _get_message_body_html(payload)
 
-    return email_list
+    # Parse received_at — Gmail internal date is in ms since epoch
+    internal_date = msg.get("internalDate")
+    if internal_date:
+        received_at = datetime.fromtimestamp(int(internal_date) / 1000, tz=timezone.utc)
+    else:
+        received_at = datetime.now(timezone.utc)
+
+    return {
+        "message_id": msg_id,
+        "subject": subject,
+        "from_addr": from_addr,
+        "body_html": body_html,
+        "received_at": received_at,
+    }
@@ -0,0 +1,89 @@
+# File: backend/app/services/jdi/host_policy.py
+# Learned per-host fetch policy for "other"-source JD pages.
+#
+# _EMAIL_ONLY_SOURCES hard-codes LinkedIn / Indeed / TrueUp as "don't bother
+# fetching". Aggregators outside that list can be just as hostile; rather than
+# growing the static list, every fetch outcome is recorded per host, and a
+# host whose pages end in 401/403 or a login wall HOST_BLOCK_THRESHOLD
+# times in a row is treated as email-only for EMAIL_ONLY_PERIOD. After that
+# it is probed again; one more block re-marks it, one success clears it.
+import logging
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.jdi_host_policy import JDIHostPolicy
+
+logger = logging.getLogger(__name__)
+
+HOST_BLOCK_THRESHOLD = 3
+EMAIL_ONLY_PERIOD = timedelta(days=14)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def url_host(url: str) -> str:
+    return urlparse(url).netloc.lower()
+
+
+def load_email_only_hosts(db: Session, hosts) -> set[str]:
+    """The subset of hosts currently learned as email-only."""
+    hosts = {h for h in hosts if h}
+    if not hosts:
+        return set()
+    rows = (
+        db.query(JDIHostPolicy.host)
+        .filter(JDIHostPolicy.host.in_(hosts), JDIHostPolicy.email_only_until > _utcnow())
+        .all()
+    )
+    return {host for (host,) in rows}
+
+
+def record_host_outcomes(db: Session, outcomes: dict[str, list[bool]]) -> set[str]:
+    """
+    Fold one fetch stage's outcomes into the host policies (caller commits).
+
+    Args:
+        outcomes: {host: [blocked, ...]} in fetch order — True for a 401/403
+            or login-wall response, False for a page that yielded a JD.
+
+    Returns:
+        Hosts that became email-only with this update.
+    """
+    outcomes = {h: o for h, o in outcomes.items() if h and o}
+    if not outcomes:
+        return set()
+
+    # Concurrent runs may meet the same new host — create rows idempotently
+    db.execute(
+        pg_insert(JDIHostPolicy)
+        .values([{"host": h} for h in outcomes])
+        .on_conflict_do_nothing(index_elements=["host"])
+    )
+    policies = db.query(JDIHostPolicy).filter(JDIHostPolicy.host.in_(outcomes)).all()
+
+    now = _utcnow()
+    newly_email_only = set()
+    for policy in policies:
+        for blocked in outcomes[policy.host]:
+            if blocked:
+                policy.consecutive_blocked += 1
+                policy.blocked_total += 1
+            else:
+                policy.consecutive_blocked = 0
+                policy.success_total += 1
+                policy.email_only_until = None
+        active = policy.email_only_until is not None and policy.email_only_until > now
+        if policy.consecutive_blocked >= HOST_BLOCK_THRESHOLD and not active:
+            policy.email_only_until = now + EMAIL_ONLY_PERIOD
+            newly_email_only.add(policy.host)
+            logger.info(
+                f"Host {policy.host} blocked {policy.consecutive_blocked} times in a row — "
+                f"email-only until {policy.email_only_until:%Y-%m-%d}"
+            )
+    db.flush()
+    return newly_email_only
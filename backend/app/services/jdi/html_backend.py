@@ -0,0 +1,72 @@
+# File: backend/app/services/jdi/html_backend.py
+# Pluggable HTML parser backend for JDI email parsing.
+#
+# Job alert emails are parsed into a BeautifulSoup tree by email_parser and
+# link_extractor. The tree builder is chosen once at import time: lxml (C
+# parser, several times faster on large digest emails) when installed, else
+# the pure-Python html.parser. Override with JDI_HTML_PARSER=html.parser.
+import logging
+import os
+from typing import Optional
+
+from bs4 import BeautifulSoup, Tag
+
+logger = logging.getLogger(__name__)
+
+try:
+    import lxml  # noqa: F401 — only probing availability
+    _DEFAULT_PARSER = "lxml"
+except ImportError:
+    _DEFAULT_PARSER = "html.parser"
+
+HTML_PARSER = os.getenv("JDI_HTML_PARSER", _DEFAULT_PARSER)
+logger.debug(f"JDI HTML parser backend: {HTML_PARSER}")
+
+
+def parse_html(html: str, parser: Optional[str] = None) -> BeautifulSoup:
+    """Parse html with the configured backend (or an explicit bs4 tree builder)."""
+    return BeautifulSoup(html, parser or HTML_PARSER)
+
+
+class TextLengthIndex:
+    """
+    Memoized len(tag.get_text(strip=True)) for the tags of one parsed document.
+
+    Each tag's length is computed once from its children's (memoized) lengths,
+    so walking up from many anchors through shared ancestors costs O(n) in
+    total instead of one full get_text() per ancestor per anchor — quadratic
+    for digest emails whose cards share one large container. Only subtrees
+    that are actually asked about are visited.
+    """
+
+    def __init__(self, soup: BeautifulSoup):
+        # get_text() on an ordinary tag keeps exactly these string types
+        self._types = soup.interesting_string_types
+        self._lengths: dict[int, int] = {}
+
+    def text_len(self, tag) -> int:
+        lengths = self._lengths
+        if id(tag) in lengths:
+            return lengths[id(tag)]
+
+        # Iterative post-order walk — email HTML can nest deeper than the recursion limit
+        stack = [(tag, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if id(node) in lengths:
+                continue
+            if not children_done:
+                stack.append((node, True))
+                stack.extend(
+                    (child, False) for child in node.contents
+                    if isinstance(child, Tag) and id(child) not in lengths
+                )
+                continue
+            total = 0
+            for child in node.contents:
+                if isinstance(child, Tag):
+                    total += lengths[id(child)]
+                elif type(child) in self._types:
+                    total += len(child.strip())
+            lengths[id(node)] = total
+        return lengths[id(tag)]
@@ -11,21 +11,34 @@
 #    email content automatically if the fetch fails or returns low confidence.
 import logging
 import re
+import uuid
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Iterator, Optional, List
 
 from app.models.user_integration import UserIntegration
 from app.models.user_profile import UserProfile
 from app.models.jdi_candidate import JDICandidate
+from app.models.jdi_processed_message import JDIProcessedMessage
 from app.services.jdi.gmail_oauth import get_gmail_credentials
-from app.services.jdi.gmail_scanner import fetch_job_alert_emails, SOURCE_EMAIL_PATTERNS
+from app.services.jdi.gmail_scanner import (
+    fetch_job_alert_emails,
+    get_mailbox_history_id,
+    SOURCE_EMAIL_PATTERNS,
+)
 from app.services.jdi.email_parser import parse_job_cards, EmailJobCard
-from app.services.jdi.link_extractor import normalize_url, resolve_canonical_url
-from app.services.jdi.jd_fetcher import fetch_jd_html, extract_jd_text, compute_jd_hash
-from app.services.jdi.scoring import select_best_resume
+from app.services.jdi.link_extractor import normalize_url
+from app.services.jdi.jd_fetcher import compute_jd_hash
+from app.services.jdi.async_fetcher import fetch_jd_texts
+from app.services.jdi.scoring import ResumeScoringContext, load_scoring_context, select_best_resumes
 from app.services.jdi.match_reasons import generate_match_reasons
-from app.models.resume import Resume
+
+# Profile settings that decide which parsed cards become candidates. When one
+# changes, emails in the processed-message ledger must be looked at again.
+LEDGER_FILTER_FIELDS = ("target_titles", "jdi_min_score")
 
 # Sources that block scraping — use email content only for these
 _EMAIL_ONLY_SOURCES = {"linkedin", "indeed", "trueup"}
@@ -39,6 +52,9 @@ _EMAIL_ONLY_SOURCES = {"linkedin", "indeed", "trueup"}
 #   Threshold=8 captures all relevant jobs while filtering true garbage.
 _EMAIL_ONLY_MIN_SCORE_CAP = 8
 
+# Emails per pipeline chunk after the first (see iter_jdi_ingestion)
+_EMAIL_CHUNK_SIZE = 25
+
 logger = logging.getLogger(__name__)
 
 # Common VP aliases — when user sets "VP" as a target keyword, also match these.
@@ -104,7 +120,21 @@ def _detect_source(from_addr: str) -> str:
     return "other"
 
 
-def run_jdi_ingestion(
+def run_jdi_ingestion(**kwargs) -> dict:
+    """
+    Run the ingestion pipeline to completion.
+
+    Takes the keyword arguments of iter_jdi_ingestion.
+
+    Returns:
+        Dict with keys: new_candidates, total_emails_scanned, message
+    """
+    for event in iter_jdi_ingestion(**kwargs):
+        if event["type"] == "done":
+            return event["result"]
+
+
+def iter_jdi_ingestion(
     *,
     user_id: int,
     db: Session,
@@ -112,20 +142,24 @@ def run_jdi_ingestion(
     sources_enabled: Optional[List[str]] = None,
     custom_source_patterns: Optional[List[str]] = None,
     force_full_window: bool = False,
-) -> dict:
+    retry_errored: bool = False,
+) -> Iterator[dict]:
     """
-    Main JDI ingestion pipeline.
+    Main JDI ingestion pipeline, as a stream of progress events.
 
     Steps:
     1.  Check for active Gmail integration
     2.  Load user profile (sources, min score)
     3.  Get Gmail credentials
     4.  Fetch job alert emails from Gmail
-    5.  For each email: parse job cards from email HTML  ← key change
-    6.  Deduplicate cards against existing candidates
-    7.  Score each card's text against user's base resumes
+    5.  Parse job cards from a chunk of emails into one batch
+    6.  Filter titles and deduplicate the batch against existing candidates
+    7.  Score all cards against user's base resumes in one pass
     8.  Generate match reasons
-    9.  Persist as jdi_candidate records
+    9.  Persist as jdi_candidate records and commit
+    Steps 5-9 repeat per chunk: the first chunk is a single email, so the
+    first candidates are committed (and streamed) without waiting for the
+    whole mailbox; later chunks are _EMAIL_CHUNK_SIZE emails.
 
     Args:
         user_id: The user to run ingestion for.
@@ -136,9 +170,15 @@ def run_jdi_ingestion(
         force_full_window: If True, skip the smart incremental window optimisation
             and use window_hours as-is. Set when the caller explicitly requested a
             specific window (e.g. a forced full re-scan from the API).
-
-    Returns:
-        Dict with keys: new_candidates, total_emails_scanned, message
+        retry_errored: Also run for an integration in "error" status (the
+            scheduler's backoff retries). Success makes it active again.
+
+    Yields:
+        Event dicts with a "type" — stage, emails_fetched, cards_parsed,
+        cards_scored, candidate_created — carrying the run's counters (stage,
+        emails_scanned, cards_found, cards_processed, new_candidates) as they
+        change. The last event is {"type": "done", "result": {new_candidates,
+        total_emails_scanned, message}}.
     """
     sources_enabled = sources_enabled or []
     custom_source_patterns = custom_source_patterns or []
@@ -149,17 +189,26 @@ def run_jdi_ingestion(
     )
 
     # Step 1: Check for active Gmail integration
+    statuses = ("active", "error") if retry_errored else ("active",)
     integration = (
         db.query(UserIntegration)
-        .filter_by(user_id=user_id, provider="gmail", status="active")
+        .filter_by(user_id=user_id, provider="gmail")
+        .filter(UserIntegration.status.in_(statuses))
         .first()
     )
+    if integration and integration.status == "error":
+        # Probe: credentials are only loaded for active integrations; a
+        # failure below puts it straight back into "error"
+        logger.info(f"Retrying errored Gmail integration for user_id={user_id}")
+        integration.status = "active"
+        db.flush()
     if not integration:
-        return {
+        yield _done({
             "new_candidates": 0,
             "total_emails_scanned": 0,
             "message": "No active Gmail integration. Please connect Gmail first.",
-        }
+        })
+        return
 
     # Step 2: Load user profile for source filters and preferences
     profile = db.query(UserProfile).filter_by(user_id=user_id).first()
@@ -189,6 +238,9 @@ def run_jdi_ingestion(
     #   - First scan (no last_sync_at): use the full configured window_hours.
     #   - Subsequent scans: scan from (last_sync_at - 2h overlap buffer) to now.
     #     The 2h buffer guards against emails delivered during the previous scan run.
+    #   - When a Gmail historyId checkpoint is stored, only messages added since
+    #     it are downloaded (see Step 4); the window still bounds the query and
+    #     is the fallback once Gmail expires that history.
     #   - The deduplication layers (URL, title+company, hash) are still the safety
     #     net — the window is an efficiency optimisation, not a correctness gate.
     #   - Floor at 24h so the Gmail newer_than:Xd query always has a valid value.
@@ -215,20 +267,35 @@ def run_jdi_ingestion(
                 window_hours = smart_hours
             # else: large gap since last sync — keep the full window_hours
 
+    yield _event("stage", stage="fetching_emails")
+
     # Step 3: Get Gmail credentials (raises on auth failure → caught below)
     try:
         credentials = get_gmail_credentials(user_id, db)
     except Exception as e:
         logger.error(f"Failed to get Gmail credentials for user_id={user_id}: {e}")
-        integration.status = "error"
+        _mark_sync_failed(integration)
         db.commit()
-        return {
+        yield _done({
             "new_candidates": 0,
             "total_emails_scanned": 0,
             "message": f"Gmail authentication error: {str(e)}",
-        }
+        })
+        return
 
     # Step 4: Fetch job alert emails from Gmail
+    # Take the mailbox checkpoint BEFORE listing, so mail arriving mid-scan is
+    # picked up by the next run (dedup absorbs any overlap). A forced full
+    # re-scan ignores the stored checkpoint and uses the window as-is.
+    next_history_id = get_mailbox_history_id(credentials)
+    start_history_id = None if force_full_window else integration.gmail_history_id
+    # Messages already run through ingestion are skipped before download
+    # (a forced re-scan re-processes everything in the window).
+    processed_ids = set() if force_full_window else _load_processed_message_ids(user_id, db)
+    # Matching messages whose download failed: while any remain, the checkpoint
+    # stays put so the next run's history delta still includes them
+    failed_ids: set[str] = set()
+
     # Re-raise Gmail API errors so they surface as auth errors rather than "0 emails".
     try:
         emails = fetch_job_alert_emails(
@@ -236,37 +303,272 @@ def run_jdi_ingestion(
             sources=sources_enabled,
             window_hours=window_hours,
             custom_patterns=custom_source_patterns,
+            start_history_id=start_history_id,
+            skip_message_ids=processed_ids,
+            failed_message_ids=failed_ids,
         )
     except Exception as e:
         logger.error(f"Gmail API error for user_id={user_id}: {e}")
-        integration.status = "error"
+        _mark_sync_failed(integration)
         db.commit()
-        return {
+        yield _done({
             "new_candidates": 0,
             "total_emails_scanned": 0,
             "message": f"Gmail API error: {str(e)}",
-        }
+        })
+        return
+
+    if failed_ids:
+        logger.warning(
+            f"{len(failed_ids)} Gmail messages failed to download for user_id={user_id}; "
+            "keeping the history checkpoint so the next run retries them"
+        )
+        next_history_id = None
 
     total_emails = len(emails)
     if not emails:
-        integration.last_sync_at = datetime.now(timezone.utc)
+        if next_history_id:
+            integration.gmail_history_id = next_history_id
+        _mark_synced(integration)
         db.commit()
-        return {
+        yield _done({
             "new_candidates": 0,
             "total_emails_scanned": 0,
             "message": "No job alert emails found in the specified time window.",
-        }
+        })
+        return
 
     logger.info(f"Processing {total_emails} emails for user_id={user_id}")
+    yield _event("emails_fetched", stage="parsing", emails_scanned=total_emails)
+
+    # Steps 5-9: Batch pipeline per chunk of emails; dedup keys and resumes
+    # are loaded once and shared by every chunk
+    dedup = _DedupIndex.load(user_id, db)
+    context = load_scoring_context(user_id, db, profile)
+    cards_found = cards_processed = new_candidates = 0
+    for chunk in _email_chunks(emails):
+        pending = _collect_cards(chunk)
+        cards_found += len(pending)
+        yield _event("cards_parsed", stage="scoring", cards=len(pending), cards_found=cards_found)
+
+        created = _ingest_cards(
+            user_id=user_id,
+            pending=pending,
+            profile=profile,
+            min_score=min_score,
+            target_role_keywords=target_role_keywords,
+            db=db,
+            dedup=dedup,
+            context=context,
+        )
+        _record_processed_messages(user_id, chunk, pending, db)
+        db.commit()
+
+        cards_processed += len(pending)
+        yield _event("cards_scored", cards=len(pending), cards_processed=cards_processed)
+        for candidate in created:
+            new_candidates += 1
+            yield _event(
+                "candidate_created",
+                candidate=_candidate_summary(candidate),
+                new_candidates=new_candidates,
+            )
+
+    # Advance the mailbox checkpoint only once every email is fetched and
+    # processed — an interrupted or partly failed run re-lists the rest (the
+    # ledger skips finished messages)
+    if next_history_id:
+        integration.gmail_history_id = next_history_id
+    # Update last sync timestamp
+    _mark_synced(integration)
+    db.commit()
+
+    logger.info(
+        "JDI ingestion complete: %s new candidates from %s emails",
+        new_candidates, total_emails,
+    )
+
+    yield _done({
+        "new_candidates": new_candidates,
+        "total_emails_scanned": total_emails,
+        "message": "Ingestion complete",
+    })
 
-    # Steps 5-9: Process each email
-    new_candidates = 0
 
+def _mark_synced(integration: UserIntegration) -> None:
+    integration.last_sync_at = datetime.now(timezone.utc)
+    integration.sync_failures = 0
+
+
+def _mark_sync_failed(integration: UserIntegration) -> None:
+    """Flag the integration; the scheduler backs off on sync_failures."""
+    integration.status = "error"
+    integration.sync_failures = (integration.sync_failures or 0) + 1
+
+
+def _event(type_: str, **fields) -> dict:
+    return {"type": type_, **fields}
+
+
+def _done(result: dict) -> dict:
+    return _event("done", stage="done", result=result)
+
+
+def _email_chunks(emails: list[dict]) -> Iterator[list[dict]]:
+    """The first email alone, then _EMAIL_CHUNK_SIZE emails at a time."""
+    yield emails[:1]
+    for start in range(1, len(emails), _EMAIL_CHUNK_SIZE):
+        yield emails[start:start + _EMAIL_CHUNK_SIZE]
+
+
+def _candidate_summary(candidate: JDICandidate) -> dict:
+    """The fields a feed row needs, for rendering a candidate as it is created."""
+    return {
+        "id": candidate.id,
+        "source": candidate.source,
+        "title": candidate.title,
+        "company": candidate.company,
+        "location": candidate.location,
+        "salary_text": candidate.salary_text,
+        "match_score": candidate.match_score,
+        "job_url": candidate.job_url_raw,
+    }
+
+
+@dataclass
+class _PendingCard:
+    """An EmailJobCard moving through the batch pipeline stages."""
+    card: EmailJobCard
+    message_id: str
+    canonical_url: str = ""
+    scoring_text: str = ""
+    extraction_confidence: int = 80
+    jd_hash: str = ""
+    selected_resume_id: Optional[int] = None
+    match_score: int = 0
+
+
+class _DedupIndex:
+    """
+    In-memory dedup keys for one ingestion run.
+
+    Preloads the user's existing (job_url_canonical, title/company, jd_hash)
+    keys in one query and is extended as new candidates are created, so the
+    per-card dedup checks never hit the database.
+    """
+
+    def __init__(self):
+        self.urls: set[str] = set()
+        self.title_companies: set[tuple[str, str]] = set()
+        self.hashes: set[str] = set()
+
+    @classmethod
+    def load(cls, user_id: int, db: Session) -> "_DedupIndex":
+        index = cls()
+        rows = (
+            db.query(
+                JDICandidate.job_url_canonical,
+                JDICandidate.title,
+                JDICandidate.company,
+                JDICandidate.jd_hash,
+            )
+            .filter(JDICandidate.user_id == user_id)
+            .all()
+        )
+        for url, title, company, jd_hash in rows:
+            if url:
+                index.urls.add(url)
+            if title and company:
+                index.title_companies.add((title, company))
+            if jd_hash:
+                index.hashes.add(jd_hash)
+        logger.debug(
+            "Dedup index loaded: %s urls, %s title+company, %s hashes",
+            len(index.urls), len(index.title_companies), len(index.hashes),
+        )
+        return index
+
+    def duplicate_reason(self, pending: _PendingCard) -> Optional[str]:
+        card = pending.card
+        if pending.canonical_url in self.urls:
+            return f"Duplicate candidate skipped: {pending.canonical_url[:60]}"
+        # Title + company dedup — catches the same job appearing in multiple
+        # LinkedIn alert emails (different subject/tracking URLs, same posting).
+        if card.title and card.company and (card.title, card.company) in self.title_companies:
+            return f"Duplicate title+company skipped: {card.title} @ {card.company}"
+        if pending.jd_hash and pending.jd_hash in self.hashes:
+            return f"Duplicate content hash skipped: {pending.jd_hash[:16]}"
+        return None
+
+    def add(self, pending: _PendingCard) -> None:
+        self.urls.add(pending.canonical_url)
+        if pending.card.title and pending.card.company:
+            self.title_companies.add((pending.card.title, pending.card.company))
+        self.hashes.add(pending.jd_hash)
+
+
+def _load_processed_message_ids(user_id: int, db: Session) -> set[str]:
+    """Gmail message IDs in the user's processed-message ledger."""
+    rows = (
+        db.query(JDIProcessedMessage.message_id)
+        .filter(JDIProcessedMessage.user_id == user_id)
+        .all()
+    )
+    return {message_id for (message_id,) in rows}
+
+
+def reset_processed_messages(user_id: int, db: Session) -> int:
+    """
+    Forget which emails the user's runs have processed (caller commits), so
+    the next run re-checks the mail in its scan window under new filter
+    settings. The Gmail history checkpoint goes too — messages before it
+    would otherwise never be listed again.
+    """
+    count = (
+        db.query(JDIProcessedMessage)
+        .filter(JDIProcessedMessage.user_id == user_id)
+        .delete(synchronize_session=False)
+    )
+    db.query(UserIntegration).filter_by(user_id=user_id, provider="gmail").update(
+        {"gmail_history_id": None}, synchronize_session=False
+    )
+    logger.info(f"Cleared {count} processed-message entries for user_id={user_id}")
+    return count
+
+
+def _record_processed_messages(
+    user_id: int,
+    emails: list[dict],
+    pending: list[_PendingCard],
+    db: Session,
+) -> None:
+    """Add this run's emails (and their parsed card counts) to the ledger."""
+    card_counts = Counter(p.message_id for p in pending)
+    now = datetime.now(timezone.utc)
+    stmt = pg_insert(JDIProcessedMessage).values([
+        {
+            "id": str(uuid.uuid4()),
+            "user_id": user_id,
+            "message_id": email_data["message_id"],
+            "card_count": card_counts.get(email_data["message_id"], 0),
+            "processed_at": now,
+        }
+        for email_data in emails
+    ])
+    # A forced re-scan re-processes known messages — refresh their rows
+    db.execute(stmt.on_conflict_do_update(
+        constraint="uq_jdi_processed_user_message",
+        set_={"card_count": stmt.excluded.card_count, "processed_at": stmt.excluded.processed_at},
+    ))
+
+
+def _collect_cards(emails: list[dict]) -> list[_PendingCard]:
+    """Step 5: Parse job cards directly from every email's HTML (no URL fetching)."""
+    pending = []
     for email_data in emails:
         source = _detect_source(email_data["from_addr"])
         message_id = email_data["message_id"]
 
-        # Step 5: Parse job cards directly from email HTML (no URL fetching)
         # Include the email subject as scoring context — it contains the alert
         # keyword (e.g. "Head of QA in Vancouver") which boosts TF-IDF relevance.
         cards = parse_job_cards(
@@ -277,96 +579,113 @@ def run_jdi_ingestion(
         if not cards:
             logger.debug(f"No job cards parsed from {source} email {message_id[:12]}")
             continue
+        pending.extend(_PendingCard(card=card, message_id=message_id) for card in cards)
+    return pending
 
-        for card in cards:
-            try:
-                created = _process_card(
-                    user_id=user_id,
-                    card=card,
-                    message_id=message_id,
-                    min_score=min_score,
-                    target_role_keywords=target_role_keywords,
-                    db=db,
-                )
-                if created:
-                    new_candidates += 1
-            except Exception as e:
-                logger.warning(f"Error processing card '{card.title}': {e}")
-                continue
-
-    # Update last sync timestamp
-    integration.last_sync_at = datetime.now(timezone.utc)
-    db.commit()
 
-    logger.info(
-        "JDI ingestion complete: %s new candidates from %s emails",
-        new_candidates, total_emails,
-    )
-
-    return {
-        "new_candidates": new_candidates,
-        "total_emails_scanned": total_emails,
-        "message": "Ingestion complete",
-    }
-
-
-def _process_card(
+def _ingest_cards(
     user_id: int,
-    card: EmailJobCard,
-    message_id: str,
+    pending: list[_PendingCard],
+    profile: Optional[UserProfile],
     min_score: int,
     db: Session,
     target_role_keywords: Optional[list] = None,
-) -> bool:
+    dedup: Optional[_DedupIndex] = None,
+    context: Optional[ResumeScoringContext] = None,
+) -> list[JDICandidate]:
     """
-    Process a single EmailJobCard through scoring and persistence.
+    Run every collected card through filtering, dedup, scoring and persistence.
 
-    For email-only sources (LinkedIn, Indeed, TrueUp): scores against email
-    content (title + company + location + salary + snippet).
-
-    For "other" sources (Talent.com, Trabajo.org, etc.): additionally tries to
-    fetch the full job description from the URL. Uses the richer fetched text
-    if successful; falls back to email content automatically.
+    Each stage handles the whole batch: titles are filtered and existing
+    candidates looked up in bulk, all surviving cards are scored against the
+    user's resumes in one matrix operation (profile and resumes loaded once),
+    then candidates are persisted in card order. dedup and context are
+    loaded here unless the caller shares them across batches.
 
-    Returns True if a new candidate was created.
+    Returns the new candidates created.
     """
     # Step 5b: Target-role title filter — reject jobs whose title doesn't
     # contain any of the user's target role keywords (e.g. Manager/Director/VP).
     # This runs before URL fetching and scoring so irrelevant jobs are fast-rejected.
-    if not _title_matches_target_roles(card.title, target_role_keywords or []):
-        logger.debug(
-            "Title filter rejected (no target-role match): '%s'",
-            card.title or "(no title)",
-        )
-        return False
+    survivors = []
+    for p in pending:
+        if _title_matches_target_roles(p.card.title, target_role_keywords or []):
+            # Canonicalize the apply link for deduplication
+            p.canonical_url = normalize_url(p.card.apply_link)
+            survivors.append(p)
+        else:
+            logger.debug(
+                "Title filter rejected (no target-role match): '%s'",
+                p.card.title or "(no title)",
+            )
 
-    # Canonicalize the apply link for deduplication
-    canonical_url = normalize_url(card.apply_link)
+    # Step 6: Deduplicate by canonical URL, title+company and content hash
+    if dedup is None:
+        dedup = _DedupIndex.load(user_id, db)
 
-    # Step 6: Deduplicate by canonical URL
-    existing = (
-        db.query(JDICandidate)
-        .filter_by(user_id=user_id, job_url_canonical=canonical_url)
-        .first()
-    )
-    if existing:
-        logger.debug(f"Duplicate candidate skipped: {canonical_url[:60]}")
-        return False
+    fresh = []
+    for p in survivors:
+        reason = dedup.duplicate_reason(p)
+        if reason:
+            logger.debug(reason)
+            continue
+        fresh.append(p)
 
-    # Step 6b: Title + company dedup — catches the same job appearing in multiple
-    # LinkedIn alert emails (different subject/tracking URLs, same posting).
-    # URL dedup catches exact-URL dupes; this catches variant URLs for the same job.
-    if card.title and card.company:
-        title_co_dup = (
-            db.query(JDICandidate)
-            .filter_by(user_id=user_id, title=card.title, company=card.company)
-            .first()
-        )
-        if title_co_dup:
-            logger.debug(f"Duplicate title+company skipped: {card.title} @ {card.company}")
-            return False
+    # Fetch the full JD of every "other"-source card concurrently (once per link)
+    fetched = _fetch_jd_texts([p.card for p in fresh], db)
+
+    # Determine scoring text, confidence and content hash for each new card
+    scorable = []
+    for p in fresh:
+        try:
+            if not _prepare_scoring_text(p, fetched):
+                continue
+        except Exception as e:
+            logger.warning(f"Error processing card '{p.card.title}': {e}")
+            continue
+        # Dedup by content hash (catches same job appearing in multiple emails)
+        reason = dedup.duplicate_reason(p)
+        if reason:
+            logger.debug(reason)
+            continue
+        scorable.append(p)
+
+    # Step 7: Score all cards against base resumes in one batch
+    if context is None:
+        context = load_scoring_context(user_id, db, profile)
+    for p, (resume_id, score) in zip(
+        scorable, select_best_resumes(context, [p.scoring_text for p in scorable])
+    ):
+        p.selected_resume_id, p.match_score = resume_id, score
+    resumes_by_id = {r.id: r for r in context.resumes}
+
+    # Steps 8-9: Persist in card order; dedup keys grow as candidates are created
+    created = []
+    for p in scorable:
+        try:
+            candidate = _persist_card(user_id, p, min_score, dedup, resumes_by_id, db)
+        except Exception as e:
+            logger.warning(f"Error processing card '{p.card.title}': {e}")
+            continue
+        if candidate:
+            created.append(candidate)
+    return created
+
+
+def _prepare_scoring_text(pending: _PendingCard, fetched: dict[str, tuple[str, int]]) -> bool:
+    """
+    Fill in scoring text, extraction confidence and jd_hash for a card.
+
+    For email-only sources (LinkedIn, Indeed, TrueUp): scores against email
+    content (title + company + location + salary + snippet).
+
+    For "other" sources (Talent.com, Trabajo.org, etc.): uses the full job
+    description fetched from the URL (see _fetch_jd_texts) when it was
+    extracted with enough confidence; falls back to email content otherwise.
 
-    # Determine scoring text and confidence
+    Returns False if the card has no usable text.
+    """
+    card = pending.card
     # Start with email content (always available)
     email_text = card.to_scoring_text()
     if not email_text.strip():
@@ -378,41 +697,70 @@ def _process_card(
 
     # For "other" sources, try to fetch the full JD from the URL for richer text
     if card.source not in _EMAIL_ONLY_SOURCES:
-        try:
-            resolved_url = resolve_canonical_url(card.apply_link)
-            html = fetch_jd_html(resolved_url)
-            if html:
-                fetched_text, fetched_confidence = extract_jd_text(html, card.source)
-                if fetched_text and fetched_confidence >= 60:
-                    # Use richer fetched text; merge in email metadata if missing
-                    scoring_text = fetched_text
-                    extraction_confidence = fetched_confidence
-                    logger.debug(
-                        f"Used fetched JD (confidence={fetched_confidence}) "
-                        f"for {card.apply_link[:60]}"
-                    )
-                else:
-                    logger.debug(
-                        f"Fetched JD too low confidence ({fetched_confidence}), "
-                        f"using email content for {card.apply_link[:60]}"
-                    )
-        except Exception as e:
-            # URL fetch failed — fall back to email content silently
-            logger.debug(f"URL fetch failed for {card.apply_link[:60]}: {e}")
-
-    # Dedup by content hash (catches same job appearing in multiple emails)
-    jd_hash = compute_jd_hash(scoring_text)
-    hash_dup = (
-        db.query(JDICandidate)
-        .filter_by(user_id=user_id, jd_hash=jd_hash)
-        .first()
-    )
-    if hash_dup:
-        logger.debug(f"Duplicate content hash skipped: {jd_hash[:16]}")
-        return False
+        fetched_text, fetched_confidence = fetched.get(card.apply_link, (None, 0))
+        if fetched_text and fetched_confidence >= 60:
+            # Use richer fetched text; merge in email metadata if missing
+            scoring_text = fetched_text
+            extraction_confidence = fetched_confidence
+            logger.debug(
+                f"Used fetched JD (confidence={fetched_confidence}) "
+                f"for {card.apply_link[:60]}"
+            )
+        elif fetched_text is not None:
+            logger.debug(
+                f"Fetched JD too low confidence ({fetched_confidence}), "
+                f"using email content for {card.apply_link[:60]}"
+            )
 
-    # Step 7: Score against base resumes
-    selected_resume_id, match_score = select_best_resume(user_id, scoring_text, db)
+    pending.scoring_text = scoring_text
+    pending.extraction_confidence = extraction_confidence
+    pending.jd_hash = compute_jd_hash(scoring_text)
+    return True
+
+
+def _fetch_jd_texts(
+    cards: list[EmailJobCard], db: Session
+) -> dict[str, tuple[Optional[str], int]]:
+    """
+    Fetch and extract the JDs behind the apply links of "other"-source cards.
+
+    All pages are fetched concurrently (pooled connections, per-host cap,
+    stage deadline) through the persistent JD page cache. Returns {apply_link: (jd_text, confidence)}; failed
+    fetches map to (None, 0) so callers fall back to email content.
+    """
+    urls = {c.apply_link: c.source for c in cards if c.source not in _EMAIL_ONLY_SOURCES}
+    if not urls:
+        return {}
+    try:
+        return fetch_jd_texts(urls, db=db)
+    except Exception as e:
+        # Fetch stage failed as a whole — every card falls back to email content
+        logger.warning(f"JD fetch stage failed for {len(urls)} links: {e}")
+        return {}
+
+
+def _persist_card(
+    user_id: int,
+    pending: _PendingCard,
+    min_score: int,
+    dedup: _DedupIndex,
+    resumes_by_id: dict,
+    db: Session,
+) -> Optional[JDICandidate]:
+    """
+    Persist one scored card as a JDICandidate.
+
+    Returns the new candidate, or None if the card was skipped.
+    """
+    card = pending.card
+    # Earlier cards in this run may have created the same job
+    reason = dedup.duplicate_reason(pending)
+    if reason:
+        logger.debug(reason)
+        return None
+
+    match_score = pending.match_score
+    selected_resume_id = pending.selected_resume_id
 
     # For email-only sources (thin content), cap the effective min_score at
     # _EMAIL_ONLY_MIN_SCORE_CAP. Email text (title+company+location) gives lower
@@ -427,18 +775,18 @@ def _process_card(
         logger.debug(
             f"Below min score ({match_score} < {effective_min}): {card.title or card.apply_link[:50]}"
         )
-        return False
+        return None
 
     # Step 8: Generate match reasons
     resume_text = ""
     if selected_resume_id:
-        resume = db.query(Resume).filter_by(id=selected_resume_id).first()
+        resume = resumes_by_id.get(selected_resume_id)
         if resume:
             resume_text = resume.parsed_text or ""
 
     match_reasons = generate_match_reasons(
         resume_text=resume_text,
-        jd_text=scoring_text,
+        jd_text=pending.scoring_text,
         match_score=match_score,
         jd_title=card.title or "",
         jd_location=card.location or "",
@@ -448,16 +796,16 @@ def _process_card(
     candidate = JDICandidate(
         user_id=user_id,
         source=card.source,
-        source_message_id=message_id,
+        source_message_id=pending.message_id,
         job_url_raw=card.apply_link,
-        job_url_canonical=canonical_url,
+        job_url_canonical=pending.canonical_url,
         title=card.title,
         company=card.company,
         location=card.location,
         salary_text=card.salary_text,
-        jd_text=scoring_text,
-        jd_hash=jd_hash,
-        jd_extraction_confidence=extraction_confidence,
+        jd_text=pending.scoring_text,
+        jd_hash=pending.jd_hash,
+        jd_extraction_confidence=pending.extraction_confidence,
         match_score=match_score,
         match_reasons=match_reasons,
         selected_resume_id=selected_resume_id,
@@ -465,6 +813,7 @@ def _process_card(
     )
     db.add(candidate)
     db.flush()
+    dedup.add(pending)
 
     logger.info(f"New JDI candidate: {card.title} at {card.company} (score={match_score})")
-    return True
+    return candidate
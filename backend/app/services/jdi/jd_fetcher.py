@@ -4,9 +4,11 @@ import hashlib
 import logging
 import re
 from typing import Optional
-import requests
+import httpx
 from bs4 import BeautifulSoup
 
+from app.services.outbound_http import outbound_http
+
 logger = logging.getLogger(__name__)
 
 # Browser-like headers for fetching job pages
@@ -52,10 +54,10 @@ def fetch_jd_html(url: str, timeout: int = 15) -> Optional[str]:
         Raw HTML string or None on failure.
     """
     try:
-        resp = requests.get(url, headers=REQUEST_HEADERS, timeout=timeout)
+        resp = outbound_http.request_sync("GET", url, headers=REQUEST_HEADERS, timeout=timeout)
         resp.raise_for_status()
         return resp.text
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.warning(f"Failed to fetch JD from {url[:80]}: {e}")
         return None
 
@@ -2,9 +2,14 @@
 # Extract and canonicalize job posting URLs from email HTML
 import re
 import logging
+import threading
+from collections import OrderedDict
+from typing import Optional
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, unquote
-from bs4 import BeautifulSoup
-import requests
+import httpx
+
+from app.services.jdi.html_backend import parse_html
+from app.services.outbound_http import outbound_http
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +65,36 @@ EXCLUDE_PATTERNS = [
     re.compile(r"terms", re.IGNORECASE),
 ]
 
+# Generic job-URL keywords for sources without JOB_URL_PATTERNS
+_GENERIC_JOB_URL_RE = re.compile(r"(job|career|position|apply|opening|vacancy)", re.IGNORECASE)
+
+
+def _combine_patterns(patterns: list[re.Pattern]) -> re.Pattern:
+    """One alternation regex equivalent to `any(p.search(s) for p in patterns)`."""
+    return re.compile("|".join(f"(?:{p.pattern})" for p in patterns), re.IGNORECASE)
+
+
+# Combined per-source regexes: one search per anchor instead of one per pattern
+EXCLUDE_RE = _combine_patterns(EXCLUDE_PATTERNS)
+JOB_URL_RES = {source: _combine_patterns(patterns) for source, patterns in JOB_URL_PATTERNS.items()}
+
+# Anchor classifications (see classify_href)
+HREF_IGNORED = "ignored"      # empty or mailto:
+HREF_EXCLUDED = "excluded"    # unsubscribe / settings / legal / search pages
+HREF_JOB = "job"              # matches the source's job URL patterns
+HREF_UNMATCHED = "unmatched"  # anything else
+
+
+def classify_href(href: str, source: str = "other") -> str:
+    """Classify an (already stripped) anchor href for the given email source."""
+    if not href or href.startswith("mailto:"):
+        return HREF_IGNORED
+    if EXCLUDE_RE.search(href):
+        return HREF_EXCLUDED
+    job_url_re = JOB_URL_RES.get(source, _GENERIC_JOB_URL_RE)
+    return HREF_JOB if job_url_re.search(href) else HREF_UNMATCHED
+
+
 # Tracking parameters to strip during normalization
 TRACKING_PARAMS = {
     "utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content",
@@ -72,6 +107,9 @@ def extract_job_links(html_body: str, source: str = "other") -> list[str]:
     """
     Parse email HTML and extract job posting URLs.
 
+    Callers that also need the email's job cards should use
+    email_parser.ParsedEmail, which parses the HTML once for both.
+
     Args:
         html_body: Raw HTML email body.
         source: Source name (linkedin, indeed, trueup, other).
@@ -82,36 +120,74 @@ def extract_job_links(html_body: str, source: str = "other") -> list[str]:
     if not html_body:
         return []
 
-    soup = BeautifulSoup(html_body, "html.parser")
+    soup = parse_html(html_body)
     all_links = set()
 
     for tag in soup.find_all("a", href=True):
         href = tag["href"].strip()
-        if not href or href.startswith("mailto:"):
-            continue
-
-        # Skip excluded patterns
-        if any(pattern.search(href) for pattern in EXCLUDE_PATTERNS):
-            continue
-
-        # Check if URL matches known job patterns for this source
-        source_patterns = JOB_URL_PATTERNS.get(source, [])
-        if source_patterns:
-            if any(p.search(href) for p in source_patterns):
-                all_links.add(href)
-        else:
-            # For unknown sources, include any http(s) link that looks job-related
-            if re.search(r"(job|career|position|apply|opening)", href, re.IGNORECASE):
-                all_links.add(href)
+        if classify_href(href, source) == HREF_JOB:
+            all_links.add(href)
 
     logger.debug(f"Extracted {len(all_links)} job links from {source} email")
     return list(all_links)
 
 
+RESOLVED_URL_CACHE_SIZE = 4096
+
+
+class ResolvedURLCache:
+    """
+    Thread-safe in-process LRU of redirect resolutions, keyed by normalize_url(raw).
+
+    Tracking redirectors (Indeed click-throughs, aggregator short links) send
+    the same apply links to the same final pages over and over; a hit skips
+    the HEAD-with-redirects round trip. The persisted layer behind it lives in
+    resolved_urls.py.
+    """
+
+    def __init__(self, max_size: int = RESOLVED_URL_CACHE_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            resolved = self._entries.get(key)
+            if resolved is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return resolved
+
+    def put(self, key: str, resolved_url: str) -> None:
+        with self._lock:
+            self._entries[key] = resolved_url
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+resolved_url_cache = ResolvedURLCache()
+
+
 def resolve_canonical_url(raw_url: str, timeout: int = 10) -> str:
     """
     Follow redirects to resolve the final canonical URL.
     LinkedIn and Indeed emails often use tracking redirect URLs.
+    Successful resolutions are memoized in resolved_url_cache.
 
     Args:
         raw_url: The original URL from the email.
@@ -123,17 +199,22 @@ def resolve_canonical_url(raw_url: str, timeout: int = 10) -> str:
     if "linkedin.com" in (raw_url or ""):
         # LinkedIn redirects often lead to auth/login pages, destroying the real target
         return raw_url
+    key = normalize_url(raw_url)
+    cached = resolved_url_cache.get(key)
+    if cached:
+        return cached
     try:
-        resp = requests.head(
+        resp = outbound_http.request_sync(
+            "HEAD",
             raw_url,
-            allow_redirects=True,
             timeout=timeout,
             headers={"User-Agent": "Mozilla/5.0 (compatible; JobBot/1.0)"},
         )
-        final_url = resp.url
+        final_url = str(resp.url)
         logger.debug(f"Resolved: {raw_url[:80]} → {final_url[:80]}")
+        resolved_url_cache.put(key, final_url)
         return final_url
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.warning(f"Failed to resolve URL {raw_url[:80]}: {e}")
         return raw_url  # Fall back to original URL
 
@@ -0,0 +1,124 @@
+# File: backend/app/services/jdi/page_cache.py
+# Persistent cache of fetched JD pages, keyed by resolved URL.
+#
+# The same aggregator job URL shows up in several alert emails and on every
+# re-scan; fetching, bs4 and trafilatura extraction are the expensive part of
+# the "other"-source path. Entries keep the extracted text plus the response
+# validators (ETag / Last-Modified) so a stale entry is revalidated with a
+# conditional request instead of re-downloaded. Blocked pages (403, login
+# walls, no extractable JD) are cached as negative entries with a shorter TTL
+# so blocked hosts aren't hammered on every run.
+import hashlib
+import logging
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.jdi_page_cache import JDIPageCache
+
+logger = logging.getLogger(__name__)
+
+JD_CACHE_TTL = timedelta(days=7)
+JD_NEGATIVE_CACHE_TTL = timedelta(hours=6)
+
+
+def _utcnow() -> datetime:
+    # Cache timestamps are naive UTC (DateTime columns without time zone)
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def url_hash(url: str) -> str:
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    """One JD page as cached: extracted text (None = negative) and validators."""
+    url: str
+    jd_text: Optional[str]
+    extraction_confidence: int
+    status_code: Optional[int] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
+
+    @property
+    def is_negative(self) -> bool:
+        return self.jd_text is None
+
+    def is_fresh(self, now: Optional[datetime] = None) -> bool:
+        return self.expires_at is not None and self.expires_at > (now or _utcnow())
+
+    def validators(self) -> dict:
+        """Conditional request headers for revalidating this entry."""
+        headers = {}
+        if self.is_negative:
+            return headers
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def stamped(self, now: Optional[datetime] = None) -> "CachedPage":
+        """Copy with fetched_at = now and expires_at from the (negative) TTL."""
+        now = now or _utcnow()
+        ttl = JD_NEGATIVE_CACHE_TTL if self.is_negative else JD_CACHE_TTL
+        return replace(self, fetched_at=now, expires_at=now + ttl)
+
+
+def load_cached_pages(db: Session, urls) -> dict[str, CachedPage]:
+    """All cache entries (fresh or stale) for the given resolved URLs, in one query."""
+    hashes = {url_hash(u): u for u in urls}
+    if not hashes:
+        return {}
+    rows = db.query(JDIPageCache).filter(JDIPageCache.url_hash.in_(hashes)).all()
+    return {
+        row.url: CachedPage(
+            url=row.url,
+            jd_text=row.jd_text,
+            extraction_confidence=row.extraction_confidence,
+            status_code=row.status_code,
+            etag=row.etag,
+            last_modified=row.last_modified,
+            fetched_at=row.fetched_at,
+            expires_at=row.expires_at,
+        )
+        for row in rows
+    }
+
+
+def store_cached_pages(db: Session, pages: list[CachedPage]) -> None:
+    """Upsert entries by URL (caller commits)."""
+    pages = list({p.url: p for p in pages}.values())
+    if not pages:
+        return
+    stmt = pg_insert(JDIPageCache).values([
+        {
+            "url_hash": url_hash(p.url),
+            "url": p.url,
+            "status_code": p.status_code,
+            "etag": p.etag,
+            "last_modified": p.last_modified,
+            "jd_text": p.jd_text,
+            "extraction_confidence": p.extraction_confidence,
+            "fetched_at": p.fetched_at,
+            "expires_at": p.expires_at,
+        }
+        for p in pages
+    ])
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=["url_hash"],
+        set_={
+            col: stmt.excluded[col]
+            for col in (
+                "status_code", "etag", "last_modified", "jd_text",
+                "extraction_confidence", "fetched_at", "expires_at",
+            )
+        },
+    ))
+    logger.debug(f"Stored {len(pages)} JD page cache entries")
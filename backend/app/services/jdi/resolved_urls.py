@@ -0,0 +1,58 @@
+# File: backend/app/services/jdi/resolved_urls.py
+# Persisted redirect resolutions behind link_extractor.resolved_url_cache.
+#
+# The in-process LRU is lost on every restart; the jdi_resolved_urls table
+# keeps resolutions (normalized raw apply link → final URL) across restarts
+# and worker processes. Lookups for a whole fetch stage are one query.
+import hashlib
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.jdi_resolved_url import JDIResolvedURL
+
+logger = logging.getLogger(__name__)
+
+# Redirect targets of tracking links are stable, but job pages move eventually
+RESOLVED_URL_TTL = timedelta(days=30)
+
+
+def _raw_url_hash(raw_url: str) -> str:
+    return hashlib.sha256(raw_url.encode("utf-8")).hexdigest()
+
+
+def load_resolved_urls(db: Session, raw_urls) -> dict[str, str]:
+    """{normalized raw url: resolved url} for stored, unexpired resolutions."""
+    hashes = {_raw_url_hash(u) for u in raw_urls}
+    if not hashes:
+        return {}
+    cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - RESOLVED_URL_TTL
+    rows = (
+        db.query(JDIResolvedURL.raw_url, JDIResolvedURL.resolved_url)
+        .filter(JDIResolvedURL.raw_url_hash.in_(hashes), JDIResolvedURL.resolved_at >= cutoff)
+        .all()
+    )
+    return {raw: resolved for raw, resolved in rows}
+
+
+def store_resolved_urls(db: Session, resolutions: dict[str, str]) -> None:
+    """Upsert {normalized raw url: resolved url} (caller commits)."""
+    if not resolutions:
+        return
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    stmt = pg_insert(JDIResolvedURL).values([
+        {
+            "raw_url_hash": _raw_url_hash(raw),
+            "raw_url": raw,
+            "resolved_url": resolved,
+            "resolved_at": now,
+        }
+        for raw, resolved in resolutions.items()
+    ])
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=["raw_url_hash"],
+        set_={"resolved_url": stmt.excluded.resolved_url, "resolved_at": stmt.excluded.resolved_at},
+    ))
+    logger.debug(f"Stored {len(resolutions)} resolved URLs")
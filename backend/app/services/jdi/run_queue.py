@@ -0,0 +1,289 @@
+# File: backend/app/services/jdi/run_queue.py
+# DB-backed queue and in-process workers for JDI ingestion runs.
+#
+# POST /api/jdi/run used to run the whole Gmail scan → parse → fetch → score →
+# persist pipeline inside the request, holding a worker thread and a DB
+# session for minutes (proxy timeouts on Render's free plan). The route now
+# only enqueues a jdi_runs row and returns its id; a small pool of worker
+# threads claims queued rows (SELECT ... FOR UPDATE SKIP LOCKED, so several
+# app processes can share the table without Redis). Every pipeline event is
+# appended to jdi_run_events (streamed by GET /api/jdi/runs/{run_id}/events)
+# and its counters are copied onto the run row (GET /api/jdi/runs/{run_id}).
+#
+# Runs are "manual" (POST /api/jdi/run) or "scheduled" (scheduler.py). Manual
+# runs are claimed first, and with more than one worker, worker 0 only takes
+# manual runs — a backlog of background scans never makes a user wait for a
+# free worker.
+import logging
+import os
+import socket
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.database.connection import SessionLocal
+from app.models.jdi_run import JDIRun
+from app.models.jdi_run_event import JDIRunEvent
+from app.services.jdi.ingestion import iter_jdi_ingestion
+
+logger = logging.getLogger(__name__)
+
+# Worker threads per app process (0 disables in-process workers, e.g. in tests)
+JDI_RUN_WORKERS = int(os.getenv("JDI_RUN_WORKERS", "2"))
+# Idle workers re-check the table this often (runs enqueued by other processes)
+JDI_RUN_POLL_SECONDS = 30
+# A running run whose heartbeat is older than this died with its process
+STALE_RUN_AFTER = timedelta(minutes=30)
+# Workers look for stale runs (a worker thread or process that died) this often
+STALE_CHECK_SECONDS = 300
+
+ACTIVE_STATUSES = ("queued", "running")
+# Event fields mirrored onto the run row
+RUN_PROGRESS_FIELDS = ("stage", "emails_scanned", "cards_found", "cards_processed", "new_candidates")
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def get_active_run(user_id: int, db: Session) -> Optional[JDIRun]:
+    """The user's queued or running run; a running run whose heartbeat expired doesn't count."""
+    return (
+        db.query(JDIRun)
+        .filter(
+            JDIRun.user_id == user_id,
+            JDIRun.status.in_(ACTIVE_STATUSES),
+            or_(JDIRun.status == "queued", JDIRun.heartbeat_at >= _utcnow() - STALE_RUN_AFTER),
+        )
+        .first()
+    )
+
+
+def enqueue_run(
+    user_id: int, params: dict, db: Session, trigger: str = "manual"
+) -> tuple[JDIRun, bool]:
+    """
+    Queue an ingestion run for a user (trigger: "manual" or "scheduled").
+
+    Returns (run, created). While the user already has a queued or running
+    run, that run is returned instead (created=False) — one run per user.
+    A running run whose worker died (heartbeat expired) is failed first, so
+    it doesn't block new runs until some process restarts.
+    """
+    fail_stale_runs(db, user_id=user_id)
+    existing = get_active_run(user_id, db)
+    if existing:
+        return existing, False
+
+    run = JDIRun(user_id=user_id, params=params, status="queued", trigger=trigger)
+    db.add(run)
+    try:
+        db.commit()
+    except IntegrityError:
+        # Lost a race with a concurrent POST — the partial unique index kept one
+        db.rollback()
+        return get_active_run(user_id, db), False
+
+    logger.info(f"Queued {trigger} JDI run {run.id} for user_id={user_id}")
+    run_workers.wake()
+    return run, True
+
+
+def claim_next_run(db: Session, worker_id: str, include_scheduled: bool = True) -> Optional[JDIRun]:
+    """
+    Atomically move the next queued run to running; None when the queue is empty.
+
+    Manual runs go first, then oldest first.
+    """
+    query = db.query(JDIRun).filter(JDIRun.status == "queued")
+    if not include_scheduled:
+        query = query.filter(JDIRun.trigger == "manual")
+    run = (
+        query
+        .order_by(JDIRun.trigger == "scheduled", JDIRun.created_at)
+        .with_for_update(skip_locked=True)
+        .first()
+    )
+    if run is None:
+        return None
+    now = _utcnow()
+    run.status = "running"
+    run.worker_id = worker_id
+    run.started_at = now
+    run.heartbeat_at = now
+    db.commit()
+    return run
+
+
+def record_event(
+    session_factory: Callable[[], Session], run_id: str, seq: int, event: dict, **fields
+) -> None:
+    """
+    Append one event to the run's log and update the run row, in a short
+    transaction of its own (the ingestion session may hold uncommitted work).
+
+    Counters in the event (RUN_PROGRESS_FIELDS) are copied onto the run;
+    extra keyword fields (status, finished_at, ...) are set as given.
+    """
+    fields.update({k: event[k] for k in RUN_PROGRESS_FIELDS if k in event})
+    fields["heartbeat_at"] = _utcnow()
+    db = session_factory()
+    try:
+        db.add(JDIRunEvent(
+            run_id=run_id,
+            seq=seq,
+            type=event["type"],
+            data={k: v for k, v in event.items() if k != "type"},
+        ))
+        db.query(JDIRun).filter(JDIRun.id == run_id).update(fields)
+        db.commit()
+    finally:
+        db.close()
+
+
+def execute_run(run_id: str, session_factory: Callable[[], Session] = SessionLocal) -> None:
+    """Run the ingestion pipeline for a claimed run, recording its events and outcome."""
+    db = session_factory()
+    seq = 0
+    try:
+        run = db.get(JDIRun, run_id)
+        for event in iter_jdi_ingestion(user_id=run.user_id, db=db, **(run.params or {})):
+            seq += 1
+            if event["type"] != "done":
+                record_event(session_factory, run_id, seq, event)
+                continue
+            result = event["result"]
+            record_event(
+                session_factory, run_id, seq, event,
+                status="succeeded",
+                emails_scanned=result["total_emails_scanned"],
+                new_candidates=result["new_candidates"],
+                message=result["message"],
+                finished_at=_utcnow(),
+            )
+            logger.info(f"JDI run {run_id} succeeded: {result['message']}")
+    except Exception as e:
+        # Chunks already committed stay; the rest is discarded when the session closes
+        logger.exception(f"JDI run {run_id} failed")
+        error = f"Ingestion failed: {e}"
+        record_event(
+            session_factory, run_id, seq + 1, {"type": "failed", "error": error},
+            status="failed",
+            error=error,
+            finished_at=_utcnow(),
+        )
+    finally:
+        db.close()
+
+
+def fail_stale_runs(db: Session, user_id: Optional[int] = None) -> int:
+    """Mark running runs (optionally one user's) whose worker stopped heartbeating as failed."""
+    cutoff = _utcnow() - STALE_RUN_AFTER
+    query = db.query(JDIRun).filter(JDIRun.status == "running", JDIRun.heartbeat_at < cutoff)
+    if user_id is not None:
+        query = query.filter(JDIRun.user_id == user_id)
+    count = (
+        query
+        .update(
+            {"status": "failed", "error": "Run interrupted (worker stopped)", "finished_at": _utcnow()},
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    if count:
+        logger.warning(f"Marked {count} stale JDI runs as failed")
+    return count
+
+
+class JDIRunWorkers:
+    """
+    Pool of daemon threads executing queued runs.
+
+    Workers sleep on an event that enqueue_run() sets, so a run enqueued in
+    this process starts immediately; they also re-check the table every
+    JDI_RUN_POLL_SECONDS for runs enqueued elsewhere, and fail stale runs
+    every STALE_CHECK_SECONDS (their worker died with a redeploy or OOM).
+    """
+
+    def __init__(self, size: int = JDI_RUN_WORKERS, session_factory: Callable[[], Session] = SessionLocal):
+        self.size = size
+        self.session_factory = session_factory
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._stale_lock = threading.Lock()
+        self._next_stale_check = 0.0
+
+    def start(self) -> None:
+        if self._threads or self.size <= 0:
+            return
+        self._stopping.clear()
+        self.check_stale_runs(force=True)
+        for n in range(self.size):
+            thread = threading.Thread(target=self._loop, args=(n,), name=f"jdi-run-worker-{n}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"Started {self.size} JDI run workers")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stopping.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    def check_stale_runs(self, force: bool = False) -> int:
+        """fail_stale_runs, at most once per STALE_CHECK_SECONDS across this pool's threads."""
+        with self._stale_lock:
+            now = time.monotonic()
+            if not force and now < self._next_stale_check:
+                return 0
+            self._next_stale_check = now + STALE_CHECK_SECONDS
+        db = self.session_factory()
+        try:
+            return fail_stale_runs(db)
+        except Exception as e:
+            logger.warning(f"Could not check for stale JDI runs: {e}")
+            return 0
+        finally:
+            db.close()
+
+    def run_pending(self, worker_id: str = "inline", include_scheduled: bool = True) -> int:
+        """Execute queued runs until the queue is empty; returns how many ran."""
+        executed = 0
+        while not self._stopping.is_set():
+            db = self.session_factory()
+            try:
+                run = claim_next_run(db, worker_id, include_scheduled)
+                run_id = run.id if run else None
+            finally:
+                db.close()
+            if run_id is None:
+                return executed
+            execute_run(run_id, self.session_factory)
+            executed += 1
+        return executed
+
+    def _loop(self, n: int) -> None:
+        worker_id = f"{socket.gethostname()}:{os.getpid()}:{n}"
+        # Keep one worker free for interactive runs
+        include_scheduled = not (n == 0 and self.size > 1)
+        while not self._stopping.is_set():
+            self.check_stale_runs()
+            try:
+                self.run_pending(worker_id, include_scheduled)
+            except Exception as e:
+                logger.warning(f"JDI run worker {worker_id} error: {e}")
+            self._wake.wait(JDI_RUN_POLL_SECONDS)
+            self._wake.clear()
+
+
+run_workers = JDIRunWorkers()
@@ -0,0 +1,177 @@
+# File: backend/app/services/jdi/scheduler.py
+# In-process scheduler for background JDI scans and candidate pruning.
+#
+# Scans used to happen only when a user clicked "Run", so all the Gmail and
+# JD-fetch latency landed in interactive requests. An APScheduler background
+# scheduler now ticks every JDI_SCHEDULE_TICK_MINUTES and enqueues a
+# "scheduled" run for each Gmail integration whose next_scan_at has passed.
+# Runs go through the run queue, so the same bounded worker pool executes them
+# (manual runs keep priority there). Each integration's next scan lands one
+# interval later ± SCAN_JITTER, and a newly seen integration gets a random
+# first slot, so scans spread over the day instead of bunching on one tick.
+# Integrations in "error" status are retried with exponential backoff.
+#
+# Several app processes can run the scheduler: due integrations are claimed
+# with SELECT ... FOR UPDATE SKIP LOCKED and pushed forward before enqueueing.
+import logging
+import os
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+from apscheduler.schedulers.background import BackgroundScheduler
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.database.connection import SessionLocal
+from app.models.user_integration import UserIntegration
+from app.models.user_profile import UserProfile
+from app.services.jdi.cleanup import prune_expired_candidates
+from app.services.jdi.run_queue import enqueue_run
+
+logger = logging.getLogger(__name__)
+
+JDI_SCHEDULER_ENABLED = os.getenv("JDI_SCHEDULER_ENABLED", "true").lower() == "true"
+# How often each connected user is scanned in the background
+JDI_SCAN_INTERVAL = timedelta(hours=float(os.getenv("JDI_SCAN_INTERVAL_HOURS", "12")))
+JDI_SCHEDULE_TICK_MINUTES = 15
+# Runs enqueued per tick, per process — caps the burst after downtime
+JDI_SCHEDULE_BATCH = int(os.getenv("JDI_SCHEDULE_BATCH", "20"))
+# Next scan = one interval ± this fraction of it
+SCAN_JITTER = 0.1
+# Errored integrations are retried after interval × 2^failures, capped here
+ERROR_BACKOFF_MAX = timedelta(days=7)
+CLEANUP_INTERVAL_HOURS = 24
+
+
+def _utcnow() -> datetime:
+    # next_scan_at is naive UTC (DateTime column without time zone)
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def next_scan_time(integration: UserIntegration, now: datetime) -> datetime:
+    """When to scan an integration again, given the run just enqueued."""
+    if integration.status == "error":
+        failures = max(integration.sync_failures or 0, 1)
+        return now + min(JDI_SCAN_INTERVAL * 2 ** failures, ERROR_BACKOFF_MAX)
+    spread = JDI_SCAN_INTERVAL.total_seconds() * SCAN_JITTER
+    return now + JDI_SCAN_INTERVAL + timedelta(seconds=random.uniform(-spread, spread))
+
+
+def scheduled_run_params(integration: UserIntegration, profile: Optional[UserProfile]) -> dict:
+    """run_jdi_ingestion arguments for a background scan (same defaults as POST /run)."""
+    scan_window_days = profile.jdi_scan_window_days if profile else 7
+    return {
+        "window_hours": scan_window_days * 24,
+        "sources_enabled": [],
+        "custom_source_patterns": profile.jdi_custom_source_patterns if profile else None,
+        "force_full_window": False,
+        "retry_errored": integration.status == "error",
+    }
+
+
+def schedule_due_scans(db: Session, now: Optional[datetime] = None) -> int:
+    """
+    Enqueue scheduled runs for integrations that are due.
+
+    Returns:
+        Number of runs enqueued (users with a run already active are skipped).
+    """
+    now = now or _utcnow()
+    due = (
+        db.query(UserIntegration)
+        .filter(
+            UserIntegration.provider == "gmail",
+            UserIntegration.status.in_(("active", "error")),
+            or_(UserIntegration.next_scan_at.is_(None), UserIntegration.next_scan_at <= now),
+        )
+        .order_by(UserIntegration.next_scan_at.asc().nullsfirst())
+        .limit(JDI_SCHEDULE_BATCH)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    profiles = {
+        p.user_id: p
+        for p in db.query(UserProfile).filter(UserProfile.user_id.in_([i.user_id for i in due]))
+    } if due else {}
+
+    to_enqueue = []
+    for integration in due:
+        if integration.next_scan_at is None:
+            # First sighting: pick a random slot within one interval
+            offset = random.uniform(0, JDI_SCAN_INTERVAL.total_seconds())
+            integration.next_scan_at = now + timedelta(seconds=offset)
+            continue
+        to_enqueue.append(
+            (integration.user_id, scheduled_run_params(integration, profiles.get(integration.user_id)))
+        )
+        integration.next_scan_at = next_scan_time(integration, now)
+    # Commit the new slots first — releases the row locks before the runs are queued
+    db.commit()
+
+    enqueued = 0
+    for user_id, params in to_enqueue:
+        _, created = enqueue_run(user_id, params, db, trigger="scheduled")
+        enqueued += created
+    if enqueued:
+        logger.info(f"Scheduled {enqueued} background JDI scans")
+    return enqueued
+
+
+class JDIScheduler:
+    """APScheduler jobs: scheduled scans every tick, pruning once a day."""
+
+    def __init__(
+        self,
+        enabled: bool = JDI_SCHEDULER_ENABLED,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ):
+        self.enabled = enabled
+        self.session_factory = session_factory
+        self._scheduler: Optional[BackgroundScheduler] = None
+
+    def start(self) -> None:
+        if not self.enabled or self._scheduler or JDI_SCAN_INTERVAL <= timedelta(0):
+            return
+        scheduler = BackgroundScheduler(
+            timezone="UTC", job_defaults={"coalesce": True, "max_instances": 1},
+        )
+        scheduler.add_job(
+            self.scan_tick, "interval", minutes=JDI_SCHEDULE_TICK_MINUTES, jitter=60,
+            id="jdi_scheduled_scans",
+        )
+        scheduler.add_job(
+            self.cleanup, "interval", hours=CLEANUP_INTERVAL_HOURS, jitter=600,
+            id="jdi_cleanup",
+        )
+        scheduler.start()
+        self._scheduler = scheduler
+        logger.info(f"JDI scheduler started (scan interval {JDI_SCAN_INTERVAL})")
+
+    def stop(self) -> None:
+        if self._scheduler:
+            self._scheduler.shutdown(wait=False)
+            self._scheduler = None
+
+    def scan_tick(self) -> int:
+        db = self.session_factory()
+        try:
+            return schedule_due_scans(db)
+        except Exception as e:
+            logger.warning(f"JDI scheduled scan tick failed: {e}")
+            return 0
+        finally:
+            db.close()
+
+    def cleanup(self) -> dict:
+        db = self.session_factory()
+        try:
+            return prune_expired_candidates(db)
+        except Exception as e:
+            logger.warning(f"JDI cleanup failed: {e}")
+            return {}
+        finally:
+            db.close()
+
+
+jdi_scheduler = JDIScheduler()
@@ -1,45 +1,42 @@
 # File: backend/app/services/jdi/scoring.py
 # Resume selection and scoring for JDI candidates
 import logging
+from dataclasses import dataclass, field
 from typing import Optional
 from sqlalchemy.orm import Session
 
 from app.models.resume import Resume
 from app.models.user_profile import UserProfile
-from app.services.score_calc import calculate_scores, calculate_similarity_score, calculate_skill_match_score
+from app.services.resume_features import ResumeFeatures, build_resume_features, get_resume_features
+from app.services.score_calc import (
+    calculate_scores,
+    calculate_similarity_matrix,
+    calculate_skill_match_score,
+    tokenize_terms,
+)
 from app.utils.job_extraction import extract_skills_with_frequency
 
 logger = logging.getLogger(__name__)
 
 
-def select_best_resume(
+@dataclass
+class ResumeScoringContext:
+    """A user's resume-selection preferences and candidate resumes, loaded once per run."""
+    resumes: list[Resume] = field(default_factory=list)
+    select_mode: str = "auto_best"
+    keyword_rules: Optional[dict] = None
+
+
+def load_scoring_context(
     user_id: int,
-    jd_text: str,
     db: Session,
-) -> tuple[Optional[int], int]:
+    profile: Optional[UserProfile],
+) -> ResumeScoringContext:
     """
-    Select the best resume for a JDI candidate and compute the match score.
-
-    Respects user's jdi_resume_select_mode:
-    - auto_best: Score JD against all base resumes (up to 3), pick highest match
-    - keyword_rules: Match JD text against keyword rules, select mapped resume
-
-    Args:
-        user_id: The user ID.
-        jd_text: Full job description text.
-        db: Database session.
+    Load the resumes a user's JDs are scored against.
 
-    Returns:
-        Tuple of (selected_resume_id, match_score 0-100).
-        Returns (None, 0) if no resumes available.
+    Uses profile.jdi_base_resume_ids when set, otherwise the 3 most recent resumes.
     """
-    if not jd_text or not jd_text.strip():
-        return None, 0
-
-    # Load user profile for preferences
-    profile = db.query(UserProfile).filter_by(user_id=user_id).first()
-
-    # Determine which resumes to score against
     base_resume_ids = None
     select_mode = "auto_best"
 
@@ -66,36 +63,99 @@ def select_best_resume(
 
     if not resumes:
         logger.warning(f"No resumes found for user_id={user_id}")
+
+    return ResumeScoringContext(
+        resumes=resumes,
+        select_mode=select_mode,
+        keyword_rules=profile.jdi_resume_keyword_rules if profile else None,
+    )
+
+
+def select_best_resume(
+    user_id: int,
+    jd_text: str,
+    db: Session,
+) -> tuple[Optional[int], int]:
+    """
+    Select the best resume for a JDI candidate and compute the match score.
+
+    Respects user's jdi_resume_select_mode:
+    - auto_best: Score JD against all base resumes (up to 3), pick highest match
+    - keyword_rules: Match JD text against keyword rules, select mapped resume
+
+    Args:
+        user_id: The user ID.
+        jd_text: Full job description text.
+        db: Database session.
+
+    Returns:
+        Tuple of (selected_resume_id, match_score 0-100).
+        Returns (None, 0) if no resumes available.
+    """
+    if not jd_text or not jd_text.strip():
         return None, 0
 
-    # Extract JD keywords for scoring
-    skills_data = extract_skills_with_frequency(jd_text)
-    jd_keywords = [s["skill"] for s in skills_data.get("skills", []) if s["skill"] != "N/A"]
+    # Load user profile for preferences
+    profile = db.query(UserProfile).filter_by(user_id=user_id).first()
+    context = load_scoring_context(user_id, db, profile)
+    return select_best_resumes(context, [jd_text])[0]
 
-    if select_mode == "keyword_rules" and profile and profile.jdi_resume_keyword_rules:
-        # Keyword rules mode: match JD text against rules
-        resume_id = _apply_keyword_rules(jd_text, profile.jdi_resume_keyword_rules, resumes)
-        if resume_id:
-            # Score the selected resume
-            resume = next((r for r in resumes if r.id == resume_id), None)
-            if resume and resume.parsed_text:
-                match_score = _compute_match_score(resume.parsed_text, jd_text, jd_keywords)
-                return resume_id, round(match_score)
-        # Fall through to auto_best if no rule matched
 
-    # auto_best mode: score all resumes, pick highest
-    best_id = None
-    best_score = 0
+def select_best_resumes(
+    context: ResumeScoringContext,
+    jd_texts: list[str],
+) -> list[tuple[Optional[int], int]]:
+    """
+    Batched select_best_resume: pick a resume and score for every JD in one pass.
 
-    for resume in resumes:
-        if not resume.parsed_text:
-            continue
-        match_score = _compute_match_score(resume.parsed_text, jd_text, jd_keywords)
-        if match_score > best_score:
-            best_score = match_score
-            best_id = resume.id
+    All JDs are scored against all resumes with a single similarity matrix,
+    so an ingestion run tokenizes each JD once and each resume not at all
+    (resume term counts come from the feature cache).
 
-    return best_id, round(best_score)
+    Returns one (selected_resume_id, match_score) per JD, (None, 0) for blank JDs.
+    """
+    results: list[tuple[Optional[int], int]] = [(None, 0)] * len(jd_texts)
+    indexed = [(i, t) for i, t in enumerate(jd_texts) if t and t.strip()]
+    scorable = [r for r in context.resumes if r.parsed_text]
+    if not indexed or not scorable:
+        return results
+
+    features = [get_resume_features(r) for r in scorable]
+    tfidf_matrix = calculate_similarity_matrix(
+        [f.term_counts for f in features],
+        [tokenize_terms(t) for _, t in indexed],
+    )
+    use_rules = context.select_mode == "keyword_rules" and context.keyword_rules
+
+    for (i, jd_text), tfidf_scores in zip(indexed, tfidf_matrix):
+        # Extract JD keywords for scoring
+        skills_data = extract_skills_with_frequency(jd_text)
+        jd_keywords = [s["skill"] for s in skills_data.get("skills", []) if s["skill"] != "N/A"]
+        scores = _blend_scores(tfidf_scores, features, jd_keywords)
+
+        if use_rules:
+            # Keyword rules mode: match JD text against rules
+            resume_id = _apply_keyword_rules(jd_text, context.keyword_rules, context.resumes)
+            if resume_id:
+                # Score the selected resume
+                col = next((c for c, r in enumerate(scorable) if r.id == resume_id), None)
+                if col is not None:
+                    results[i] = (resume_id, round(scores[col]))
+                    continue
+            # Fall through to auto_best if no rule matched
+
+        # auto_best mode: pick highest
+        best_id = None
+        best_score = 0
+
+        for resume, match_score in zip(scorable, scores):
+            if match_score > best_score:
+                best_score = match_score
+                best_id = resume.id
+
+        results[i] = (best_id, round(best_score))
+
+    return results
 
 
 def _compute_match_score(resume_text: str, jd_text: str, jd_keywords: list) -> float:
@@ -109,12 +169,37 @@ def _compute_match_score(resume_text: str, jd_text: str, jd_keywords: list) -> f
     This fixes the case where calculate_scores() returns 0 for email-only
     content because it gates on `jd_keywords` being non-empty.
     """
-    tfidf_score = calculate_similarity_score(resume_text, jd_text)
-    if jd_keywords:
-        keyword_score = calculate_skill_match_score(resume_text, jd_keywords)
-        return round((tfidf_score + keyword_score) / 2, 2)
-    # No keywords (thin email content) — use TF-IDF alone
-    return round(tfidf_score, 2)
+    return _compute_match_scores([build_resume_features(0, resume_text)], jd_text, jd_keywords)[0]
+
+
+def _compute_match_scores(
+    resumes: list[ResumeFeatures], jd_text: str, jd_keywords: list
+) -> list[float]:
+    """
+    Batched _compute_match_score: one JD against several resumes.
+
+    The JD is tokenized once; resume term counts come from the feature cache,
+    so scoring N base resumes never re-tokenizes or re-fits a vectorizer.
+    """
+    if not jd_text or not jd_text.strip():
+        return [0.0] * len(resumes)
+    tfidf_scores = calculate_similarity_matrix(
+        [r.term_counts for r in resumes], [tokenize_terms(jd_text)]
+    )[0]
+    return _blend_scores(tfidf_scores, resumes, jd_keywords)
+
+
+def _blend_scores(
+    tfidf_scores: list[float], resumes: list[ResumeFeatures], jd_keywords: list
+) -> list[float]:
+    """TF-IDF alone when there are no JD keywords, else a 50/50 TF-IDF/keyword blend."""
+    if not jd_keywords:
+        # No keywords (thin email content) — use TF-IDF alone
+        return [round(score, 2) for score in tfidf_scores]
+    return [
+        round((tfidf_score + calculate_skill_match_score(r.text_lower, jd_keywords)) / 2, 2)
+        for r, tfidf_score in zip(resumes, tfidf_scores)
+    ]
 
 
 def _apply_keyword_rules(
@@ -0,0 +1,105 @@
+# File: backend/app/services/job_batch_parser.py
+# Bulk JD extraction for /parse-job-descriptions/batch.
+#
+# Title / company / skills / experience / salary extraction is pure-Python CPU
+# work (tens of ms per JD), so a batch is spread over a process pool instead of
+# running one JD after another on a request thread. Locations are resolved in
+# the parent: the regex stages are cheap, and the JDs they can't place go
+# through the shared spaCy pipeline as one nlp.pipe batch, so the model is
+# loaded once per app process rather than once per pool worker.
+#
+# The pool is created on first use and uses "spawn" — forking a process that
+# already runs worker and scheduler threads is unsafe. Small batches (and
+# JD_PARSE_WORKERS=0) are parsed in-process, where the pool's IPC isn't worth it.
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional
+
+from app.utils.job_extraction import (
+    extract_company_name,
+    extract_experience,
+    extract_locations,
+    extract_skills_with_frequency,
+    extract_title,
+)
+from app.utils.salary_extractor import salary_fields
+
+logger = logging.getLogger(__name__)
+
+JD_PARSE_WORKERS = int(os.getenv("JD_PARSE_WORKERS", str(min(4, os.cpu_count() or 1))))
+# Batches smaller than this are parsed in-process
+JD_PARSE_POOL_MIN_BATCH = 8
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def extract_job_fields(description: str) -> dict:
+    """Everything /parse-job-description extracts from a JD, except the location."""
+    return {
+        "title": extract_title(description),
+        "company": extract_company_name(description),
+        "skills": extract_skills_with_frequency(description),
+        "experience": extract_experience(description),
+        **salary_fields(description),  # salary + salary_min/max/currency/frequency
+    }
+
+
+def _extract_or_error(description: str) -> dict:
+    # Runs in the pool: errors come back as data so one bad JD doesn't fail its chunk
+    try:
+        return extract_job_fields(description)
+    except Exception as e:
+        return {"error": f"Extraction failed: {e}"}
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=JD_PARSE_WORKERS, mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info(f"Started JD parse pool ({JD_PARSE_WORKERS} workers)")
+        return _pool
+
+
+def shutdown_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def _extract_all(descriptions: List[str]) -> List[dict]:
+    if JD_PARSE_WORKERS <= 0 or len(descriptions) < JD_PARSE_POOL_MIN_BATCH:
+        return [_extract_or_error(d) for d in descriptions]
+    chunksize = max(1, len(descriptions) // (JD_PARSE_WORKERS * 4))
+    try:
+        return list(_get_pool().map(_extract_or_error, descriptions, chunksize=chunksize))
+    except BrokenProcessPool as e:
+        # A worker died (e.g. OOM-killed): drop the pool and finish in-process
+        logger.warning(f"JD parse pool broke, parsing batch in-process: {e}")
+        shutdown_pool()
+        return [_extract_or_error(d) for d in descriptions]
+
+
+def parse_job_descriptions(descriptions: List[str]) -> List[dict]:
+    """
+    Extract the fields of many JDs, in input order.
+
+    Returns:
+        One dict per JD — title, company, skills, experience, location,
+        salary and its structured parts — or {"error": "..."} when
+        extraction failed for that JD.
+    """
+    results = _extract_all(descriptions)
+    ok = [i for i, r in enumerate(results) if "error" not in r]
+    for i, location in zip(ok, extract_locations([descriptions[i] for i in ok])):
+        results[i]["location"] = location
+    return results
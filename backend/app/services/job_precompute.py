@@ -0,0 +1,130 @@
+# File: backend/app/services/job_precompute.py
+# Extract derived Job / SavedJob columns once, when the row is written.
+#
+# GET /saved-jobs used to run extract_salary over every saved JD without a
+# salary, on every page load. Salary (raw text plus min/max/currency/frequency
+# from extract_salary_info), location and skills are now extracted when a job
+# is created and stored on the row; read endpoints only read columns.
+# extracted_at marks rows that have been through extraction — rows written
+# before it existed are filled in by the backfill command (until then GET
+# /saved-jobs extracts their salary on read, as it always did):
+#
+#   cd backend && python -m app.services.job_precompute [--batch-size 200]
+import argparse
+import logging
+from datetime import datetime, timezone
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from app.models.job import Job
+from app.models.saved_job import SavedJob
+from app.utils.job_extraction import extract_location, extract_skills_with_frequency
+from app.utils.salary_extractor import salary_fields
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_BATCH_SIZE = 200
+
+
+_SALARY_COLUMNS = ("salary_min", "salary_max", "salary_currency", "salary_frequency")
+
+
+def _set_salary(row, fields: dict, raw_column: str) -> None:
+    setattr(row, raw_column, fields["salary"])
+    for column in _SALARY_COLUMNS:
+        setattr(row, column, fields[column])
+
+
+def precompute_job(job: Job) -> Job:
+    """Fill a Job's derived columns that are still empty and stamp extracted_at."""
+    description = job.job_description or ""
+    _set_salary(job, salary_fields(description, job.salary), "salary")
+    if description and not job.location:
+        job.location = extract_location(description)
+    if description and job.extracted_skills is None:
+        job.extracted_skills = extract_skills_with_frequency(description)
+    job.extracted_at = datetime.now(timezone.utc)
+    return job
+
+
+def clear_job_salary(job: Job) -> Job:
+    """
+    Empty a Job's salary columns: the user removed the salary, so the JD's
+    salary must not be extracted back into them.
+    """
+    if job.extracted_at is None:
+        # Extract the rest now — the backfill would otherwise refill the salary
+        precompute_job(job)
+    _set_salary(job, dict.fromkeys(("salary",) + _SALARY_COLUMNS), "salary")
+    return job
+
+
+def precompute_saved_job(saved: SavedJob) -> SavedJob:
+    """Fill a SavedJob's derived columns that are still empty and stamp extracted_at."""
+    description = saved.job_description or ""
+    _set_salary(saved, salary_fields(description, saved.job_salary), "job_salary")
+    if description and not saved.job_location:
+        saved.job_location = extract_location(description)
+    if description and saved.extracted_skills is None:
+        saved.extracted_skills = extract_skills_with_frequency(description)
+    saved.extracted_at = datetime.now(timezone.utc)
+    return saved
+
+
+def _backfill_model(db: Session, model, precompute: Callable, batch_size: int) -> int:
+    # Keyset pagination by id: a row whose extraction fails is logged and
+    # skipped instead of being selected again forever
+    done, last_id = 0, 0
+    while True:
+        rows = (
+            db.query(model)
+            .filter(model.extracted_at.is_(None), model.id > last_id)
+            .order_by(model.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            return done
+        for row in rows:
+            try:
+                precompute(row)
+                done += 1
+            except Exception as e:
+                logger.warning(f"Extraction failed for {model.__tablename__} id={row.id}: {e}")
+        db.commit()
+        last_id = rows[-1].id
+        logger.info(f"Backfilled {done} {model.__tablename__} rows (through id={last_id})")
+
+
+def backfill_extraction_columns(db: Session, batch_size: int = BACKFILL_BATCH_SIZE) -> dict:
+    """
+    Run extraction for every Job / SavedJob row not extracted yet, one commit per batch.
+
+    Returns:
+        Rows filled in per table.
+    """
+    return {
+        "jobs": _backfill_model(db, Job, precompute_job, batch_size),
+        "saved_jobs": _backfill_model(db, SavedJob, precompute_saved_job, batch_size),
+    }
+
+
+def main():
+    from app.database.connection import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Backfill precomputed extraction columns on jobs and saved_jobs.")
+    parser.add_argument("--batch-size", type=int, default=BACKFILL_BATCH_SIZE)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    db = SessionLocal()
+    try:
+        counts = backfill_extraction_columns(db, batch_size=args.batch_size)
+    finally:
+        db.close()
+    print(f"✅ Backfill complete: {counts}")
+
+
+if __name__ == "__main__":
+    main()
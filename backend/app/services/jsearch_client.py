@@ -0,0 +1,189 @@
+# File: backend/app/services/jsearch_client.py
+# Cached, coalesced proxy to the RapidAPI jsearch endpoint behind /search-jobs.
+#
+# The search box called jsearch (num_pages=4, the slowest and most expensive
+# request the API offers) on every query, then dumped the whole response to
+# job_output.json — a blocking write in the request path that concurrent
+# searches raced on. Mapped results are now kept in an in-process TTL cache
+# keyed by the normalized query + params, and concurrent misses for the same
+# key share one upstream request (single-flight). Set JSEARCH_TRACE_SAMPLE_RATE
+# (0-1) to log a sample of raw responses to the "app.jsearch.trace" logger.
+# Requests go through the shared async client (outbound_http.py).
+import asyncio
+import json
+import logging
+import os
+import random
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional
+
+import httpx
+
+from app.services.outbound_http import outbound_http
+from app.utils.salary_extractor import extract_salary
+
+logger = logging.getLogger(__name__)
+trace_logger = logging.getLogger("app.jsearch.trace")
+
+JSEARCH_HOST = "jsearch.p.rapidapi.com"
+JSEARCH_URL = os.getenv("JSEARCH_API_URL", f"https://{JSEARCH_HOST}/search")
+JSEARCH_TIMEOUT = 30  # seconds; num_pages=4 responses are slow
+JSEARCH_CACHE_TTL = float(os.getenv("JSEARCH_CACHE_TTL_SECONDS", "600"))
+JSEARCH_CACHE_SIZE = 256
+JSEARCH_TRACE_SAMPLE_RATE = float(os.getenv("JSEARCH_TRACE_SAMPLE_RATE", "0"))
+
+# Parameters /search-jobs sends with every query
+DEFAULT_SEARCH_PARAMS = {
+    "page": "1",
+    "num_pages": "4",
+    "country": "ca",
+    "date_posted": "all",       # today, 3days, week, month, all
+}
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a search query."""
+    return " ".join(query.split()).casefold()
+
+
+def cache_key(query: str, params: dict) -> tuple:
+    return (normalize_query(query),) + tuple(sorted((k, str(v)) for k, v in params.items()))
+
+
+class SearchCache:
+    """
+    In-process LRU of search results with a TTL and single-flight.
+
+    get_or_fetch(key, fetch) returns the cached value while it is fresh.
+    On a miss, fetch() runs as a task of its own; callers arriving with
+    the same key while it runs await that result (or its exception) instead
+    of issuing their own request. Every caller — the first one included —
+    awaits the task through asyncio.shield, so one client disconnecting
+    doesn't cancel the fetch for the others. Failures are not cached. Used
+    from the app's event loop only — no locking needed between awaits.
+    """
+
+    def __init__(self, ttl: float = JSEARCH_CACHE_TTL, max_size: int = JSEARCH_CACHE_SIZE,
+                 clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._clock = clock
+        self._entries: "OrderedDict[tuple, tuple[float, object]]" = OrderedDict()
+        self._in_flight: dict[tuple, asyncio.Task] = {}
+
+    async def get_or_fetch(self, key: tuple, fetch: Callable[[], Awaitable[object]]):
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > self._clock():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = self._in_flight[key] = asyncio.ensure_future(self._fetch_and_store(key, fetch))
+            # Retrieved: no "never retrieved" warning if every caller went away
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        # shield: a caller disconnecting must not cancel the shared fetch
+        return await asyncio.shield(task)
+
+    async def _fetch_and_store(self, key: tuple, fetch: Callable[[], Awaitable[object]]):
+        try:
+            value = await fetch()
+        finally:
+            del self._in_flight[key]
+        if self.ttl > 0:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries), "hits": self.hits,
+            "misses": self.misses, "coalesced": self.coalesced,
+        }
+
+
+search_cache = SearchCache()
+
+
+def _trace(query: str, params: dict, status: int, elapsed: float, data: dict) -> None:
+    if JSEARCH_TRACE_SAMPLE_RATE <= 0 or random.random() >= JSEARCH_TRACE_SAMPLE_RATE:
+        return
+    trace_logger.info(json.dumps({
+        "query": query, "params": params, "status": status,
+        "elapsed_ms": round(elapsed * 1000), "response": data,
+    }))
+
+
+def _to_result(job: dict) -> dict:
+    return {
+        "job_id": job.get("job_id"),  # 👈 always include job_id!
+        "search_id": job.get("job_id"),  # optional, for clarity in frontend if you want
+        "job_title": job.get("job_title"),
+        "employer_name": job.get("employer_name"),
+        "job_location": job.get("job_location"),
+        "job_posted_at_datetime_utc": job.get("job_posted_at_datetime_utc"),
+        "job_google_link": job.get("job_google_link"),
+        "employer_logo": job.get("employer_logo"),
+        "employer_website": job.get("employer_website"),
+        "job_is_remote": job.get("job_is_remote"),
+        "job_employment_type": job.get("job_employment_type"),
+        "job_salary": job.get("job_salary") or extract_salary(job.get("job_description") or ""),
+        "job_description": job.get("job_description"),
+    }
+
+
+def _to_results(jobs: list[dict]) -> list[dict]:
+    return [_to_result(job) for job in jobs]
+
+
+async def fetch_jobs(query: str, params: dict) -> list[dict]:
+    """One jsearch request, mapped to /search-jobs results. Raises on HTTP errors."""
+    headers = {
+        "x-rapidapi-host": JSEARCH_HOST,
+        "x-rapidapi-key": (os.getenv("RAPIDAPI_KEY") or "").encode("ascii", "ignore").decode(),
+    }
+    start = time.perf_counter()
+    response = await outbound_http.get(
+        JSEARCH_URL, headers=headers, params={"query": query, **params}, timeout=JSEARCH_TIMEOUT,
+    )
+    elapsed = time.perf_counter() - start
+    response.raise_for_status()
+    data = response.json()
+    _trace(query, params, response.status_code, elapsed, data)
+    jobs = data.get("data") or []
+    logger.info(f"jsearch {query!r}: {len(jobs)} jobs in {elapsed:.2f}s")
+    # Salary extraction over up to ~40 JDs is CPU work — keep it off the event loop
+    return await asyncio.to_thread(_to_results, jobs)
+
+
+async def search_jobs(query: str, params: Optional[dict] = None) -> list[dict]:
+    """
+    /search-jobs results for a query, from the cache when fresh.
+
+    Queries that normalize the same ("Data  Engineer" / "data engineer")
+    share one cache entry and one in-flight upstream request. An upstream
+    error response gives no results, as /search-jobs always has — and is
+    not cached, so the next search asks jsearch again.
+    """
+    params = {**DEFAULT_SEARCH_PARAMS, **(params or {})}
+    key = cache_key(query, params)
+    try:
+        return await search_cache.get_or_fetch(key, lambda: fetch_jobs(query.strip(), params))
+    except httpx.HTTPStatusError as e:
+        logger.warning(f"jsearch {query!r}: HTTP {e.response.status_code}, returning no results")
+        return []
@@ -0,0 +1,227 @@
+# File: backend/app/services/outbound_http.py
+# Shared outbound HTTP layer: pooled clients, timeouts, retries, per-host metrics.
+#
+# Route handlers and services each called requests.get/head/post with a fresh
+# connection per call — and inside async handlers (parse_job_description's URL
+# fetch) that blocked the event loop for up to the whole timeout. Outbound
+# calls now go through outbound_http:
+#
+#   - await outbound_http.get(url)            async handlers; one app-lifetime
+#                                             httpx.AsyncClient, opened/closed in
+#                                             the startup/shutdown hooks
+#   - outbound_http.request_sync("HEAD", url) code that runs on worker threads
+#                                             (sync routes, JDI helpers, email);
+#                                             one pooled httpx.Client
+#
+# Idempotent requests are retried with exponential backoff on transport errors
+# and 429/502/503/504. Request counts, retries, errors, status classes and
+# latency are kept per upstream host — see stats() and GET /health/outbound.
+# The JDI fetch stage keeps its own per-run client (async_fetcher.py): it runs
+# on its own event loop in a worker thread.
+import asyncio
+import logging
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+OUTBOUND_TIMEOUT = httpx.Timeout(15.0, connect=5.0)
+OUTBOUND_MAX_CONNECTIONS = 50
+OUTBOUND_RETRIES = 2              # extra attempts for idempotent requests
+OUTBOUND_BACKOFF = 0.5            # seconds before the first retry, doubled per retry
+OUTBOUND_MAX_BACKOFF = 8.0
+
+RETRY_STATUSES = {429, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+def _host(url) -> str:
+    return (urlsplit(str(url)).hostname or "").lower()
+
+
+class HostMetrics:
+    """Counters for one upstream host."""
+
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.errors = 0
+        self.statuses: dict[str, int] = {}
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "errors": self.errors,
+            "statuses": dict(self.statuses),
+            "avg_ms": round(self.total_ms / self.requests, 1) if self.requests else 0.0,
+            "max_ms": round(self.max_ms, 1),
+        }
+
+
+class OutboundHTTP:
+    """
+    App-lifetime pooled HTTP clients with retries and per-host metrics.
+
+    The async client exists between start() and aclose(); an async request
+    made outside that window (scripts, tests without the app lifespan) runs
+    on a short-lived client instead. The sync client is created on first use.
+    """
+
+    def __init__(
+        self,
+        timeout: httpx.Timeout = OUTBOUND_TIMEOUT,
+        max_connections: int = OUTBOUND_MAX_CONNECTIONS,
+        retries: int = OUTBOUND_RETRIES,
+        backoff: float = OUTBOUND_BACKOFF,
+    ):
+        self.retries = retries
+        self.backoff = backoff
+        self._client_kwargs = {
+            "timeout": timeout,
+            "follow_redirects": True,
+            "limits": httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        }
+        self._client: Optional[httpx.AsyncClient] = None
+        self._sync_client: Optional[httpx.Client] = None
+        self._metrics: dict[str, HostMetrics] = {}
+        self._lock = threading.Lock()
+
+    # --- lifecycle -----------------------------------------------------------
+
+    async def start(self) -> None:
+        if self._client is None:
+            self._client = httpx.AsyncClient(**self._client_kwargs)
+
+    async def aclose(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+        with self._lock:
+            sync_client, self._sync_client = self._sync_client, None
+        if sync_client is not None:
+            sync_client.close()
+
+    def _get_sync_client(self) -> httpx.Client:
+        with self._lock:
+            if self._sync_client is None:
+                self._sync_client = httpx.Client(**self._client_kwargs)
+            return self._sync_client
+
+    # --- retries and metrics -------------------------------------------------
+
+    def _attempts(self, method: str, retries: Optional[int]) -> int:
+        if retries is None:
+            retries = self.retries if method.upper() in IDEMPOTENT_METHODS else 0
+        return retries + 1
+
+    def _delay(self, attempt: int) -> float:
+        return min(self.backoff * (2 ** attempt), OUTBOUND_MAX_BACKOFF)
+
+    def _record(self, host: str, elapsed: float, response: Optional[httpx.Response] = None,
+                retried: bool = False, error: bool = False) -> None:
+        ms = elapsed * 1000
+        with self._lock:
+            m = self._metrics.setdefault(host, HostMetrics())
+            m.requests += 1
+            m.retries += retried
+            m.errors += error
+            if response is not None:
+                status = f"{response.status_code // 100}xx"
+                m.statuses[status] = m.statuses.get(status, 0) + 1
+            m.total_ms += ms
+            m.max_ms = max(m.max_ms, ms)
+
+    def _should_retry(self, attempt: int, attempts: int, response: Optional[httpx.Response]) -> bool:
+        return attempt + 1 < attempts and (response is None or response.status_code in RETRY_STATUSES)
+
+    def stats(self) -> dict:
+        """{host: {requests, retries, errors, statuses, avg_ms, max_ms}}"""
+        with self._lock:
+            return {host: m.as_dict() for host, m in sorted(self._metrics.items())}
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._metrics.clear()
+
+    # --- async ---------------------------------------------------------------
+
+    async def request(self, method: str, url: str, *, retries: Optional[int] = None, **kwargs) -> httpx.Response:
+        """
+        Send a request through the shared async client.
+
+        Non-2xx responses are returned, not raised (call raise_for_status()
+        where that matters). Raises httpx.HTTPError when the last attempt
+        fails at the transport level.
+        """
+        if self._client is None:
+            async with httpx.AsyncClient(**self._client_kwargs) as client:
+                return await self._send(client, method, url, retries, kwargs)
+        return await self._send(self._client, method, url, retries, kwargs)
+
+    async def _send(self, client: httpx.AsyncClient, method: str, url: str,
+                    retries: Optional[int], kwargs: dict) -> httpx.Response:
+        host, attempts = _host(url), self._attempts(method, retries)
+        for attempt in range(attempts):
+            start = time.perf_counter()
+            try:
+                response = await client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                retry = self._should_retry(attempt, attempts, None)
+                self._record(host, time.perf_counter() - start, retried=retry, error=not retry)
+                if not retry:
+                    raise
+                logger.debug(f"{method} {host}: {e!r}, retrying")
+            else:
+                retry = self._should_retry(attempt, attempts, response)
+                self._record(host, time.perf_counter() - start, response, retried=retry)
+                if not retry:
+                    return response
+                await response.aclose()
+                logger.debug(f"{method} {host}: HTTP {response.status_code}, retrying")
+            await asyncio.sleep(self._delay(attempt))
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def head(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("HEAD", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    # --- sync ----------------------------------------------------------------
+
+    def request_sync(self, method: str, url: str, *, retries: Optional[int] = None, **kwargs) -> httpx.Response:
+        """request() for code running on worker threads — never call it on the event loop."""
+        client, host, attempts = self._get_sync_client(), _host(url), self._attempts(method, retries)
+        for attempt in range(attempts):
+            start = time.perf_counter()
+            try:
+                response = client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                retry = self._should_retry(attempt, attempts, None)
+                self._record(host, time.perf_counter() - start, retried=retry, error=not retry)
+                if not retry:
+                    raise
+                logger.debug(f"{method} {host}: {e!r}, retrying")
+            else:
+                retry = self._should_retry(attempt, attempts, response)
+                self._record(host, time.perf_counter() - start, response, retried=retry)
+                if not retry:
+                    return response
+                response.close()
+                logger.debug(f"{method} {host}: HTTP {response.status_code}, retrying")
+            time.sleep(self._delay(attempt))
+
+
+outbound_http = OutboundHTTP()
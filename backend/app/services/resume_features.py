@@ -0,0 +1,103 @@
+# File: backend/app/services/resume_features.py
+# Per-resume feature cache for match scoring.
+#
+# Resume.parsed_text rarely changes, but select_best_resume, /quick-match-score
+# and /match-score used to lowercase, tokenize and vectorize it on every call
+# (a 200-card JDI run re-tokenized each base resume ~600 times). Features are
+# now computed once per (resume_id, updated_at) and kept in a small LRU.
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional
+
+from app.services.score_calc import tokenize_terms
+
+logger = logging.getLogger(__name__)
+
+RESUME_FEATURE_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class ResumeFeatures:
+    """Everything the scorers derive from a resume's parsed_text."""
+    resume_id: int
+    updated_at: Optional[datetime]
+    text_lower: str
+    term_counts: Dict[str, int]  # tokenize_terms(parsed_text) — TF-IDF input
+
+
+def build_resume_features(
+    resume_id: int, parsed_text: Optional[str], updated_at: Optional[datetime] = None
+) -> ResumeFeatures:
+    text_lower = (parsed_text or "").lower()
+    return ResumeFeatures(
+        resume_id=resume_id,
+        updated_at=updated_at,
+        text_lower=text_lower,
+        term_counts=tokenize_terms(text_lower),
+    )
+
+
+class ResumeFeatureCache:
+    """
+    Thread-safe LRU of ResumeFeatures keyed by resume_id.
+
+    An entry only counts as a hit when its updated_at still matches the row,
+    so a rewritten resume is re-vectorized even without explicit invalidation.
+    """
+
+    def __init__(self, max_size: int = RESUME_FEATURE_CACHE_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[int, ResumeFeatures]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, resume) -> ResumeFeatures:
+        """Features for a Resume row, computed on first use."""
+        with self._lock:
+            cached = self._entries.get(resume.id)
+            if cached is not None and cached.updated_at == resume.updated_at:
+                self._entries.move_to_end(resume.id)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        # Tokenize outside the lock — concurrent misses just compute twice
+        features = build_resume_features(resume.id, resume.parsed_text, resume.updated_at)
+
+        with self._lock:
+            self._entries[resume.id] = features
+            self._entries.move_to_end(resume.id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return features
+
+    def invalidate(self, resume_id: int) -> None:
+        with self._lock:
+            self._entries.pop(resume_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+resume_feature_cache = ResumeFeatureCache()
+
+
+def get_resume_features(resume) -> ResumeFeatures:
+    return resume_feature_cache.get(resume)
+
+
+def invalidate_resume_features(resume_id: int) -> None:
+    """Call whenever a resume's parsed_text is rewritten."""
+    resume_feature_cache.invalidate(resume_id)
+    logger.debug(f"Resume feature cache invalidated for resume_id={resume_id}")
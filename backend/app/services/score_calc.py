@@ -1,8 +1,12 @@
 # ✅ File: /backend/app/services/score_calc.py
 # ATS Scoring Engine (Modular & Extensible)
 
-from typing import List, Tuple
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+import math
 import re
+import numpy as np
+from scipy import sparse
 from app.config.skills_config import SKILL_KEYWORDS, SECTION_KEYWORDS
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
@@ -49,6 +53,89 @@ def calculate_similarity_score(resume_text: str, job_description: str) -> float:
     return round(similarity * 100, 2)
 
 
+# ✅ Batched TF-IDF similarity: one JD vs many resumes (0–100 each)
+# calculate_similarity_score() fits TfidfVectorizer on a 2-doc corpus [resume, jd].
+# With smooth_idf, idf = ln((1+2)/(1+df)) + 1, so a term's weight is exactly 1 when
+# both docs contain it and 1+ln(1.5) when only one does. Every pairwise cosine can
+# therefore be rebuilt from plain term counts — which can be computed once per
+# resume and cached (see app.services.resume_features).
+_UNIQUE_TERM_IDF_SQ = (1.0 + math.log(1.5)) ** 2
+
+# Same lowercasing + token_pattern as TfidfVectorizer's default analyzer
+_TERM_ANALYZER = TfidfVectorizer().build_analyzer()
+
+
+def tokenize_terms(text: str) -> Dict[str, int]:
+    """Term counts for text, tokenized exactly like calculate_similarity_score does."""
+    return dict(Counter(_TERM_ANALYZER((text or "").lower())))
+
+
+def calculate_similarity_matrix(
+    resume_terms: List[Dict[str, int]], jd_terms: List[Dict[str, int]]
+) -> List[List[float]]:
+    """
+    Pairwise TF-IDF cosine (0–100) of every JD against every pre-tokenized resume.
+
+    Returns one row per JD, one column per resume. All pairs are computed with a
+    handful of sparse products over a shared vocabulary, so scoring a whole
+    batch of JDs never re-tokenizes a resume or fits a vectorizer.
+    """
+    if not resume_terms or not jd_terms:
+        return [[] for _ in jd_terms]
+
+    vocabulary: Dict[str, int] = {}
+
+    def csr_parts(docs: List[Dict[str, int]]) -> tuple:
+        data, indices, indptr = [], [], [0]
+        for terms in docs:
+            for term, count in terms.items():
+                indices.append(vocabulary.setdefault(term, len(vocabulary)))
+                data.append(count)
+            indptr.append(len(indices))
+        return data, indices, indptr
+
+    jd_parts = csr_parts(jd_terms)
+    resume_parts = csr_parts(resume_terms)
+    n_terms = len(vocabulary)
+    jd_counts = sparse.csr_matrix(jd_parts, shape=(len(jd_terms), n_terms), dtype=np.float64)
+    resume_counts = sparse.csr_matrix(resume_parts, shape=(len(resume_terms), n_terms), dtype=np.float64)
+
+    jd_sq = jd_counts.multiply(jd_counts).tocsr()
+    resume_sq = resume_counts.multiply(resume_counts).tocsr()
+    jd_present = (jd_counts > 0).astype(np.float64)
+    resume_present = (resume_counts > 0).astype(np.float64)
+
+    # Dot product only touches shared terms (idf = 1)
+    dot = (jd_counts @ resume_counts.T).toarray()
+
+    # Squared L2 norms: shared terms weigh 1, terms unique to one side weigh idf²
+    jd_shared_sq = (jd_sq @ resume_present.T).toarray()
+    resume_shared_sq = (jd_present @ resume_sq.T).toarray()
+    jd_total_sq = np.asarray(jd_sq.sum(axis=1))           # (n_jd, 1)
+    resume_total_sq = np.asarray(resume_sq.sum(axis=1)).T  # (1, n_resume)
+
+    jd_norm_sq = jd_shared_sq + _UNIQUE_TERM_IDF_SQ * (jd_total_sq - jd_shared_sq)
+    resume_norm_sq = resume_shared_sq + _UNIQUE_TERM_IDF_SQ * (resume_total_sq - resume_shared_sq)
+
+    denom = np.sqrt(resume_norm_sq * jd_norm_sq)
+    similarity = np.divide(dot, denom, out=np.zeros_like(dot), where=dot > 0)
+    return [[round(float(s) * 100, 2) for s in row] for row in similarity]
+
+
+def calculate_similarity_scores(resume_texts: List[str], job_description: str) -> List[float]:
+    """
+    Same numbers as [calculate_similarity_score(r, job_description) for r in resume_texts],
+    but the JD is tokenized once and no vectorizer is fitted per resume.
+    """
+    if not resume_texts:
+        return []
+    if not job_description.strip():
+        return [0.0] * len(resume_texts)
+    return calculate_similarity_matrix(
+        [tokenize_terms(r) for r in resume_texts], [tokenize_terms(job_description)]
+    )[0]
+
+
 # ✅ Match score via skill overlap (0–100)
 def calculate_skill_match_score(resume_text: str, jd_keywords: List[str]) -> float:
     resume_text = resume_text.lower()
@@ -65,12 +152,19 @@ def calculate_match_score(resume_text: str, job_description: str, jd_keywords: L
 
 
 # ✅ Unified scoring entry point (ATS + Match)
-def calculate_scores(resume_text: str, job_description: str = "", jd_keywords: List[str] = None) -> Tuple[float, float, List[str]]:
+def calculate_scores(
+    resume_text: str,
+    job_description: str = "",
+    jd_keywords: List[str] = None,
+    resume_terms: Optional[Dict[str, int]] = None,
+) -> Tuple[float, float, List[str]]:
     """
     Returns:
     - ats_score: ATS formatting score (based on resume only, 0-85)
     - match_score: resume/job match score (TF-IDF + keyword overlap, 0-100)
     - warnings: list of improvement suggestions
+
+    resume_terms: cached tokenize_terms(resume_text), skips re-tokenizing the resume
     """
     if not resume_text or not resume_text.strip():
         return 0.0, 0.0, ["Empty resume text."]
@@ -80,7 +174,9 @@ def calculate_scores(resume_text: str, job_description: str = "", jd_keywords: L
 
     match_score = 0.0
     if job_description and jd_keywords:
-        tfidf_score = calculate_similarity_score(resume_text, job_description)
+        if resume_terms is None:
+            resume_terms = tokenize_terms(resume_text)
+        tfidf_score = calculate_similarity_matrix([resume_terms], [tokenize_terms(job_description)])[0][0]
         keyword_score = calculate_skill_match_score(resume_text, jd_keywords)
         match_score = round((tfidf_score + keyword_score) / 2, 2)
 
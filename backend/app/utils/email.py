@@ -4,9 +4,10 @@
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-import requests
+import httpx
 from dotenv import load_dotenv
 from os import getenv
+from app.services.outbound_http import outbound_http
 
 load_dotenv()  # For local dev
 
@@ -82,7 +83,8 @@ def send_with_mailersend(to_email: str, subject: str, html_body: str):
             "html": html_body,
         }
 
-        response = requests.post("https://api.mailersend.com/v1/email", headers=headers, json=data)
+        # POST: not retried by outbound_http, so an email is never sent twice
+        response = outbound_http.request_sync("POST", "https://api.mailersend.com/v1/email", headers=headers, json=data)
         if response.status_code >= 400:
             print(f"❌ [MailerSend] Failed to send email. "
                 f"Status: {response.status_code}")
@@ -95,5 +97,5 @@ def send_with_mailersend(to_email: str, subject: str, html_body: str):
             return
 
         print("✅ [MailerSend] Email sent. Status:", response.status_code)
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"❌ [MailerSend] Failed to send email: {e}")
@@ -0,0 +1,149 @@
+# File: backend/app/utils/extraction_patterns.py
+# Precompiled regexes for job_extraction, built once at import time.
+#
+# job_extraction used to build its patterns inline: extract_title calls
+# _is_complete_title / _has_title_role_word for every sliding-window phrase,
+# and each call compiled one \b<word>\b regex per role word (~35) plus a dozen
+# ad-hoc title-cleaning patterns, far beyond what fits in re's internal cache
+# (512 entries, flushed when full), so the same patterns kept being recompiled.
+# Every pattern here is the same regex as before, compiled once; the role-word
+# check is one combined alternation, and the known-company lookup reuses the
+# trie-shaped single-pass scanner from skill_matcher.
+import re
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+
+from app.utils.skill_matcher import SkillMatcher
+
+# --- Shared -------------------------------------------------------------------
+
+WHITESPACE_RE = re.compile(r"\s+")
+# Whitespace-separated tokens: the same split as str.split(), with offsets
+TOKEN_RE = re.compile(r"\S+")
+
+
+def role_word_pattern(words: Iterable[str]) -> "re.Pattern[str]":
+    """
+    One regex matching any of `words` as a whole word.
+
+    search() finds a match exactly when one of the per-word \\b<word>\\b
+    patterns would: at every position each alternative is tried in turn.
+    """
+    alternation = "|".join(re.escape(w) for w in sorted(set(words), key=len, reverse=True))
+    return re.compile(r"\b(?:" + alternation + r")\b")
+
+
+# --- Title extraction ---------------------------------------------------------
+
+JOB_TITLE_HEADER_RE = re.compile(r"(?i)^(job title|position|role)\s*[:|-]\s*(.+)$")
+
+# _clean_title_output, in the order the steps are applied
+TITLE_LEADING_FILLER_RE = re.compile(
+    r"(?i)^(as a|as an|as|as the|and|an|a|the|experienced|hands-on|visionary|dynamic|talented"
+    r"|seasoned|successful|highly motivated|detail-oriented|strategic)\s+"
+)
+# Boundaries where the description starts: (detect, split) pairs — split is
+# only applied when detect matches, and some detectors are looser than their split
+TITLE_BOUNDARY_RES: List[Tuple["re.Pattern[str]", "re.Pattern[str]"]] = [
+    # ", you will" / "you'll" / "you are"
+    (re.compile(r",?\s+you['â€™\s]*(will|ll|are)", re.IGNORECASE),) * 2,
+    # "to [verb]"
+    (re.compile(r"\s+to\s+(lead|join|build|drive|shape|define|help|partner)", re.IGNORECASE),) * 2,
+    # "for our/the"
+    (re.compile(r"\s+for\s+(our|the)\s", re.IGNORECASE),) * 2,
+    # "with consulting/experience/deep/strong/etc" — description starters
+    (re.compile(
+        r"\s+with\s+(consulting|experience|deep|strong|extensive|proven|excellent|a focus)", re.IGNORECASE
+    ),) * 2,
+    # "focused on"
+    (re.compile(r"\s+focused\s+on", re.IGNORECASE),) * 2,
+    # "is a senior ..."
+    (re.compile(r"\s+is\s+a\s+(senior)?", re.IGNORECASE), re.compile(r"\s+is\s+a", re.IGNORECASE)),
+]
+TITLE_AT_COMPANY_RE = re.compile(r"\s+[Aa]t\s+")
+TITLE_LOCATION_TAG_RE = re.compile(r"\s*\((remote|hybrid|on[-\s]?site|onsite).*?\)\s*$", re.IGNORECASE)
+TITLE_PAREN_PIPE_RE = re.compile(r"[\(\|]")
+TITLE_DASH_RE = re.compile(r"\s+[—–-]\s+")
+TITLE_TRAILING_VERB_RE = re.compile(r"\s+(for|to|will|you will|you\'ll|for our|to| is a senior|offers|specializes)")
+
+
+# --- Company extraction -------------------------------------------------------
+
+WHY_WORK_RE = re.compile(
+    r"(?i)Why\s+Work\s+(?:at|for|with)\s+([A-Z][A-Za-z0-9\s&\.\-']+?)\s*(?:\?|\s+We\b|\s*\n|$)"
+)
+ABOUT_COMPANY_RE = re.compile(
+    r"(?i)About\s+([A-Z][A-Za-z0-9\s&\.]+?)(?:\s+(?:is|was|are|has|provides|offers)\b|\s*\n|:|$)"
+)
+COMPANY_INTRO_RE = re.compile(
+    r"^([A-Z][A-Za-z0-9\s&\.]{2,40}?)\s+(is|provides|offers|specializes|builds|empowers|pioneers|helps|makes|enables)",
+    re.MULTILINE,
+)
+AT_COMPANY_RE = re.compile(r"(?i)At\s+([A-Z][A-Za-z0-9\s&\.]{2,40}?)[,:\n]")
+TITLE_CASE_PHRASE_RE = re.compile(r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,3})\b")
+# Company names don't contain present-tense verbs (the three old patterns, combined)
+COMPANY_VERB_RE = re.compile(
+    r"\b(is|are|was|were|will|can|may|should|has|have|had)\b"
+    r"|\b(provides|builds|helps|makes|offers|creates|develops)\b"
+    r"|\b(going|doing|working|building|creating)\b"
+)
+
+
+class KnownCompanyMatcher:
+    """
+    Find the preferred known company named in a text, in one pass.
+
+    Same result as trying re.search(r"\\b<name>\\b", text, re.IGNORECASE)
+    for each name, longest name first (ties in list order), and taking the
+    first hit — the scan finds every name present at once and the preferred
+    one is picked from those.
+    """
+
+    def __init__(self, companies: Iterable):
+        names = [c for c in companies if isinstance(c, str) and len(c) > 2]
+        # Stable sort: equal-length names keep their list order
+        self.by_priority: List[str] = sorted(names, key=len, reverse=True)
+        self._scanner = SkillMatcher(self.by_priority)
+
+    def find(self, text: str) -> Optional[str]:
+        found = self._scanner.count(text.lower())
+        for name in self.by_priority:
+            if name in found:
+                return name
+        return None
+
+
+@lru_cache(maxsize=32)
+def known_company_matcher(companies: Tuple[str, ...]) -> KnownCompanyMatcher:
+    """Matcher for a company list, reused while callers pass the same list."""
+    return KnownCompanyMatcher(companies)
+
+
+# --- Salary / experience / location ------------------------------------------
+
+SALARY_RES = [
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"\$\s?\d{2,3}(?:,\d{3})?\s*[-—–]\s*\$\s?\d{2,3}(?:,\d{3})?",
+        r"\$\s?\d{2,3}K\s*[-—–]\s*\$\s?\d{2,3}K",
+        r"\$\s?\d{2,3}(?:,\d{3})?\s*(?:per year|annually|/year)",
+        r"\$\s?\d{2,3}K\s*(?:per year|annually|/year)",
+        r"\$\s?\d{2,3}(?:,\d{3})?",
+        r"\$\s?\d{2,3}K",
+    )
+]
+YEARS_EXPERIENCE_RE = re.compile(r"\b\d+\+?\s+years?\b", re.IGNORECASE)
+EXPERIENCE_RE = re.compile(r"\d+\+?\s+years?")
+
+REMOTE_CANADA_RE = re.compile(r"(?i)\b(canada\s*\(remote\)|remote\s*\(canada\)|canada\s*-\s*remote)\b")
+CITY_PROVINCE_RE = re.compile(r"\b([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*),\s*(BC|ON|QC|AB|MB|SK|NS|NB|NL|PE)\b")
+BASED_IN_RE = re.compile(
+    r"(?i)(?:based in|located in|position is in)\s+(?:the\s+)?([A-Z][A-Za-z\s,]+?)(?:\s+(?:Area|or|region)|[,\.]|$)"
+)
+REMOTE_LOCATION_RE = re.compile(
+    r"(?i)(remote|hybrid)[/\s\-]*(?:friendly|first)?\s*(?:in|from|within)?\s*([A-Z][A-Za-z\s,]+?)(?:\s+or|\.|,|$)"
+)
+LOCATION_LABEL_RE = re.compile(
+    r"(?i)LOCATION:?\s*(?:This role is\s+)?(?:based in|located in)?\s*([A-Z][A-Za-z\s,\-]+?)(?:\s+(?:Area|or|region)|[,\.]|$)"
+)
+LOCATION_LABEL_SUFFIX_RE = re.compile(r"\s+(is|The position|The preferred|This role)")
@@ -3,22 +3,14 @@
 
 from __future__ import annotations
 
-import re
 from collections import Counter
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple, List
+from typing import Dict, Iterator, Optional, Tuple, List
 
 from app.config.skills_config import SKILL_KEYWORDS, MIN_SKILL_FREQUENCY, MAX_EMPHASIZED_SKILLS
-
-# --- Optional spaCy (keep it non-fatal) ---
-try:
-    import spacy  # type: ignore
-    try:
-        nlp = spacy.load("en_core_web_sm")
-    except Exception:
-        nlp = None
-except Exception:
-    nlp = None
+from app.utils import extraction_patterns as P
+from app.utils.nlp_provider import get_nlp, nlp_provider
+from app.utils.skill_matcher import SKILL_MATCHER
 
 
 # ----------------------------
@@ -59,6 +51,26 @@ TITLE_MUST_HAVE_WORDS = [
     # Other roles
     "principal", "staff", "senior", "junior", "associate",
 ]
+# Any MUST_HAVE word, as a whole word (one combined alternation)
+TITLE_ROLE_WORD_RE = P.role_word_pattern(TITLE_MUST_HAVE_WORDS)
+
+# Valid title starter words - titles should start with one of these
+TITLE_STARTER_WORDS = frozenset({
+    # Seniority levels
+    "senior", "sr", "junior", "jr", "mid", "mid-level", "entry", "entry-level",
+    "principal", "staff", "lead", "associate", "assistant",
+    # Leadership titles
+    "director", "manager", "head", "chief", "vp", "vice", "avp", "svp", "evp",
+    "president", "officer", "cto", "cio", "ceo", "cfo", "coo",
+    # Technical roles
+    "software", "data", "devops", "cloud", "platform", "infrastructure",
+    "backend", "frontend", "fullstack", "full-stack", "full", "qa", "qe", "sdet",
+    "security", "network", "database", "systems", "solutions", "technical",
+    "engineering", "product", "project", "program", "it", "information",
+    # Roles
+    "engineer", "developer", "architect", "analyst", "scientist",
+    "specialist", "consultant", "administrator", "coordinator", "supervisor",
+})
 
 # Additional role keywords for context (but not required)
 ROLE_CONTEXT_KEYWORDS = [
@@ -102,7 +114,7 @@ COMPANY_BAD_WORDS = {
 # ----------------------------
 
 def _clean_spaces(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip())
+    return P.WHITESPACE_RE.sub(" ", (s or "").strip())
 
 
 def _norm(s: str) -> str:
@@ -137,50 +149,31 @@ def _clean_title_output(title: str) -> str:
         return ""
     
     # Remove leading articles and adjectives
-    title = re.sub(r"(?i)^(as a|as an|as|as the|and|an|a|the|experienced|hands-on|visionary|dynamic|talented|seasoned|successful|highly motivated|detail-oriented|strategic)\s+", "", title.strip())
-    
-    # STOP at boundaries - split and take first part only
-    # Pattern: ", you" or "you'll" or "you will"
-    if re.search(r",?\s+you['â€™\s]*(will|ll|are)", title, re.IGNORECASE):
-        title = re.split(r",?\s+you['â€™\s]*(will|ll|are)", title, flags=re.IGNORECASE)[0]
-    
-    # Pattern: "to [verb]"
-    if re.search(r"\s+to\s+(lead|join|build|drive|shape|define|help|partner)", title, re.IGNORECASE):
-        title = re.split(r"\s+to\s+(lead|join|build|drive|shape|define|help|partner)", title, flags=re.IGNORECASE)[0]
-    
-    # Pattern: "for our/the"
-    if re.search(r"\s+for\s+(our|the)\s", title, re.IGNORECASE):
-        title = re.split(r"\s+for\s+(our|the)\s", title, flags=re.IGNORECASE)[0]
-    
-    # Pattern: "with consulting/experience/deep/strong/etc" - description starters
-    if re.search(r"\s+with\s+(consulting|experience|deep|strong|extensive|proven|excellent|a focus)", title, re.IGNORECASE):
-        title = re.split(r"\s+with\s+(consulting|experience|deep|strong|extensive|proven|excellent|a focus)", title, flags=re.IGNORECASE)[0]
-
-    # Pattern: "focused on"
-    if re.search(r"\s+focused\s+on", title, re.IGNORECASE):
-        title = re.split(r"\s+focused\s+on", title, flags=re.IGNORECASE)[0]
+    title = P.TITLE_LEADING_FILLER_RE.sub("", title.strip())
 
-    # Pattern: "is a senior ..."
-    if re.search(r"\s+is\s+a\s+(senior)?", title, re.IGNORECASE):
-        title = re.split(r"\s+is\s+a", title, flags=re.IGNORECASE)[0]
+    # STOP at boundaries - split and take first part only:
+    # ", you will", "to [verb]", "for our/the", "with [description starter]",
+    # "focused on", "is a senior"
+    for detect_re, split_re in P.TITLE_BOUNDARY_RES:
+        if detect_re.search(title):
+            title = split_re.split(title)[0]
 
-    
     # Remove "at [Company]" suffix
-    title = re.split(r"\s+[Aa]t\s+", title)[0]
-    
+    title = P.TITLE_AT_COMPANY_RE.split(title)[0]
+
     # Remove location/remote tags
-    title = re.sub(r"\s*\((remote|hybrid|on[-\s]?site|onsite).*?\)\s*$", "", title, flags=re.IGNORECASE)
-    
+    title = P.TITLE_LOCATION_TAG_RE.sub("", title)
+
     # Remove pipes and dashes
-    title = re.split(r"[\(\|]", title)[0]
-    title = re.split(r"\s+[—–-]\s+", title)[0]
-    
+    title = P.TITLE_PAREN_PIPE_RE.split(title)[0]
+    title = P.TITLE_DASH_RE.split(title)[0]
+
     # Clean trailing punctuation
     title = title.strip().strip(',').strip(':').strip('.')
 
     # Remove trailing verbs/descriptions
-    title = re.split(r'\s+(for|to|will|you will|you\'ll|for our|to| is a senior|offers|specializes)', title)[0].strip()
-    
+    title = P.TITLE_TRAILING_VERB_RE.split(title)[0].strip()
+
     return _clean_spaces(title)
 
 
@@ -189,15 +182,8 @@ def _has_title_role_word(text: str) -> bool:
     Check if text contains at least ONE required role word.
     This ensures we're extracting actual titles, not random phrases.
     """
-    text_lower = text.lower()
-    
-    # Check for MUST_HAVE words (these make it a title)
-    for word in TITLE_MUST_HAVE_WORDS:
-        # Use word boundary to avoid partial matches
-        if re.search(r'\b' + re.escape(word) + r'\b', text_lower):
-            return True
-    
-    return False
+    # Any MUST_HAVE word (these make it a title), whole words only
+    return TITLE_ROLE_WORD_RE.search(text.lower()) is not None
 
 
 def _is_complete_title(text: str) -> bool:
@@ -220,26 +206,8 @@ def _is_complete_title(text: str) -> bool:
     if not _has_title_role_word(text):
         return False
 
-    # Valid title starter words - titles should start with one of these
-    valid_title_starters = {
-        # Seniority levels
-        "senior", "sr", "junior", "jr", "mid", "mid-level", "entry", "entry-level",
-        "principal", "staff", "lead", "associate", "assistant",
-        # Leadership titles
-        "director", "manager", "head", "chief", "vp", "vice", "avp", "svp", "evp",
-        "president", "officer", "cto", "cio", "ceo", "cfo", "coo",
-        # Technical roles
-        "software", "data", "devops", "cloud", "platform", "infrastructure",
-        "backend", "frontend", "fullstack", "full-stack", "full", "qa", "qe", "sdet",
-        "security", "network", "database", "systems", "solutions", "technical",
-        "engineering", "product", "project", "program", "it", "information",
-        # Roles
-        "engineer", "developer", "architect", "analyst", "scientist",
-        "specialist", "consultant", "administrator", "coordinator", "supervisor",
-    }
-
     # Check if first word is a valid starter
-    if words[0] not in valid_title_starters:
+    if words[0] not in TITLE_STARTER_WORDS:
         return False
 
     # Should not be a description phrase
@@ -339,7 +307,7 @@ def extract_title(text: str) -> str:
     
     # Priority 1: Check for explicit headers (e.g., "Job Title: Director")
     for line in lines[:5]:
-        match = re.search(r"(?i)^(job title|position|role)\s*[:|-]\s*(.+)$", line)
+        match = P.JOB_TITLE_HEADER_RE.search(line)
         if match:
             title = _clean_title_output(match.group(2).split('\n')[0])
             if _is_complete_title(title) and 5 < len(title) < 100:
@@ -352,57 +320,64 @@ def extract_title(text: str) -> str:
     full_text = "\n".join(lines)[:2000]
     
     # Search for titles using sliding window (2-10 words)
-    words = full_text.split()
+    # Tokens with their character offsets (the same tokens as full_text.split())
+    spans = [m.span() for m in P.TOKEN_RE.finditer(full_text)]
+    words = [full_text[start:end] for start, end in spans]
+    token_at = {start: i for i, (start, _) in enumerate(spans)}
     
     # Try longer windows first to capture complete titles
-    for window_size in range(10, 1, -1):  # 10, 9, 8, ... 2
-        for i in range(len(words) - window_size + 1):
-            phrase = ' '.join(words[i:i + window_size])
-            
-            # Quick filters
-            if len(phrase) < 6 or len(phrase) > 150:
-                continue
-            
-            # CRITICAL: Must be a complete title with required role word
-            if not _is_complete_title(phrase):
-                continue
-            
-            if _is_heading_junk(phrase):
-                continue
-            
-            if _looks_like_sentence(phrase):
-                continue
-            
-            # Get position in text
-            match_start = full_text.find(phrase)
-            if match_start == -1:
-                continue
-            
-            match_end = match_start + len(phrase)
-            
-            # Get context
+    for i, window_size in _title_windows(words):
+        phrase = ' '.join(words[i:i + window_size])
+        
+        # Quick filters
+        if len(phrase) < 6 or len(phrase) > 150:
+            continue
+        
+        # CRITICAL: Must be a complete title with required role word
+        if not _is_complete_title(phrase):
+            continue
+        
+        if _is_heading_junk(phrase):
+            continue
+        
+        if _looks_like_sentence(phrase):
+            continue
+        
+        # Get position in text
+        match_start = full_text.find(phrase)
+        if match_start == -1:
+            continue
+        
+        match_end = match_start + len(phrase)
+        
+        # Get context — straight from the token list when the match sits on token boundaries
+        j = token_at.get(match_start)
+        if j is not None and j + window_size <= len(words) and spans[j + window_size - 1][1] == match_end:
+            before_ctx = ' '.join(words[max(j - 8, 0):j])
+            after_ctx = ' '.join(words[j + window_size:j + window_size + 8])
+        else:
             before_ctx, after_ctx = _get_context_window(full_text, match_start, match_end, words_before=8, words_after=8)
-            
-            # Calculate score
-            score = _score_title_candidate(
-                candidate=phrase,
-                position=match_start,
-                before_context=before_ctx,
-                after_context=after_ctx,
-                text_length=len(full_text)
-            )
-            
-            # Find which line this is on
-            line_num = full_text[:match_start].count('\n') + 1
-            
-            candidates.append(TitleCandidate(
-                text=phrase,
-                score=score,
-                line_num=line_num,
-                position=match_start,
-                before_context=before_ctx,
-                after_context=after_ctx
-            ))
+        
+        # Calculate score
+        score = _score_title_candidate(
+            candidate=phrase,
+            position=match_start,
+            before_context=before_ctx,
+            after_context=after_ctx,
+            text_length=len(full_text)
+        )
+        
+        # Find which line this is on
+        line_num = full_text.count('\n', 0, match_start) + 1
+        
+        candidates.append(TitleCandidate(
+            text=phrase,
+            score=score,
+            line_num=line_num,
+            position=match_start,
+            before_context=before_ctx,
+            after_context=after_ctx
+        ))
     
     # Return best candidate
     if candidates:
@@ -417,6 +392,30 @@ def extract_title(text: str) -> str:
     return "Unknown Title"
 
 
+def _title_windows(words: List[str]) -> Iterator[Tuple[int, int]]:
+    """
+    (start, size) of the 2-10 word windows that can hold a complete title,
+    in sliding-window order: longest windows first, then left to right.
+
+    _is_complete_title needs a starter word first and a role word somewhere
+    in the phrase, so only windows that start on a starter token and reach a
+    role-word token are generated, instead of every window over the text.
+    Tokens never contain spaces, so a role word in the joined phrase is a role
+    word in one of its tokens ("vice president" also contains "president").
+    """
+    n = len(words)
+    # Index of the first role-word token at or after each position (n = none)
+    next_role = [n] * (n + 1)
+    for i in range(n - 1, -1, -1):
+        next_role[i] = i if TITLE_ROLE_WORD_RE.search(words[i].lower()) else next_role[i + 1]
+    starts = [i for i, word in enumerate(words) if word.lower() in TITLE_STARTER_WORDS]
+
+    for size in range(10, 1, -1):  # 10, 9, 8, ... 2
+        for i in starts:
+            if i + size <= n and next_role[i] < i + size:
+                yield i, size
+
+
 def _score_title_candidate(candidate: str, position: int, before_context: str, 
                            after_context: str, text_length: int) -> float:
     """
@@ -563,15 +562,8 @@ def _is_valid_company_name(text: str) -> bool:
             return False
     
     # Should not have verbs in present tense
-    verb_patterns = [
-        r'\b(is|are|was|were|will|can|may|should|has|have|had)\b',
-        r'\b(provides|builds|helps|makes|offers|creates|develops)\b',
-        r'\b(going|doing|working|building|creating)\b'
-    ]
-    
-    for pattern in verb_patterns:
-        if re.search(pattern, text_lower):
-            return False
+    if P.COMPANY_VERB_RE.search(text_lower):
+        return False
     
     # Word count check (company names are usually 1-5 words)
     words = text.split()
@@ -589,19 +581,15 @@ def extract_company_name(text: str, known_companies: List[str] = None) -> str:
         return "Unknown Company"
 
     # Priority 0: Known companies lookup (most reliable)
+    # (longest name found as a whole word in the first 2000 chars)
     if known_companies:
-        for co in sorted(known_companies, key=len, reverse=True):
-            if isinstance(co, str) and len(co) > 2:
-                # Look for exact company name in first 2000 chars
-                if re.search(r'\b' + re.escape(co) + r'\b', text[:2000], re.IGNORECASE):
-                    return _clean_spaces(co)
+        co = P.known_company_matcher(tuple(known_companies)).find(text[:2000])
+        if co:
+            return _clean_spaces(co)
 
     # Priority 1: "Why Work at [Company]?" pattern (very high confidence)
     # Pattern must capture company name AFTER "at/for/with" and BEFORE "?" or "We" or newline
-    why_work_match = re.search(
-        r"(?i)Why\s+Work\s+(?:at|for|with)\s+([A-Z][A-Za-z0-9\s&\.\-']+?)\s*(?:\?|\s+We\b|\s*\n|$)",
-        text[:2000]
-    )
+    why_work_match = P.WHY_WORK_RE.search(text[:2000])
     if why_work_match:
         cand = why_work_match.group(1).strip().rstrip('?').strip()
         # Additional validation - company name should be substantial
@@ -611,7 +599,7 @@ def extract_company_name(text: str, known_companies: List[str] = None) -> str:
     # Priority 2: "About [Company]" pattern (very high confidence)
     # Look for patterns like "About Apply Digital" or "ABOUT APPLY DIGITAL"
     # Match until we hit "is/was/are/has" or a newline
-    about_match = re.search(r"(?i)About\s+([A-Z][A-Za-z0-9\s&\.]+?)(?:\s+(?:is|was|are|has|provides|offers)\b|\s*\n|:|$)", text[:1500])
+    about_match = P.ABOUT_COMPANY_RE.search(text[:1500])
     if about_match:
         cand = about_match.group(1).strip()
         # Handle "APPLY DIGITAL Apply Digital" -> extract "Apply Digital" (title case version)
@@ -630,14 +618,14 @@ def extract_company_name(text: str, known_companies: List[str] = None) -> str:
     # Priority 2: Company name at start of JD (e.g., "Acme Corp is a leading...")
     # Look in first 200 chars for company name followed by "is/provides/offers/etc"
     first_lines = text[:200]
-    company_intro = re.search(r'^([A-Z][A-Za-z0-9\s&\.]{2,40}?)\s+(is|provides|offers|specializes|builds|empowers|pioneers|helps|makes|enables)', first_lines, re.MULTILINE)
+    company_intro = P.COMPANY_INTRO_RE.search(first_lines)
     if company_intro:
         cand = company_intro.group(1).strip()
         if _is_valid_company_name(cand):
             return _clean_spaces(cand)
 
     # Priority 3: "At [Company]," pattern
-    at_match = re.search(r"(?i)At\s+([A-Z][A-Za-z0-9\s&\.]{2,40}?)[,:\n]", text[:1000])
+    at_match = P.AT_COMPANY_RE.search(text[:1000])
     if at_match:
         cand = at_match.group(1).strip()
         if _is_valid_company_name(cand) and cand.lower() not in COMPANY_BAD_WORDS:
@@ -648,7 +636,7 @@ def extract_company_name(text: str, known_companies: List[str] = None) -> str:
     lines = text[:1000].split('\n')[:10]
     for line in lines:
         # Look for sequences of Title Case words
-        title_case_match = re.search(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,3})\b', line)
+        title_case_match = P.TITLE_CASE_PHRASE_RE.search(line)
         if title_case_match:
             cand = title_case_match.group(1).strip()
             if _is_valid_company_name(cand):
@@ -668,17 +656,8 @@ def extract_salary(job_description: str) -> Optional[str]:
     if not job_description:
         return None
 
-    patterns = [
-        r"\$\s?\d{2,3}(?:,\d{3})?\s*[-—–]\s*\$\s?\d{2,3}(?:,\d{3})?",
-        r"\$\s?\d{2,3}K\s*[-—–]\s*\$\s?\d{2,3}K",
-        r"\$\s?\d{2,3}(?:,\d{3})?\s*(?:per year|annually|/year)",
-        r"\$\s?\d{2,3}K\s*(?:per year|annually|/year)",
-        r"\$\s?\d{2,3}(?:,\d{3})?",
-        r"\$\s?\d{2,3}K",
-    ]
-
-    for pattern in patterns:
-        m = re.search(pattern, job_description, re.IGNORECASE)
+    for pattern in P.SALARY_RES:
+        m = pattern.search(job_description)
         if m:
             return m.group(0).strip()
 
@@ -688,33 +667,78 @@ def extract_salary(job_description: str) -> Optional[str]:
 def extract_years_experience(text: str) -> str:
     if not text:
         return "Unspecified"
-    m = re.search(r"\b\d+\+?\s+years?\b", text, re.IGNORECASE)
+    m = P.YEARS_EXPERIENCE_RE.search(text)
     return m.group(0).strip() if m else "Unspecified"
 
 
+# spaCy location fallback: chars of the JD it sees, and entities it misclassifies as places
+NER_TEXT_LIMIT = 5000
+NER_NON_LOCATION_TERMS = {
+    "ai", "ml", "nfl", "api", "aws", "gcp", "ui", "ux", "qa", "it",
+    "saas", "paas", "iaas", "sdk", "sql", "nosql", "css", "html",
+    "kubernetes", "docker", "react", "angular", "vue",
+}
+
+
 def extract_location(text: str) -> str:
     if not text:
         return "Unspecified"
 
+    location = _extract_location_by_pattern(text)
+    if location is not None:
+        return location
+
+    # spaCy fallback (model is loaded on first use)
+    nlp = get_nlp()
+    if nlp is not None:
+        try:
+            return _location_from_entities(nlp(text[:NER_TEXT_LIMIT]))
+        except Exception:
+            pass
+
+    return "Unspecified"
+
+
+def extract_locations(texts: List[str]) -> List[str]:
+    """
+    extract_location for many texts at once: texts the patterns can't place
+    go through the spaCy fallback as one nlp.pipe batch.
+    """
+    results: List[Optional[str]] = [
+        (_extract_location_by_pattern(text) if text else "Unspecified") for text in texts
+    ]
+    pending = [i for i, location in enumerate(results) if location is None]
+    if pending:
+        try:
+            docs = nlp_provider.pipe(texts[i][:NER_TEXT_LIMIT] for i in pending)
+            for i, doc in zip(pending, docs):
+                results[i] = _location_from_entities(doc) if doc is not None else "Unspecified"
+        except Exception:
+            pass
+    return ["Unspecified" if location is None else location for location in results]
+
+
+def _extract_location_by_pattern(text: str) -> Optional[str]:
+    """The regex stages of extract_location; None when none of them match."""
     # High-signal patterns
-    m = re.search(r"(?i)\b(canada\s*\(remote\)|remote\s*\(canada\)|canada\s*-\s*remote)\b", text)
+    m = P.REMOTE_CANADA_RE.search(text)
     if m:
         return _clean_spaces(m.group(0))
 
     # City, Province patterns
-    m = re.search(r"\b([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*),\s*(BC|ON|QC|AB|MB|SK|NS|NB|NL|PE)\b", text)
+    m = P.CITY_PROVINCE_RE.search(text)
     if m:
         return _clean_spaces(m.group(0))
 
     # Look for "based in [location]" pattern (very common in JDs)
-    based_in = re.search(r"(?i)(?:based in|located in|position is in)\s+(?:the\s+)?([A-Z][A-Za-z\s,]+?)(?:\s+(?:Area|or|region)|[,\.]|$)", text)
+    based_in = P.BASED_IN_RE.search(text)
     if based_in:
         loc_text = based_in.group(1).strip()
         if len(loc_text) > 3 and len(loc_text) < 60:
             return _clean_spaces(loc_text)
 
     # Look for "remote" indicators with location context
-    remote_match = re.search(r"(?i)(remote|hybrid)[/\s\-]*(?:friendly|first)?\s*(?:in|from|within)?\s*([A-Z][A-Za-z\s,]+?)(?:\s+or|\.|,|$)", text)
+    remote_match = P.REMOTE_LOCATION_RE.search(text)
     if remote_match:
         loc_part = remote_match.group(2).strip() if remote_match.group(2) else ""
         if loc_part and len(loc_part) > 3 and len(loc_part) < 60:
@@ -722,37 +746,29 @@ def extract_location(text: str) -> str:
         return "Remote"
 
     # Look for "LOCATION:" pattern (common in JDs) - but with better extraction
-    loc_label = re.search(r"(?i)LOCATION:?\s*(?:This role is\s+)?(?:based in|located in)?\s*([A-Z][A-Za-z\s,\-]+?)(?:\s+(?:Area|or|region)|[,\.]|$)", text)
+    loc_label = P.LOCATION_LABEL_RE.search(text)
     if loc_label:
         loc_text = loc_label.group(1).strip()
         # Clean up common suffixes
-        loc_text = re.split(r'\s+(is|The position|The preferred|This role)', loc_text)[0].strip()
+        loc_text = P.LOCATION_LABEL_SUFFIX_RE.split(loc_text)[0].strip()
         if len(loc_text) > 3 and len(loc_text) < 100:
             return _clean_spaces(loc_text)
 
-    # spaCy fallback - but filter out common misclassifications
-    tech_terms_not_locations = {
-        "ai", "ml", "nfl", "api", "aws", "gcp", "ui", "ux", "qa", "it",
-        "saas", "paas", "iaas", "sdk", "sql", "nosql", "css", "html",
-        "kubernetes", "docker", "react", "angular", "vue",
-    }
+    return None
 
-    if nlp is not None:
-        try:
-            doc = nlp(text[:5000])
-            for ent in doc.ents:
-                if ent.label_ in {"GPE", "LOC"}:
-                    ent_lower = ent.text.strip().lower()
-                    # Skip tech terms that spaCy misclassifies
-                    if ent_lower in tech_terms_not_locations:
-                        continue
-                    # Skip very short entities (likely errors)
-                    if len(ent.text.strip()) < 3:
-                        continue
-                    return ent.text.strip()
-        except Exception:
-            pass
 
+def _location_from_entities(doc) -> str:
+    """First GPE/LOC entity of a spaCy doc - but filter out common misclassifications."""
+    for ent in doc.ents:
+        if ent.label_ in {"GPE", "LOC"}:
+            ent_lower = ent.text.strip().lower()
+            # Skip tech terms that spaCy misclassifies
+            if ent_lower in NER_NON_LOCATION_TERMS:
+                continue
+            # Skip very short entities (likely errors)
+            if len(ent.text.strip()) < 3:
+                continue
+            return ent.text.strip()
     return "Unspecified"
 
 
@@ -771,20 +787,9 @@ def extract_skills_with_frequency(text: str) -> dict:
             "emphasized_skills": ["N/A"],
         }
 
-    t = text.lower()
-    freq: Dict[str, int] = {}
-
-    # SKILL_KEYWORDS can be dict (preferred) or list
-    skills = SKILL_KEYWORDS.keys() if isinstance(SKILL_KEYWORDS, dict) else SKILL_KEYWORDS
-
-    for skill in skills:
-        if not skill:
-            continue
-        pattern = r"\b" + re.escape(str(skill).lower()) + r"\b"
-        count = len(re.findall(pattern, t))
-        if count > 0:
-            # Preserve original key casing as stored in SKILL_KEYWORDS/list
-            freq[str(skill)] = count
+    # One linear pass over the text for every keyword (see utils/skill_matcher.py).
+    # Keys preserve original casing and SKILL_KEYWORDS order (stable sort below).
+    freq: Dict[str, int] = SKILL_MATCHER.count(text.lower())
 
     # Convert to list[{"skill","frequency"}] and sort desc
     sorted_skills = sorted(
@@ -804,5 +809,5 @@ def extract_skills_with_frequency(text: str) -> dict:
 
 
 def extract_experience(text: str) -> str:
-    match = re.search(r"\d+\+?\s+years?", text)
+    match = P.EXPERIENCE_RE.search(text)
     return match.group(0).strip() if match else "Unspecified"
\ No newline at end of file
@@ -0,0 +1,84 @@
+# File: backend/app/utils/nlp_provider.py
+# Shared, lazily loaded spaCy pipeline.
+#
+# routes/job.py and utils/job_extraction.py each ran spacy.load("en_core_web_sm")
+# at import time, so every worker — and every test run — paid for loading the
+# model twice before serving a request, even though only the location fallback
+# uses it. The model is now loaded once per process, on first use, and only
+# its "ner" component: the tagger, parser and lemmatizer are never loaded.
+# Set NLP_PRELOAD=true to load it at app startup instead of on first use.
+import logging
+import os
+import threading
+from typing import Iterable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+NLP_MODEL = os.getenv("NLP_MODEL", "en_core_web_sm")
+NLP_PRELOAD = os.getenv("NLP_PRELOAD", "false").lower() == "true"
+NLP_BATCH_SIZE = 32
+# Pipeline components entity extraction doesn't need (names missing from a model are ignored)
+NLP_EXCLUDE = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "senter"]
+
+
+class NLPProvider:
+    """
+    One spaCy pipeline per process, loaded on first use.
+
+    get() returns None when spaCy or the model isn't installed (NER is an
+    optional fallback) — the failed load is not retried.
+    """
+
+    def __init__(self, model: str = NLP_MODEL):
+        self.model = model
+        self._nlp = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def get(self):
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._nlp = self._load()
+                    self._loaded = True
+        return self._nlp
+
+    def _load(self):
+        try:
+            import spacy  # type: ignore
+            nlp = spacy.load(self.model, exclude=NLP_EXCLUDE)
+        except Exception as e:
+            logger.warning(f"spaCy model {self.model!r} unavailable, NER fallback disabled: {e}")
+            return None
+        logger.info(f"Loaded spaCy model {self.model} (pipeline: {', '.join(nlp.pipe_names)})")
+        return nlp
+
+    def pipe(self, texts: Iterable[str], batch_size: int = NLP_BATCH_SIZE) -> Iterator[Optional[object]]:
+        """
+        nlp.pipe over many texts: one Doc per text, in order.
+
+        Yields None per text when the model is unavailable, so callers can
+        zip the results with their inputs either way.
+        """
+        nlp = self.get()
+        if nlp is None:
+            for _ in texts:
+                yield None
+            return
+        yield from nlp.pipe(texts, batch_size=batch_size)
+
+    def preload(self) -> bool:
+        """Load the model now (app startup); True if it is available."""
+        return self.get() is not None
+
+
+nlp_provider = NLPProvider()
+
+
+def get_nlp():
+    """The shared spaCy pipeline, or None if spaCy is unavailable."""
+    return nlp_provider.get()
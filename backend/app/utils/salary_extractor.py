@@ -1,7 +1,8 @@
 # Utility for extracting structured salary information from job descriptions
 # File: backend/app/utils/salary_extractor.py
 import re
-from typing import Optional, Dict, Tuple
+from bisect import bisect_left, bisect_right
+from typing import Iterator, List, Optional, Dict, Tuple
 
 class SalaryInfo:
     """Structured salary information"""
@@ -17,84 +18,193 @@ class SalaryInfo:
     def __str__(self):
         return self.raw_text
 
-def extract_salary_info(job_description: str) -> Optional[SalaryInfo]:
+
+_FLAGS = re.IGNORECASE | re.MULTILINE
+DOLLAR_RE = re.compile(r"\$")
+# What a keyword-led pattern may cross a line break with between its lazy ".*?"
+# and the "$" (covers "at", "from", "ranging", "starts" plus whitespace in all of them)
+_GAP_GLUE_RE = re.compile(r"(?:\s|starts|at|ranging|from)*", _FLAGS)
+
+
+class SalaryPattern:
     """
-    Extract comprehensive salary information from job descriptions.
-    Returns SalaryInfo object with parsed details or None if no salary found.
+    One compiled salary regex, with its matches found as re.finditer would.
+
+    Keyword-led patterns ("salary ... $140,000 - $200,000") are built as
+    keyword + lazy gap + tail, the tail starting at the "$". Scanning the whole
+    JD with them backtracks badly: every "pay"/"rate" (also inside "payment",
+    "corporate") runs ".*?" to the end of its line, trying the tail at every
+    character. Here the tail is first matched, anchored, at each "$"; the full
+    regex is then only tried at keywords that have such a "$" within reach —
+    later on the same line (".*?" can't cross a newline), or just past a line
+    break joined by whitespace/"at"/"from" glue — so the matches, and the
+    order they come in, are the same as re.finditer over the whole text.
     """
-    if not job_description:
-        return None
 
-    # Comprehensive salary patterns - ordered by specificity
-    # IMPORTANT: each pattern must be a separate element (comma-separated)
-    patterns = [
-        # CAD/USD pay range: "The pay range for this role is: 140,000 - 200,000 CAD per year"
+    def __init__(self, regex: str, needs_dollar: bool = True, cue: Optional[str] = None,
+                 keyword: Optional[str] = None, tail: Optional[str] = None, mid: Optional[str] = None):
+        self.regex = re.compile(regex, _FLAGS)
+        self.needs_dollar = needs_dollar
+        # Something every match contains, cheaper to look for than the pattern itself
+        self.cue = re.compile(cue, _FLAGS) if cue else None
+        # Lookahead: every start position, including overlapping ones ("base pay" / "pay")
+        self.keyword = re.compile(f"(?={keyword})", _FLAGS) if keyword else None
+        self.tail = re.compile(tail, _FLAGS) if tail else None
+        # Required between keyword and "$" on the same line, e.g. "(?:range|is)"
+        self.mid = re.compile(mid, _FLAGS) if mid else None
+
+    @classmethod
+    def keyword_led(cls, keyword: str, gap: str, tail: str, mid: Optional[str] = None) -> "SalaryPattern":
+        return cls(keyword + gap + tail, keyword=keyword, tail=tail, mid=mid)
+
+    def finditer(self, text: str, dollars: List[int]) -> Iterator["re.Match[str]"]:
+        if self.needs_dollar and not dollars:
+            return iter(())
+        if self.cue is not None and not self.cue.search(text):
+            return iter(())
+        if self.keyword is None:
+            return self.regex.finditer(text)
+        return self._keyword_matches(text, dollars)
+
+    def _keyword_matches(self, text: str, dollars: List[int]) -> Iterator["re.Match[str]"]:
+        tails = [d for d in dollars if self.tail.match(text, d)]
+        if not tails:
+            return
+        pos = 0
+        for keyword in self.keyword.finditer(text):
+            start = keyword.start()
+            if start > tails[-1]:
+                return
+            if start < pos or not self._can_match_from(text, start, dollars, tails):
+                continue
+            match = self.regex.match(text, start)
+            if match:
+                yield match
+                pos = match.end()
+
+    def _can_match_from(self, text: str, start: int, dollars: List[int], tails: List[int]) -> bool:
+        line_end = text.find("\n", start)
+        if line_end == -1:
+            line_end = len(text)
+        if self.mid is not None:
+            mid = self.mid.search(text, start + 1, line_end)
+            if mid is None:
+                return False
+            i = bisect_left(tails, mid.end())
+            return i < len(tails) and tails[i] < line_end
+        i = bisect_right(tails, start)
+        if i == len(tails):
+            return False
+        if tails[i] < line_end:
+            return True
+        # Past the line end: only the first "$" after it, and only through glue
+        d = dollars[bisect_left(dollars, line_end)]
+        return tails[i] == d and _GAP_GLUE_RE.fullmatch(text, line_end, d) is not None
+
+
+# Comprehensive salary patterns - ordered by specificity (the first valid match wins)
+SALARY_PATTERNS = [
+    # CAD/USD pay range: "The pay range for this role is: 140,000 - 200,000 CAD per year"
+    SalaryPattern(
         r'(?:pay range for this role is[:\s]*)?(\d{1,3}(?:,\d{3})*)\s*[-–—]\s*(\d{1,3}(?:,\d{3})*)\s*(CAD|USD)\s*(?:per year|annually)?',
+        needs_dollar=False, cue=r'CAD|USD',
+    ),
 
-        # Compensation/Salary with K-suffix range: "$120K-$150K annually"
-        r'(?:compensation|salary|pay)\s*:\s*\$(\d+)\s*K\s*[-–—]\s*\$?\s*(\d+)\s*K\s*(?:annually|per year|/year)?',
+    # Compensation/Salary with K-suffix range: "$120K-$150K annually"
+    SalaryPattern(r'(?:compensation|salary|pay)\s*:\s*\$(\d+)\s*K\s*[-–—]\s*\$?\s*(\d+)\s*K\s*(?:annually|per year|/year)?'),
 
-        # Generic K-suffix ranges: "$120K-$150K", "$120K - $150K annually"
-        r'\$\s?(\d{1,3})\s*K\s*[-–—]\s*\$?\s?(\d{1,3})\s*K(?:\s*(?:annually|per year|/year))?',
+    # Generic K-suffix ranges: "$120K-$150K", "$120K - $150K annually"
+    SalaryPattern(r'\$\s?(\d{1,3})\s*K\s*[-–—]\s*\$?\s?(\d{1,3})\s*K(?:\s*(?:annually|per year|/year))?'),
 
-        # Starting at with K: "Starting at $90K per year"
-        r'(?:starting)\s+at\s+\$(\d+)\s*K\s*(?:per year|annually|/year)?',
+    # Starting at with K: "Starting at $90K per year"
+    SalaryPattern(r'(?:starting)\s+at\s+\$(\d+)\s*K\s*(?:per year|annually|/year)?'),
 
-        # Salary keyword with range and K suffix: "Salary: 140-150K"
-        r'(?:salary|compensation|pay|wage)\s*:\s*(\d{1,3})\s*[-–—]\s*(\d{1,3})\s*K',
+    # Salary keyword with range and K suffix: "Salary: 140-150K"
+    SalaryPattern(r'(?:salary|compensation|pay|wage)\s*:\s*(\d{1,3})\s*[-–—]\s*(\d{1,3})\s*K', needs_dollar=False, cue=r':\s*\d'),
 
-        # Salary with dollar range and frequency: "Salary: $4000-$6000 monthly"
-        r'(?:salary|pay|compensation)\s*:\s*\$(\d+(?:,\d{3})*(?:\.\d{2})?)\s*[-–—]\s*\$?\s*(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(monthly|weekly|bi-weekly|hourly|per hour|per week)',
+    # Salary with dollar range and frequency: "Salary: $4000-$6000 monthly"
+    SalaryPattern(r'(?:salary|pay|compensation)\s*:\s*\$(\d+(?:,\d{3})*(?:\.\d{2})?)\s*[-–—]\s*\$?\s*(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(monthly|weekly|bi-weekly|hourly|per hour|per week)'),
 
-        # Hourly rates with range
-        r'(?:hourly rate|rate).*?(?:starts)?\s*(?:at\s*)?'
+    # Hourly rates with range
+    SalaryPattern.keyword_led(
+        r'(?:hourly rate|rate)', r'.*?(?:starts)?\s*(?:at\s*)?',
         r'\$\s?(\d{1,3}(?:\.\d{2})?)\s*/hour\s*(?:to)\s*'
         r'\$\s?(\d{1,3}(?:\.\d{2})?)\s*/hour',
+    ),
 
-        # Pay range: $X-Y per hour (without $ on second number)
+    # Pay range: $X-Y per hour (without $ on second number)
+    SalaryPattern(
         r'(?:pay range)\s*:\s*'
         r'\$\s?(\d{1,3}(?:\.\d{2})?)\s*[-–—]\s*'
-        r'(\d{1,3}(?:\.\d{2})?)\s*(?:per hour|/hour|/hr)',
+        r'(\d{1,3}(?:\.\d{2})?)\s*(?:per hour|/hour|/hr)'
+    ),
 
-        # Weekly/Bi-weekly patterns with range — MUST be before generic "to" patterns
-        r'(?:salary|pay).*?(?:ranging\s*)?(?:from\s*)?'
+    # Weekly/Bi-weekly patterns with range — MUST be before generic "to" patterns
+    SalaryPattern.keyword_led(
+        r'(?:salary|pay)', r'.*?(?:ranging\s*)?(?:from\s*)?',
         r'\$\s?(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:[-–—]|to)\s*'
         r'\$?\s?(\d+(?:,\d{3})*(?:\.\d{2})?)\s*'
         r'(bi-weekly|weekly|per week)',
+    ),
 
-        # Complex ranges with multiple amounts and currency
-        r'(?:salary|pay|compensation).*?(?:range|is).*?'
+    # Complex ranges with multiple amounts and currency
+    SalaryPattern.keyword_led(
+        r'(?:salary|pay|compensation)', r'.*?(?:range|is).*?',
         r'\$\s?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*(?:to)\s*'
         r'\$\s?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*(?:to\s*'
         r'\$\s?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?))?\s*(?:CAD|USD)?',
+        mid=r'(?:range|is)',
+    ),
 
-        # Standard ranges with dash/hyphen
-        r'(?:salary|pay|compensation|range|base pay).*?'
+    # Standard ranges with dash/hyphen
+    SalaryPattern.keyword_led(
+        r'(?:salary|pay|compensation|range|base pay)', r'.*?',
         r'\$\s?(\d+(?:,\d{3})*(?:\.\d{2})?)\s*[-–—]\s*'
         r'\$?\s?(\d+(?:,\d{3})*(?:\.\d{2})?)',
+    ),
 
-        # Ranges with "to" or "up to"
-        r'(?:salary|pay|compensation).*?(?:from|at)?\s*'
+    # Ranges with "to" or "up to"
+    SalaryPattern.keyword_led(
+        r'(?:salary|pay|compensation)', r'.*?(?:from|at)?\s*',
         r'\$\s?(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:to|up to)\s*'
         r'\$?\s?(\d+(?:,\d{3})*(?:\.\d{2})?)',
+    ),
 
-        # Single K format amounts with keyword
-        r'(?:starting|salary|pay|compensation).*?(?:at\s*)?'
+    # Single K format amounts with keyword
+    SalaryPattern.keyword_led(
+        r'(?:starting|salary|pay|compensation)', r'.*?(?:at\s*)?',
         r'\$\s?(\d{1,3})\s*K(?:\s*(?:per year|annually|/year))?',
+    ),
 
-        # Single amounts with frequency
-        r'(?:salary|pay|compensation|base salary).*?(?:starts|is)?.*?(?:at\s*)?'
+    # Single amounts with frequency
+    SalaryPattern.keyword_led(
+        r'(?:salary|pay|compensation|base salary)', r'.*?(?:starts|is)?.*?(?:at\s*)?',
         r'\$\s?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*'
         r'(per year|annually|/year|/hr|/hour|hourly|weekly|bi-weekly|per week|monthly)',
+    ),
 
-        # Fallback: any dollar amount with commas
-        r'\$\s?(\d{1,3}(?:,\d{3})+(?:\.\d{2})?)',
-    ]
+    # Fallback: any dollar amount with commas
+    SalaryPattern(r'\$\s?(\d{1,3}(?:,\d{3})+(?:\.\d{2})?)'),
+]
+
+# _parse_salary_match helpers
+_K_AMOUNT_RE = re.compile(r'\$\d+\s*K', re.IGNORECASE)
+_DIGIT_RE = re.compile(r'\d')
+_NON_NUMERIC_RE = re.compile(r'[^\d.]')
+
+def extract_salary_info(job_description: str) -> Optional[SalaryInfo]:
+    """
+    Extract comprehensive salary information from job descriptions.
+    Returns SalaryInfo object with parsed details or None if no salary found.
+    """
+    if not job_description:
+        return None
 
-    for pattern in patterns:
-        matches = re.finditer(pattern, job_description, re.IGNORECASE | re.MULTILINE)
+    # One pass for the "$" positions every pattern but the first and fifth needs
+    dollars = [m.start() for m in DOLLAR_RE.finditer(job_description)]
 
-        for match in matches:
+    for pattern in SALARY_PATTERNS:
+        for match in pattern.finditer(job_description, dollars):
             salary_info = _parse_salary_match(match, job_description)
             if salary_info:
                 return salary_info
@@ -112,15 +222,15 @@ def _parse_salary_match(match, job_description: str) -> Optional[SalaryInfo]:
     currency = "USD"  # default
 
     # Check if the pattern was a K-suffix pattern (amounts need *1000)
-    is_k_pattern = bool(re.search(r'\$\d+\s*K', full_match, re.IGNORECASE))
+    is_k_pattern = bool(_K_AMOUNT_RE.search(full_match))
 
     # Extract numeric values and frequency indicators
     for group in groups:
         if group is None:
             continue
-        if re.search(r'\d', group):
+        if _DIGIT_RE.search(group):
             # Handle regular numbers
-            clean_num = re.sub(r'[^\d.]', '', group)
+            clean_num = _NON_NUMERIC_RE.sub('', group)
             if clean_num:
                 try:
                     num_val = float(clean_num)
@@ -214,6 +324,25 @@ def extract_salary(job_description: str) -> Optional[str]:
     salary_info = extract_salary_info(job_description)
     return salary_info.raw_text if salary_info else None
 
+def salary_fields(description: str, salary_text: Optional[str] = None) -> dict:
+    """
+    Raw salary text and its structured parts, as column values.
+
+    A salary given with the job (jsearch, user edits) wins and is parsed on
+    its own; otherwise the salary is extracted from the job description.
+    """
+    if salary_text:
+        info = extract_salary_info(salary_text)
+    else:
+        info = extract_salary_info(description or "")
+    return {
+        "salary": salary_text or (info.raw_text if info else None),
+        "salary_min": info.min_amount if info else None,
+        "salary_max": info.max_amount if info else None,
+        "salary_currency": info.currency if info else None,
+        "salary_frequency": info.frequency if info else None,
+    }
+
 # Test the function with your examples
 if __name__ == "__main__":
     test_cases = [
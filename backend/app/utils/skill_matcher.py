@@ -0,0 +1,127 @@
+# File: backend/app/utils/skill_matcher.py
+# Single-pass skill keyword matcher, compiled once at import time.
+#
+# The old extract_skills_with_frequency ran one re.findall(r"\b<skill>\b") per
+# entry in SKILL_KEYWORDS (~80 full scans of every JD). This module folds every
+# keyword into ONE regex shaped like a prefix trie, so the text is scanned once
+# in C and each position only explores the branches that share its prefix.
+#
+# Counts are identical to the per-keyword \b regexes, including:
+#   • tokens that start/end with a non-word char ("C++", "C#", ".Net", "CI/CD")
+#     — \b next to a symbol means "a word char must be on the other side"
+#   • overlapping keywords ("AI/ML" and "AI" both count the same "ai/ml")
+import re
+from typing import Dict, Iterable, List
+
+from app.config.skills_config import SKILL_KEYWORDS
+
+
+def _is_word_char(ch: str) -> bool:
+    """Same definition of a word character as re's \\w for str patterns."""
+    return ch.isalnum() or ch == "_"
+
+
+def _build_trie_pattern(words: Iterable[str]) -> str:
+    """
+    Build a regex alternation shaped like a prefix trie.
+
+    Each leaf ends with the lookahead that reproduces the trailing \\b of the
+    original per-keyword pattern.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = word
+
+    def build(node: dict) -> str:
+        branches = []
+        for ch, child in sorted(node.items()):
+            if ch == "":
+                continue
+            branches.append(re.escape(ch) + build(child))
+        if "" in node:
+            # \b after a word char = no word char follows; after a symbol = one does
+            branches.append(r"(?!\w)" if _is_word_char(node[""][-1]) else r"(?=\w)")
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return build(trie)
+
+
+class SkillMatcher:
+    """
+    Count whole-keyword occurrences of a fixed skill list in one pass.
+
+    The scan regex is a zero-width lookahead, so finditer reports every position
+    where at least one keyword matches (overlaps included). Each hit is then
+    resolved against the few keywords sharing its first character.
+    """
+
+    def __init__(self, skills: Iterable):
+        # Preserve original key casing/order — callers rely on SKILL_KEYWORDS order
+        self.skills: List[str] = [str(s) for s in skills if s]
+        self._lowered: List[str] = [s.lower() for s in self.skills]
+
+        self._by_first_char: Dict[str, List[int]] = {}
+        for idx, low in enumerate(self._lowered):
+            self._by_first_char.setdefault(low[0], []).append(idx)
+
+        unique = set(self._lowered)
+        word_start = sorted(w for w in unique if _is_word_char(w[0]))
+        symbol_start = sorted(w for w in unique if not _is_word_char(w[0]))
+
+        # \b before a word char = no word char precedes; before a symbol = one does
+        alternatives = []
+        if word_start:
+            alternatives.append(r"(?<!\w)" + _build_trie_pattern(word_start))
+        if symbol_start:
+            alternatives.append(r"(?<=\w)" + _build_trie_pattern(symbol_start))
+
+        self._scan_re = (
+            re.compile("(?=(?:" + "|".join(alternatives) + "))")
+            if alternatives else None
+        )
+
+    def _matches_at(self, text: str, pos: int, keyword: str) -> bool:
+        """True if keyword matches at pos with the same \\b semantics as re."""
+        if not text.startswith(keyword, pos):
+            return False
+        end = pos + len(keyword)
+        word_before = pos > 0 and _is_word_char(text[pos - 1])
+        if word_before == _is_word_char(keyword[0]):
+            return False
+        word_after = end < len(text) and _is_word_char(text[end])
+        return word_after != _is_word_char(keyword[-1])
+
+    def count(self, text_lower: str) -> Dict[str, int]:
+        """
+        Count occurrences of each skill in already-lowercased text.
+
+        Returns {skill: count} for skills found, in skill-list order, matching
+        len(re.findall(r"\\b" + re.escape(skill.lower()) + r"\\b", text_lower)).
+        """
+        if not text_lower or self._scan_re is None:
+            return {}
+
+        counts = [0] * len(self.skills)
+        # findall never overlaps matches of the SAME pattern — track per-skill end
+        last_end = [0] * len(self.skills)
+
+        for m in self._scan_re.finditer(text_lower):
+            pos = m.start()
+            for idx in self._by_first_char.get(text_lower[pos], ()):
+                keyword = self._lowered[idx]
+                if pos >= last_end[idx] and self._matches_at(text_lower, pos, keyword):
+                    counts[idx] += 1
+                    last_end[idx] = pos + len(keyword)
+
+        return {skill: n for skill, n in zip(self.skills, counts) if n > 0}
+
+
+# SKILL_KEYWORDS can be dict (preferred) or list
+SKILL_MATCHER = SkillMatcher(
+    SKILL_KEYWORDS.keys() if isinstance(SKILL_KEYWORDS, dict) else SKILL_KEYWORDS
+)
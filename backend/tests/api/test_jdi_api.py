@@ -1,8 +1,11 @@
 # File: backend/tests/api/test_jdi_api.py
 # API integration tests for JDI candidate feed and actions
+import json
 import pytest
 from datetime import datetime, timezone
 from app.models.jdi_candidate import JDICandidate
+from app.models.jdi_run import JDIRun
+from app.models.jdi_run_event import JDIRunEvent
 from app.models.job import Job
 from app.models.saved_job import SavedJob
 
@@ -246,16 +249,103 @@ class TestPromoteCandidate:
 
 
 class TestRunIngestion:
-    """Tests for POST /api/jdi/run."""
+    """Tests for POST /api/jdi/run and GET /api/jdi/runs/{run_id}."""
 
-    def test_run_no_integration(self, client, test_user):
-        """Run returns gracefully when user has no Gmail integration."""
+    def test_run_is_queued(self, client, test_user):
+        """Run is queued and returned immediately with a run_id."""
         res = client.post(
             f"/api/jdi/run?user_id={test_user.id}",
             json={"window_hours": 24},
         )
-        # Ingestion handles missing integration gracefully
+        assert res.status_code == 202
         data = res.json()
-        assert res.status_code in (200, 500)
-        if res.status_code == 200:
-            assert data["new_candidates"] == 0
+        assert data["status"] == "queued"
+        assert data["deduplicated"] is False
+
+        status = client.get(f"/api/jdi/runs/{data['run_id']}?user_id={test_user.id}")
+        assert status.status_code == 200
+        assert status.json()["status"] == "queued"
+
+    def test_one_active_run_per_user(self, client, test_user):
+        first = client.post(f"/api/jdi/run?user_id={test_user.id}", json={}).json()
+        second = client.post(f"/api/jdi/run?user_id={test_user.id}", json={}).json()
+        assert second["run_id"] == first["run_id"]
+        assert second["deduplicated"] is True
+
+    def test_run_params_stored(self, client, db_session, test_user):
+        data = client.post(f"/api/jdi/run?user_id={test_user.id}", json={"window_hours": 48}).json()
+        run = db_session.get(JDIRun, data["run_id"])
+        assert run.params["window_hours"] == 48
+        assert run.params["force_full_window"] is True
+
+    def test_status_not_found_for_other_user(self, client, test_user):
+        run_id = client.post(f"/api/jdi/run?user_id={test_user.id}", json={}).json()["run_id"]
+        res = client.get(f"/api/jdi/runs/{run_id}?user_id={test_user.id + 1}")
+        assert res.status_code == 404
+
+
+class TestRunEvents:
+    """Tests for the GET /api/jdi/runs/{run_id}/events SSE stream."""
+
+    def _run_with_events(self, db_session, user, events, status="succeeded"):
+        run = JDIRun(user_id=user.id, status=status)
+        db_session.add(run)
+        db_session.flush()
+        for seq, (type_, data) in enumerate(events, start=1):
+            db_session.add(JDIRunEvent(run_id=run.id, seq=seq, type=type_, data=data))
+        db_session.flush()
+        return run
+
+    def _parse(self, body):
+        return [
+            dict(line.split(": ", 1) for line in block.splitlines())
+            for block in body.strip().split("\n\n")
+        ]
+
+    def test_streams_events_until_done(self, client, db_session, test_user):
+        run = self._run_with_events(db_session, test_user, [
+            ("emails_fetched", {"emails_scanned": 2}),
+            ("candidate_created", {"candidate": {"title": "QA Manager"}, "new_candidates": 1}),
+            ("done", {"result": {"new_candidates": 1}}),
+        ])
+        res = client.get(f"/api/jdi/runs/{run.id}/events?user_id={test_user.id}")
+        assert res.status_code == 200
+        assert res.headers["content-type"].startswith("text/event-stream")
+        events = self._parse(res.text)
+        assert [(e["id"], e["event"]) for e in events] == [
+            ("1", "emails_fetched"), ("2", "candidate_created"), ("3", "done"),
+        ]
+        assert json.loads(events[1]["data"])["candidate"]["title"] == "QA Manager"
+
+    def test_resumes_after_last_event_id(self, client, db_session, test_user):
+        run = self._run_with_events(db_session, test_user, [
+            ("emails_fetched", {}), ("cards_parsed", {}), ("done", {}),
+        ])
+        res = client.get(
+            f"/api/jdi/runs/{run.id}/events?user_id={test_user.id}",
+            headers={"Last-Event-ID": "2"},
+        )
+        assert [e["event"] for e in self._parse(res.text)] == ["done"]
+
+    def test_finished_run_without_terminal_event_gets_one(self, client, db_session, test_user):
+        run = self._run_with_events(db_session, test_user, [("emails_fetched", {})], status="failed")
+        run.error = "Run interrupted (worker stopped)"
+        db_session.flush()
+        events = self._parse(client.get(f"/api/jdi/runs/{run.id}/events?user_id={test_user.id}").text)
+        assert [(e["id"], e["event"]) for e in events] == [("1", "emails_fetched"), ("2", "failed")]
+        assert json.loads(events[1]["data"]) == {"error": "Run interrupted (worker stopped)"}
+
+    def test_done_rebuilt_from_succeeded_run(self, client, db_session, test_user):
+        run = self._run_with_events(db_session, test_user, [])
+        run.new_candidates, run.emails_scanned, run.message = 2, 5, "Ingestion complete"
+        db_session.flush()
+        [event] = self._parse(client.get(f"/api/jdi/runs/{run.id}/events?user_id={test_user.id}").text)
+        assert (event["id"], event["event"]) == ("1", "done")
+        assert json.loads(event["data"])["result"] == {
+            "new_candidates": 2, "total_emails_scanned": 5, "message": "Ingestion complete",
+        }
+
+    def test_not_found_for_other_user(self, client, db_session, test_user):
+        run = self._run_with_events(db_session, test_user, [])
+        res = client.get(f"/api/jdi/runs/{run.id}/events?user_id={test_user.id + 1}")
+        assert res.status_code == 404
@@ -1,7 +1,16 @@
 """API tests for job endpoints (parse, analyze, CRUD, save/unsave)."""
 
+import threading
+import time
+from datetime import datetime, timezone
+from unittest.mock import patch
+
 import pytest
 
+from app.models.job import Job
+from app.models.saved_job import SavedJob
+from app.routes import job as job_routes
+
 
 SAMPLE_JD = """
 Senior Software Engineer
@@ -41,6 +50,91 @@ class TestParseJobDescription:
         })
         assert resp.status_code == 400
 
+    def test_extraction_runs_off_the_event_loop(self, client, test_user):
+        started = threading.Event()
+        responses = []
+        extract_skills = job_routes.extract_skills_with_frequency
+
+        def slow_extract_skills(description):
+            started.set()
+            time.sleep(1.0)
+            return extract_skills(description)
+
+        def parse():
+            responses.append(client.post("/parse-job-description", json={
+                "user_id": test_user.id,
+                "job_description": SAMPLE_JD,
+            }))
+
+        with patch.object(job_routes, "extract_skills_with_frequency", side_effect=slow_extract_skills):
+            parser = threading.Thread(target=parse)
+            parser.start()
+            assert started.wait(5)
+            start = time.perf_counter()
+            assert client.get("/").status_code == 200
+            elapsed = time.perf_counter() - start
+            parser.join()
+
+        assert elapsed < 0.5
+        assert responses[0].status_code == 200
+
+
+class TestParseJobDescriptionsBatch:
+    def test_batch_saves_each_job(self, client, test_user, db_session):
+        from app.models.job import Job
+
+        resp = client.post("/parse-job-descriptions/batch", json={
+            "user_id": test_user.id,
+            "jobs": [
+                {"job_description": SAMPLE_JD, "job_link": "https://example.com/jobs/1"},
+                {"job_description": "Staff Data Engineer\n\nWe need Python, SQL and Kafka."},
+            ],
+        })
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["saved"] == 2 and data["failed"] == 0
+        first, second = data["results"]
+        assert [first["index"], second["index"]] == [0, 1]
+        assert first["error"] is None and first["title"].startswith("Senior Software Engineer")
+        job = db_session.get(Job, first["job_id"])
+        assert job.job_link == "https://example.com/jobs/1"
+        assert job.user_id == test_user.id
+        assert db_session.get(Job, second["job_id"]).job_link == "N/A"
+
+    def test_matches_single_parse(self, client, test_user):
+        single = client.post("/parse-job-description", json={
+            "user_id": test_user.id, "job_description": SAMPLE_JD,
+        }).json()
+        (item,) = client.post("/parse-job-descriptions/batch", json={
+            "user_id": test_user.id, "jobs": [{"job_description": SAMPLE_JD}],
+        }).json()["results"]
+        for field in ("title", "company_name", "skills", "experience", "location", "salary"):
+            assert item[field] == single[field]
+
+    def test_per_item_errors(self, client, test_user):
+        resp = client.post("/parse-job-descriptions/batch", json={
+            "user_id": test_user.id,
+            "jobs": [{"job_link": "https://example.com/jobs/2"}, {"job_description": SAMPLE_JD}, {"job_description": "  "}],
+        })
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["saved"] == 1 and data["failed"] == 2
+        errors = [r["error"] for r in data["results"]]
+        assert errors[0] and errors[1] is None and errors[2]
+        assert data["results"][0]["job_id"] is None and data["results"][1]["job_id"] > 0
+
+    def test_empty_batch(self, client, test_user):
+        resp = client.post("/parse-job-descriptions/batch", json={"user_id": test_user.id, "jobs": []})
+        assert resp.status_code == 400
+
+    def test_batch_too_large(self, client, test_user):
+        from app.routes.job import JD_BATCH_MAX
+
+        resp = client.post("/parse-job-descriptions/batch", json={
+            "user_id": test_user.id, "jobs": [{"job_description": "x"}] * (JD_BATCH_MAX + 1),
+        })
+        assert resp.status_code == 400
+
 
 class TestAnalyzeSearchedJob:
     def test_analyze_success(self, client, test_user):
@@ -88,6 +182,19 @@ class TestJobCRUD:
         })
         assert resp.status_code == 200
 
+    def test_cleared_salary_not_re_extracted(self, client, test_job, db_session):
+        test_job.job_description += " Salary: $120,000 - $150,000 per year."
+        client.put(f"/jobs/{test_job.id}", json={"salary": "$120,000 - $150,000"})
+        db_session.expire_all()
+        assert db_session.get(Job, test_job.id).salary_min == 120000
+
+        resp = client.put(f"/jobs/{test_job.id}", json={"salary": ""})
+        assert resp.status_code == 200
+        db_session.expire_all()
+        job = db_session.get(Job, test_job.id)
+        assert job.salary is None
+        assert (job.salary_min, job.salary_max, job.salary_currency, job.salary_frequency) == (None,) * 4
+
     def test_get_jobs_by_user_empty(self, client, test_user):
         # Use a user_id that has no jobs
         resp = client.get("/jobs/by-user/999999")
@@ -171,3 +278,43 @@ class TestSaveUnsaveJob:
         resp = client.get(f"/saved-jobs/{test_user.id}")
         assert resp.status_code == 200
         assert isinstance(resp.json(), list)
+
+    def test_saved_job_salary_extracted_once_at_save(self, client, test_user):
+        from unittest.mock import patch
+
+        client.post("/save-job", json={
+            "user_id": test_user.id,
+            "job": {
+                "job_id": "precompute-321",
+                "job_title": "Platform Engineer",
+                "employer_name": "InfraCo",
+                "job_location": None,
+                "job_google_link": "https://google.com/jobs/321",
+                "job_posted_at_datetime_utc": "2025-01-15T10:00:00Z",
+                "employer_logo": None,
+                "employer_website": None,
+                "job_is_remote": False,
+                "job_employment_type": "Full-time",
+                "job_salary": None,
+                "job_description": "Platform role using Python and Terraform. Salary: $120,000 - $150,000 per year.",
+            },
+        })
+        with patch("app.utils.salary_extractor.extract_salary_info") as extract:
+            resp = client.get(f"/saved-jobs/{test_user.id}")
+        extract.assert_not_called()
+        (saved,) = [j for j in resp.json() if j["search_id"] == "precompute-321"]
+        assert saved["job_salary"]
+        assert (saved["salary_min"], saved["salary_max"]) == (120000, 150000)
+        assert saved["salary_frequency"] == "annual"
+
+    def test_unextracted_saved_job_salary_extracted_on_read(self, client, test_user, db_session):
+        # A row saved before write-time extraction, not backfilled yet
+        db_session.add(SavedJob(
+            user_id=test_user.id, search_id="legacy-1", job_title="Engineer", employer_name="Co",
+            job_apply_link="https://example.com", job_posted_at=datetime.now(timezone.utc),
+            job_description="Salary: $120,000 - $150,000 per year.",
+        ))
+        db_session.flush()
+        (saved,) = [j for j in client.get(f"/saved-jobs/{test_user.id}").json() if j["search_id"] == "legacy-1"]
+        assert saved["job_salary"]
+        assert (saved["salary_min"], saved["salary_max"]) == (120000, 150000)
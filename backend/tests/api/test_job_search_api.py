@@ -0,0 +1,42 @@
+"""API tests for the /search-jobs jsearch proxy."""
+
+import pytest
+
+from app.services import jsearch_client
+from app.services.jsearch_client import search_cache
+
+
+@pytest.fixture()
+def upstream(monkeypatch):
+    calls = []
+
+    async def fake_fetch(query, params):
+        calls.append(query)
+        if query == "boom":
+            raise RuntimeError("jsearch unavailable")
+        return [{"job_id": "j1", "search_id": "j1", "job_title": f"{query} role"}]
+
+    monkeypatch.setattr(jsearch_client, "fetch_jobs", fake_fetch)
+    search_cache.clear()
+    yield calls
+    search_cache.clear()
+
+
+class TestSearchJobs:
+    def test_returns_results(self, client, upstream):
+        resp = client.get("/search-jobs", params={"query": "QA Lead"})
+        assert resp.status_code == 200
+        assert resp.json() == {
+            "status": "OK",
+            "results": [{"job_id": "j1", "search_id": "j1", "job_title": "QA Lead role"}],
+        }
+
+    def test_repeat_query_hits_cache(self, client, upstream):
+        client.get("/search-jobs", params={"query": "QA Lead"})
+        client.get("/search-jobs", params={"query": "qa lead"})
+        assert upstream == ["QA Lead"]
+
+    def test_upstream_error_is_500(self, client, upstream):
+        resp = client.get("/search-jobs", params={"query": "boom"})
+        assert resp.status_code == 500
+        assert "jsearch unavailable" in resp.json()["error"]
@@ -2,8 +2,14 @@
 
 import io
 import os
+import threading
+import time
+from unittest.mock import patch
+
 import pytest
 
+from app.routes import resume as resume_routes
+
 
 class TestUploadResume:
     def test_upload_txt(self, client, test_user):
@@ -46,6 +52,36 @@ class TestUploadResume:
         data = resp2.json()
         assert data.get("status") == "duplicate"
 
+    def test_slow_upload_does_not_block_other_requests(self, client, test_user):
+        """Extraction runs in the threadpool: other requests are served meanwhile."""
+        started = threading.Event()
+        responses = []
+
+        def slow_extract(file_path):
+            started.set()
+            time.sleep(1.0)
+            return "John Doe\nSkills: Python, AWS"
+
+        def upload():
+            responses.append(client.post(
+                "/upload-resume",
+                data={"user_id": str(test_user.id), "resume_name": "slow_resume.txt"},
+                files={"file": ("slow_resume.txt", io.BytesIO(b"John Doe"), "text/plain")},
+            ))
+
+        with patch.object(resume_routes, "extract_text_from_file", side_effect=slow_extract):
+            uploader = threading.Thread(target=upload)
+            uploader.start()
+            assert started.wait(5)
+            start = time.perf_counter()
+            assert client.get("/").status_code == 200
+            elapsed = time.perf_counter() - start
+            uploader.join()
+
+        assert elapsed < 0.5
+        assert responses[0].status_code == 200
+        os.remove(responses[0].json()["file_path"])
+
 
 class TestGetResumes:
     def test_get_resumes_by_user(self, client, test_user, test_resume):
@@ -0,0 +1,97 @@
+# File: backend/tests/benchmarks/bench_email_parser.py
+# Benchmark parse_job_cards on large digest emails, per HTML parser backend.
+#
+# Run from backend/:  python -m tests.benchmarks.bench_email_parser [--cards 150]
+#
+# "legacy" = html.parser + get_text() per ancestor (the pre-TextLengthIndex path).
+import argparse
+import time
+from unittest.mock import patch
+
+from app.services.jdi import email_parser, html_backend
+
+
+def linkedin_digest(n_cards: int, depth: int = 8) -> str:
+    """LinkedIn-style digest: every card sits inside `depth` nested layout tables."""
+    open_tables = "<table><tr><td>" * depth
+    close_tables = "</td></tr></table>" * depth
+    cards = []
+    for i in range(n_cards):
+        cards.append(
+            f"""<tr><td>{open_tables}
+              <table><tr><td>
+                <a href="https://www.linkedin.com/comm/jobs/view/{1000000 + i}?trk=eml">
+                  Senior QA Manager {i}
+                </a>
+              </td></tr>
+              <tr><td>Company {i} · Vancouver, BC (Hybrid)</td></tr>
+              <tr><td>$120,000 - $150,000/yr</td></tr>
+              <tr><td>Lead a team of test engineers across web and mobile releases.</td></tr>
+              </table>
+            {close_tables}</td></tr>"""
+        )
+    return (
+        "<html><body>" + open_tables + "<table>" + "".join(cards) + "</table>"
+        + close_tables
+        + '<a href="https://www.linkedin.com/jobs/search">See all jobs</a></body></html>'
+    )
+
+
+def flat_digest(n_cards: int) -> str:
+    """Aggregator-style digest: every card is inline in ONE cell (no per-card container)."""
+    cards = []
+    for i in range(n_cards):
+        cards.append(
+            f"""<a href="https://www.linkedin.com/comm/jobs/view/{2000000 + i}">Director of QA {i}</a><br>
+            Company {i} · Toronto, ON<br>$140K - $170K<br>"""
+        )
+    return "<html><body><table><tr><td>" + "".join(cards) + "</td></tr></table></body></html>"
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cards", type=int, default=150)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, html in (
+        ("nested-table digest", linkedin_digest(args.cards)),
+        ("flat digest", flat_digest(args.cards)),
+    ):
+        print(f"{name}: {args.cards} cards, {len(html) / 1024:.0f} KiB")
+        _bench(html, args.repeat)
+
+
+def _bench(html: str, repeat: int):
+    def run(backend, legacy=False):
+        with patch.object(html_backend, "HTML_PARSER", backend):
+            if legacy:
+                with patch.object(email_parser, "TextLengthIndex", lambda soup: None):
+                    return email_parser.parse_job_cards(html, "linkedin")
+            return email_parser.parse_job_cards(html, "linkedin")
+
+    baseline = run("html.parser", legacy=True)
+    modes = [("legacy", "html.parser", True), ("html.parser", "html.parser", False)]
+    try:
+        import lxml  # noqa: F401
+        modes.append(("lxml", "lxml", False))
+    except ImportError:
+        print("lxml not installed — skipping lxml backend")
+
+    for label, backend, legacy in modes:
+        assert run(backend, legacy) == baseline, f"{label} cards differ from legacy output"
+        seconds = _time(lambda: run(backend, legacy), repeat)
+        print(f"{label:12s} {seconds * 1000:8.1f} ms  ({len(baseline)} cards)")
+
+
+if __name__ == "__main__":
+    main()
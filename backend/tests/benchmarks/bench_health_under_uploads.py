@@ -0,0 +1,214 @@
+# File: backend/tests/benchmarks/bench_health_under_uploads.py
+# Load test: /health latency while resumes are being uploaded concurrently.
+#
+# Run from backend/:  python -m tests.benchmarks.bench_health_under_uploads [--uploaders 4] [--seconds 10] [--pages 5]
+#
+# The real app is served by uvicorn (one worker, one event loop) on a local
+# port. Uploaders post a multi-page PDF resume in a loop while a prober calls
+# GET /health every 20ms. "legacy" is the old upload_resume: an async def that
+# ran pdfplumber and ATS scoring directly on the event loop, so every request
+# on the worker — /health included — queued behind each upload. "current" is
+# /upload-resume as shipped (plain def, run in the threadpool). The DB is
+# stubbed out (in-memory SQLite for the /health ping, a no-op session for the
+# upload) so the numbers measure scheduling, not Postgres.
+import argparse
+import logging
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+import uuid
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-bench")
+os.environ.setdefault("JDI_RUN_WORKERS", "0")
+os.environ.setdefault("JDI_SCHEDULER_ENABLED", "false")
+
+import httpx
+import uvicorn
+from fastapi import File, Form, UploadFile
+from sqlalchemy import create_engine
+
+from app import main as app_main
+from app.routes import resume as resume_routes
+from app.services.score_calc import calculate_scores
+
+RESUME_LINES = [
+    "Jane Doe - Senior QA Engineer - jane.doe@example.com - Toronto, ON",
+    "Experience: led test automation with Python, Selenium, Playwright and pytest",
+    "Built CI/CD pipelines on GitHub Actions, Jenkins, Docker and Kubernetes",
+    "Owned release quality for payment APIs; mentored 6 engineers in test strategy",
+    "Skills: Python, Java, SQL, PostgreSQL, AWS, REST, performance testing, JMeter",
+]
+
+
+def resume_pdf(pages: int, lines_per_page: int = 40) -> bytes:
+    """A minimal text PDF (Helvetica, one content stream per page) for pdfplumber to parse."""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None,
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for page in range(pages):
+        text = [b"BT /F1 10 Tf 50 760 Td 12 TL"]
+        for i in range(lines_per_page):
+            line = RESUME_LINES[(page + i) % len(RESUME_LINES)]
+            text.append(b"(" + line.encode("latin-1") + b") Tj T*")
+        text.append(b"ET")
+        stream = b"\n".join(text)
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), pages)
+
+    out, offsets = bytearray(b"%PDF-1.4\n"), []
+    for n, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (n, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % off for off in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+class _NoDBSession:
+    """Just enough Session for upload_resume: no duplicates, ids handed out on refresh."""
+
+    def __init__(self):
+        self._next_id = 0
+
+    def query(self, *args):
+        return self
+
+    def filter(self, *args):
+        return self
+
+    def first(self):
+        return None
+
+    def add(self, obj):
+        pass
+
+    def commit(self):
+        pass
+
+    def refresh(self, obj):
+        self._next_id += 1
+        obj.id = self._next_id
+
+
+@app_main.app.post("/bench/legacy-upload-resume")
+async def legacy_upload_resume(user_id: int = Form(...), file: UploadFile = File(...)):
+    # The pre-threadpool handler body: blocking extraction and scoring on the event loop
+    file_path = os.path.join(resume_routes.UPLOAD_DIR, f"{uuid.uuid4()}_{file.filename}")
+    with open(file_path, "wb") as f:
+        f.write(await file.read())
+    extracted_text = resume_routes.extract_text_from_file(file_path)
+    formatting_score, _, _ = calculate_scores(extracted_text)
+    return {"resume_id": 0, "ats_score_initial": formatting_score}
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _percentile(samples: list, q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def run_load(base_url: str, path: str, pdf: bytes, uploaders: int, seconds: float) -> dict:
+    stop = threading.Event()
+    health_ms, upload_ms, errors = [], [], []
+
+    def upload_loop():
+        with httpx.Client(base_url=base_url, timeout=120) as http:
+            while not stop.is_set():
+                start = time.perf_counter()
+                resp = http.post(path, data={"user_id": "1"},
+                                 files={"file": ("resume.pdf", pdf, "application/pdf")})
+                upload_ms.append((time.perf_counter() - start) * 1000)
+                if resp.status_code != 200:
+                    errors.append(resp.status_code)
+
+    def probe_loop():
+        with httpx.Client(base_url=base_url, timeout=120) as http:
+            while not stop.is_set():
+                start = time.perf_counter()
+                http.get("/health").raise_for_status()
+                health_ms.append((time.perf_counter() - start) * 1000)
+                time.sleep(0.02)
+
+    threads = [threading.Thread(target=upload_loop) for _ in range(uploaders)]
+    threads.append(threading.Thread(target=probe_loop))
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    assert not errors, f"{path}: upload errors {errors[:5]}"
+    return {
+        "health_p50": _percentile(health_ms, 0.50),
+        "health_p99": _percentile(health_ms, 0.99),
+        "health_max": max(health_ms),
+        "health_n": len(health_ms),
+        "uploads": len(upload_ms),
+        "upload_p50": _percentile(upload_ms, 0.50) if upload_ms else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--uploaders", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--pages", type=int, default=5)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)  # app.main logs every request at DEBUG
+    upload_dir = tempfile.mkdtemp(prefix="bench_uploads_")
+    resume_routes.UPLOAD_DIR = upload_dir
+    app_main.engine = create_engine("sqlite://")
+    app_main.app.dependency_overrides[resume_routes.get_db] = _NoDBSession
+
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(app_main.app, host="127.0.0.1", port=port, log_level="warning"))
+    server_thread = threading.Thread(target=server.run, daemon=True)
+    server_thread.start()
+    while not server.started:
+        time.sleep(0.05)
+
+    pdf = resume_pdf(args.pages)
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        with httpx.Client(base_url=base_url) as http:
+            idle = []
+            for _ in range(50):
+                start = time.perf_counter()
+                http.get("/health").raise_for_status()
+                idle.append((time.perf_counter() - start) * 1000)
+        print(f"{args.pages}-page PDF ({len(pdf) // 1024} KB), {args.uploaders} uploaders, {args.seconds:.0f}s per run")
+        print(f"idle /health: p50 {_percentile(idle, 0.5):.1f}ms  p99 {_percentile(idle, 0.99):.1f}ms\n")
+
+        print(f"{'':10}{'health p50':>12}{'health p99':>12}{'health max':>12}{'probes':>8}{'uploads':>9}{'upload p50':>12}")
+        for name, path in (("legacy", "/bench/legacy-upload-resume"), ("current", "/upload-resume")):
+            r = run_load(base_url, path, pdf, args.uploaders, args.seconds)
+            print(
+                f"{name:10}{r['health_p50']:>10.1f}ms{r['health_p99']:>10.1f}ms{r['health_max']:>10.1f}ms"
+                f"{r['health_n']:>8}{r['uploads']:>9}{r['upload_p50']:>10.1f}ms"
+            )
+    finally:
+        server.should_exit = True
+        server_thread.join()
+        app_main.app.dependency_overrides.clear()
+        shutil.rmtree(upload_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+# File: backend/tests/benchmarks/bench_job_extraction.py
+# Benchmark job_extraction on the gold JDs: precompiled patterns vs inline regexes,
+# and anchored vs exhaustive title windows (per-JD latency).
+#
+# Run from backend/:  python -m tests.benchmarks.bench_job_extraction [--repeat 3]
+#
+# "legacy" swaps in the pre-extraction_patterns helpers (per-word \b regexes,
+# inline title-cleaning patterns, one regex per known company) so both sides
+# run the same extraction logic. "exhaustive" swaps in the old window scan
+# (every 2-10 word window) for the anchored _title_windows.
+import argparse
+import csv
+import re
+import statistics
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from app.utils import extraction_patterns, job_extraction
+
+GOLD_CSV = Path(__file__).parent.parent / "unit" / "gold_jobs_latest.csv"
+
+
+def legacy_has_title_role_word(text: str) -> bool:
+    text_lower = text.lower()
+    for word in job_extraction.TITLE_MUST_HAVE_WORDS:
+        if re.search(r'\b' + re.escape(word) + r'\b', text_lower):
+            return True
+    return False
+
+
+def legacy_clean_title_output(title: str) -> str:
+    if not title:
+        return ""
+    title = re.sub(r"(?i)^(as a|as an|as|as the|and|an|a|the|experienced|hands-on|visionary|dynamic|talented|seasoned|successful|highly motivated|detail-oriented|strategic)\s+", "", title.strip())
+    if re.search(r",?\s+you['â€™\s]*(will|ll|are)", title, re.IGNORECASE):
+        title = re.split(r",?\s+you['â€™\s]*(will|ll|are)", title, flags=re.IGNORECASE)[0]
+    if re.search(r"\s+to\s+(lead|join|build|drive|shape|define|help|partner)", title, re.IGNORECASE):
+        title = re.split(r"\s+to\s+(lead|join|build|drive|shape|define|help|partner)", title, flags=re.IGNORECASE)[0]
+    if re.search(r"\s+for\s+(our|the)\s", title, re.IGNORECASE):
+        title = re.split(r"\s+for\s+(our|the)\s", title, flags=re.IGNORECASE)[0]
+    if re.search(r"\s+with\s+(consulting|experience|deep|strong|extensive|proven|excellent|a focus)", title, re.IGNORECASE):
+        title = re.split(r"\s+with\s+(consulting|experience|deep|strong|extensive|proven|excellent|a focus)", title, flags=re.IGNORECASE)[0]
+    if re.search(r"\s+focused\s+on", title, re.IGNORECASE):
+        title = re.split(r"\s+focused\s+on", title, flags=re.IGNORECASE)[0]
+    if re.search(r"\s+is\s+a\s+(senior)?", title, re.IGNORECASE):
+        title = re.split(r"\s+is\s+a", title, flags=re.IGNORECASE)[0]
+    title = re.split(r"\s+[Aa]t\s+", title)[0]
+    title = re.sub(r"\s*\((remote|hybrid|on[-\s]?site|onsite).*?\)\s*$", "", title, flags=re.IGNORECASE)
+    title = re.split(r"[\(\|]", title)[0]
+    title = re.split(r"\s+[—–-]\s+", title)[0]
+    title = title.strip().strip(',').strip(':').strip('.')
+    title = re.split(r'\s+(for|to|will|you will|you\'ll|for our|to| is a senior|offers|specializes)', title)[0].strip()
+    return re.sub(r"\s+", " ", title.strip())
+
+
+def legacy_known_company(text: str, known_companies: list) -> str | None:
+    for co in sorted(known_companies, key=len, reverse=True):
+        if isinstance(co, str) and len(co) > 2:
+            if re.search(r'\b' + re.escape(co) + r'\b', text[:2000], re.IGNORECASE):
+                return co
+    return None
+
+
+def exhaustive_title_windows(words: list[str]):
+    for window_size in range(10, 1, -1):
+        for i in range(len(words) - window_size + 1):
+            yield i, window_size
+
+
+def load_gold() -> tuple[list[str], list[str]]:
+    csv.field_size_limit(10 ** 8)
+    with GOLD_CSV.open("r", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    jds = [r["job_description"] for r in rows if r.get("job_description")]
+    known = sorted({r["company_name"] for r in rows if r.get("company_name")})
+    return jds, known
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _per_jd_ms(fn, jds: list[str], repeat: int) -> list[float]:
+    """Best-of-`repeat` latency of fn(jd) for each JD, in ms."""
+    latencies = []
+    for jd in jds:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn(jd)
+            best = min(best, time.perf_counter() - start)
+        latencies.append(best * 1000)
+    return latencies
+
+
+def _summary(latencies: list[float]) -> dict:
+    ordered = sorted(latencies)
+    return {
+        "p50": statistics.median(ordered),
+        "p95": ordered[int(0.95 * (len(ordered) - 1))],
+        "max": ordered[-1],
+        "total": sum(ordered),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    jds, known = load_gold()
+    print(f"{len(jds)} JDs from {GOLD_CSV.name}, {len(known)} known companies\n")
+
+    def titles():
+        return [job_extraction.extract_title(jd) for jd in jds]
+
+    def companies():
+        return [job_extraction.extract_company_name(jd) for jd in jds]
+
+    def known_lookup():
+        matcher = extraction_patterns.known_company_matcher(tuple(known))
+        return [matcher.find(jd[:2000]) for jd in jds]
+
+    def legacy_known_lookup():
+        return [legacy_known_company(jd, known) for jd in jds]
+
+    with patch.object(job_extraction, "_has_title_role_word", legacy_has_title_role_word), \
+         patch.object(job_extraction, "_clean_title_output", legacy_clean_title_output):
+        legacy = {"extract_title": _time(titles, args.repeat), "extract_company_name": _time(companies, args.repeat)}
+        legacy_titles = titles()
+    legacy["known-company lookup"] = _time(legacy_known_lookup, args.repeat)
+
+    current = {
+        "extract_title": _time(titles, args.repeat),
+        "extract_company_name": _time(companies, args.repeat),
+        "known-company lookup": _time(known_lookup, args.repeat),
+    }
+    assert titles() == legacy_titles, "title output changed"
+    assert known_lookup() == legacy_known_lookup(), "known-company output changed"
+
+    print(f"{'':24}{'legacy':>12}{'compiled':>12}{'speedup':>10}")
+    for name in current:
+        print(
+            f"{name:24}{legacy[name] * 1000:>10.1f}ms{current[name] * 1000:>10.1f}ms"
+            f"{legacy[name] / current[name]:>9.1f}x"
+        )
+
+    with patch.object(job_extraction, "_title_windows", exhaustive_title_windows):
+        exhaustive_titles = titles()
+        exhaustive = _summary(_per_jd_ms(job_extraction.extract_title, jds, args.repeat))
+    anchored = _summary(_per_jd_ms(job_extraction.extract_title, jds, args.repeat))
+    assert titles() == exhaustive_titles, "anchored windows changed title output"
+
+    print(f"\nextract_title per JD{'exhaustive':>16}{'anchored':>12}{'speedup':>10}")
+    for name in anchored:
+        print(
+            f"{name:20}{exhaustive[name]:>14.2f}ms{anchored[name]:>10.2f}ms"
+            f"{exhaustive[name] / anchored[name]:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# File: backend/tests/benchmarks/bench_salary_extractor.py
+# Benchmark extract_salary_info: inline re.finditer loop vs compiled, "$"-anchored SalaryPatterns.
+#
+# Run from backend/:  python -m tests.benchmarks.bench_salary_extractor [--repeat 3]
+#
+# "legacy" is the old loop: every pattern through re.finditer over the whole
+# JD. The worst cases are long JDs full of "pay"/"rate"/"is" and "$" amounts,
+# where the keyword-led ".*?" patterns backtrack over whole lines.
+import argparse
+import csv
+import re
+import time
+from pathlib import Path
+
+from app.utils import salary_extractor
+from app.utils.salary_extractor import SALARY_PATTERNS, extract_salary_info
+
+UNIT_DIR = Path(__file__).parent.parent / "unit"
+
+FILLER = (
+    "Our corporate payroll team is paying attention to this rate of growth; it is accurate and "
+    "it is a great range of benefits, e.g. a $5 lunch credit and $20 gym pass. "
+)
+
+
+def legacy_extract_salary_info(job_description: str):
+    if not job_description:
+        return None
+    for pattern in [p.regex.pattern for p in SALARY_PATTERNS]:
+        for match in re.finditer(pattern, job_description, re.IGNORECASE | re.MULTILINE):
+            salary_info = salary_extractor._parse_salary_match(match, job_description)
+            if salary_info:
+                return salary_info
+    return None
+
+
+def load_gold() -> list[str]:
+    csv.field_size_limit(10 ** 8)
+    jds = []
+    for path in sorted(UNIT_DIR.glob("gold_jobs*.csv")):
+        with path.open("r", encoding="utf-8") as f:
+            jds += [r["job_description"] for r in csv.DictReader(f) if r.get("job_description")]
+    return jds
+
+
+def worst_cases() -> dict[str, str]:
+    return {
+        # One long line (HTML-derived JDs often have no newlines), salary at the very end
+        "single line, salary last": FILLER * 40 + "Salary: $140,000 - $180,000 per year",
+        # Same line, no valid salary anywhere: every keyword is tried and fails
+        "single line, no salary": FILLER * 40,
+        # Many short lines, each with keywords and stray "$"
+        "multi-line, no salary": "\n".join([FILLER] * 300),
+        "no dollar sign": "\n".join([FILLER.replace("$", "")] * 300),
+    }
+
+
+def _time(fn, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _same(a, b) -> bool:
+    return (a and vars(a)) == (b and vars(b))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    jds = load_gold()
+    cases = {"gold corpus": jds, **{name: [text] for name, text in worst_cases().items()}}
+    print(f"{len(jds)} gold JDs from {UNIT_DIR.name}/gold_jobs*.csv\n")
+
+    print(f"{'':28}{'chars':>9}{'legacy':>12}{'compiled':>12}{'speedup':>10}")
+    for name, texts in cases.items():
+        legacy, expected = _time(lambda: [legacy_extract_salary_info(t) for t in texts], args.repeat)
+        current, got = _time(lambda: [extract_salary_info(t) for t in texts], args.repeat)
+        assert all(_same(a, b) for a, b in zip(expected, got)), f"{name}: output changed"
+        chars = sum(len(t) for t in texts)
+        print(f"{name:28}{chars:>9}{legacy * 1000:>10.1f}ms{current * 1000:>10.1f}ms{legacy / current:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
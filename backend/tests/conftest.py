@@ -13,6 +13,9 @@ from datetime import datetime, timezone
 # Set dummy env vars BEFORE importing app (OpenAI client initializes at import time)
 os.environ.setdefault("OPENAI_API_KEY", "sk-test-dummy-key-for-testing")
 os.environ.setdefault("RAPIDAPI_KEY", "test-dummy-rapidapi-key")
+os.environ.setdefault("JDI_RUN_WORKERS", "0")  # runs are executed explicitly in tests
+os.environ.setdefault("JDI_SCHEDULER_ENABLED", "false")  # scheduler ticks are called explicitly in tests
+os.environ.setdefault("JD_PARSE_WORKERS", "0")  # batch JD parsing runs in-process in tests
 os.environ.setdefault("JDI_ENCRYPTION_KEY", "8lE8cmIAZvhh_cDkVAJUhec8r-xpvfR6r9qj6heemTs=")  # dummy Fernet key for tests
 
 from sqlalchemy import create_engine
@@ -0,0 +1,286 @@
+# File: backend/tests/unit/test_async_fetcher.py
+# Tests for the concurrent JD fetch stage, against a local HTTP stub server
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from app.models.jdi_page_cache import JDIPageCache
+from app.models.jdi_host_policy import JDIHostPolicy
+from app.services.jdi.async_fetcher import JDFetcher, fetch_jd_texts
+from app.services.jdi.host_policy import HOST_BLOCK_THRESHOLD, load_email_only_hosts
+from app.services.jdi.link_extractor import resolved_url_cache
+from app.services.jdi.page_cache import JD_NEGATIVE_CACHE_TTL, load_cached_pages
+from app.services.jdi.resolved_urls import load_resolved_urls
+
+JD_HTML = (
+    "<html><body><div class='job-description'>"
+    + "Lead the QA team, own test strategy, automation and release quality. " * 5
+    + "</div></body></html>"
+)
+
+
+class _StubJobSite(BaseHTTPRequestHandler):
+    """
+    /job/<n> JD page (ETag "v1", 304 on If-None-Match), /slow/<n> JD page after
+    a delay, /go/<n> 302 → /job/<n>, /wall/<n> 302 → /login, /blocked[/<n>] 403,
+    /limited 429, /error 500, else 404.
+    """
+    delay = 0.2
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+    paths: list = []
+    conditional: list = []
+
+    def _serve(self, body: bool):
+        cls = type(self)
+        with cls.lock:
+            cls.paths.append((self.command, self.path))
+            cls.conditional.append(self.headers.get("If-None-Match"))
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        try:
+            if self.path.startswith("/slow/"):
+                time.sleep(cls.delay)
+            if self.path.startswith(("/go/", "/wall/")):
+                target = "/login" if self.path.startswith("/wall/") else "/job/" + self.path.rsplit("/", 1)[-1]
+                self.send_response(302)
+                self.send_header("Location", target)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            if self.path.startswith(("/blocked", "/limited", "/error")):
+                self.send_error(
+                    403 if self.path.startswith("/blocked") else 429 if self.path.startswith("/limited") else 500
+                )
+                return
+            if self.path == "/login":
+                page = b"<html><body><form>Sign in to continue</form></body></html>"
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(page)))
+                self.end_headers()
+                self.wfile.write(page if body else b"")
+                return
+            if not self.path.startswith(("/job/", "/slow/")):
+                self.send_error(404)
+                return
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.send_header("ETag", '"v1"')
+                self.end_headers()
+                return
+            data = JD_HTML.encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            if body:
+                self.wfile.write(data)
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def do_GET(self):
+        self._serve(body=True)
+
+    def do_HEAD(self):
+        self._serve(body=False)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def stub_site():
+    _StubJobSite.in_flight = _StubJobSite.max_in_flight = 0
+    _StubJobSite.paths = []
+    _StubJobSite.conditional = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubJobSite)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+    resolved_url_cache.clear()
+
+
+class TestFetchJdTexts:
+
+    def test_fetches_and_extracts(self, stub_site):
+        results = fetch_jd_texts({f"{stub_site}/job/1": "other"})
+        text, confidence = results[f"{stub_site}/job/1"]
+        assert text.startswith("Lead the QA team")
+        assert confidence == 70  # generic description-class match
+
+    def test_follows_redirects(self, stub_site):
+        results = fetch_jd_texts({f"{stub_site}/go/7": "other"})
+        assert results[f"{stub_site}/go/7"][0]
+        assert ("GET", "/job/7") in _StubJobSite.paths
+
+    def test_failures_map_to_no_jd(self, stub_site):
+        results = fetch_jd_texts({
+            f"{stub_site}/missing": "other",
+            "http://127.0.0.1:9/job/1": "other",  # nothing listening
+        })
+        assert set(results.values()) == {(None, 0)}
+
+    def test_pages_fetched_concurrently(self, stub_site):
+        urls = {f"{stub_site}/slow/{n}": "other" for n in range(8)}
+        start = time.perf_counter()
+        results = fetch_jd_texts(urls, per_host=8)
+        elapsed = time.perf_counter() - start
+        assert all(text for text, _ in results.values())
+        # 8 × (HEAD + GET) × 0.2s serially would be 3.2s
+        assert elapsed < 1.5
+        assert _StubJobSite.max_in_flight > 1
+
+    def test_per_host_cap(self, stub_site):
+        urls = {f"{stub_site}/slow/{n}": "other" for n in range(6)}
+        fetch_jd_texts(urls, per_host=2)
+        assert _StubJobSite.max_in_flight == 2
+
+    def test_timeout_does_not_stall_other_pages(self, stub_site):
+        _StubJobSite.delay = 1.0
+        try:
+            results = fetch_jd_texts(
+                {f"{stub_site}/slow/1": "other", f"{stub_site}/job/2": "other"},
+                timeout=httpx.Timeout(0.3),
+            )
+        finally:
+            _StubJobSite.delay = 0.2
+        assert results[f"{stub_site}/slow/1"] == (None, 0)
+        assert results[f"{stub_site}/job/2"][0]
+
+    def test_stage_deadline_cancels_stragglers(self, stub_site):
+        results = fetch_jd_texts({f"{stub_site}/slow/1": "other"}, deadline=0.05)
+        assert results == {f"{stub_site}/slow/1": (None, 0)}
+
+    def test_empty(self):
+        assert fetch_jd_texts({}) == {}
+
+
+class TestPageCache:
+
+    def _gets(self):
+        return [path for method, path in _StubJobSite.paths if method == "GET"]
+
+    def test_fresh_entry_served_without_request(self, stub_site, db_session):
+        url = f"{stub_site}/job/1"
+        first = fetch_jd_texts({url: "other"}, db=db_session)
+        second = fetch_jd_texts({url: "other"}, db=db_session)
+        assert second == first and first[url][0]
+        assert self._gets() == ["/job/1"]
+
+    def test_keyed_by_resolved_url(self, stub_site, db_session):
+        fetch_jd_texts({f"{stub_site}/go/3": "other"}, db=db_session)
+        assert set(load_cached_pages(db_session, [f"{stub_site}/job/3"])) == {f"{stub_site}/job/3"}
+        fetch_jd_texts({f"{stub_site}/job/3": "other"}, db=db_session)
+        assert self._gets() == ["/job/3"]
+
+    def test_stale_entry_revalidated_with_304(self, stub_site, db_session):
+        url = f"{stub_site}/job/1"
+        first = fetch_jd_texts({url: "other"}, db=db_session)
+        row = db_session.query(JDIPageCache).filter_by(url=url).one()
+        row.expires_at = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(minutes=1)
+        db_session.flush()
+
+        assert fetch_jd_texts({url: "other"}, db=db_session) == first
+        assert _StubJobSite.conditional[-1] == '"v1"'
+        db_session.expire_all()
+        assert load_cached_pages(db_session, [url])[url].is_fresh()
+
+    def test_blocked_page_negative_cached_with_short_ttl(self, stub_site, db_session):
+        url = f"{stub_site}/blocked"
+        assert fetch_jd_texts({url: "other"}, db=db_session) == {url: (None, 0)}
+        assert fetch_jd_texts({url: "other"}, db=db_session) == {url: (None, 0)}
+        assert self._gets() == ["/blocked"]
+        entry = load_cached_pages(db_session, [url])[url]
+        assert entry.is_negative and entry.status_code == 403
+        assert entry.expires_at - entry.fetched_at == JD_NEGATIVE_CACHE_TTL
+
+    def test_login_wall_negative_cached(self, stub_site, db_session):
+        fetch_jd_texts({f"{stub_site}/wall/1": "other"}, db=db_session)
+        assert load_cached_pages(db_session, [f"{stub_site}/login"])[f"{stub_site}/login"].is_negative
+
+    def test_transient_errors_not_cached(self, stub_site, db_session):
+        fetch_jd_texts({f"{stub_site}/error": "other"}, db=db_session)
+        assert load_cached_pages(db_session, [f"{stub_site}/error"]) == {}
+
+    def test_rate_limited_page_not_cached(self, stub_site, db_session):
+        fetch_jd_texts({f"{stub_site}/limited": "other"}, db=db_session)
+        assert load_cached_pages(db_session, [f"{stub_site}/limited"]) == {}
+
+
+class TestResolutionMemo:
+
+    def _heads(self):
+        return [path for method, path in _StubJobSite.paths if method == "HEAD"]
+
+    def test_lru_skips_head_on_next_stage(self, stub_site):
+        fetch_jd_texts({f"{stub_site}/go/1": "other"})
+        fetch_jd_texts({f"{stub_site}/go/1": "other"})
+        assert self._heads() == ["/go/1", "/job/1"]  # one resolution (HEAD follows the redirect)
+
+    def test_persisted_resolution_survives_lru_loss(self, stub_site, db_session):
+        fetch_jd_texts({f"{stub_site}/go/2": "other"}, db=db_session)
+        assert load_resolved_urls(db_session, [f"{stub_site}/go/2"]) == {
+            f"{stub_site}/go/2": f"{stub_site}/job/2"
+        }
+        resolved_url_cache.clear()  # e.g. a process restart
+        results = fetch_jd_texts({f"{stub_site}/go/2": "other"}, db=db_session)
+        assert results[f"{stub_site}/go/2"][0]
+        assert self._heads() == ["/go/2", "/job/2"]
+
+
+class TestHostPolicy:
+
+    def _host(self, stub_site):
+        return stub_site.split("//", 1)[1]
+
+    def test_repeatedly_blocked_host_becomes_email_only(self, stub_site, db_session):
+        for n in range(HOST_BLOCK_THRESHOLD):
+            fetch_jd_texts({f"{stub_site}/blocked/{n}": "other"}, db=db_session)
+        assert load_email_only_hosts(db_session, [self._host(stub_site)]) == {self._host(stub_site)}
+
+        requests_before = len(_StubJobSite.paths)
+        assert fetch_jd_texts({f"{stub_site}/job/9": "other"}, db=db_session) == {
+            f"{stub_site}/job/9": (None, 0)
+        }
+        assert len(_StubJobSite.paths) == requests_before  # no round trip at all
+
+    def test_success_resets_block_streak(self, stub_site, db_session):
+        fetch_jd_texts({f"{stub_site}/blocked/1": "other"}, db=db_session)
+        fetch_jd_texts({f"{stub_site}/blocked/2": "other"}, db=db_session)
+        fetch_jd_texts({f"{stub_site}/job/1": "other"}, db=db_session)
+        fetch_jd_texts({f"{stub_site}/blocked/3": "other"}, db=db_session)
+        policy = db_session.query(JDIHostPolicy).filter_by(host=self._host(stub_site)).one()
+        assert (policy.consecutive_blocked, policy.blocked_total, policy.success_total) == (1, 3, 1)
+        assert policy.email_only_until is None
+
+    def test_login_walls_count_as_blocked(self, stub_site, db_session):
+        fetch_jd_texts(
+            {f"{stub_site}/wall/{n}": "other" for n in range(HOST_BLOCK_THRESHOLD)}, db=db_session
+        )
+        # All walls land on the same /login page — one blocked outcome, not three
+        policy = db_session.query(JDIHostPolicy).filter_by(host=self._host(stub_site)).one()
+        assert policy.blocked_total == 1
+
+    def test_rate_limiting_is_not_a_block(self, stub_site, db_session):
+        for _ in range(HOST_BLOCK_THRESHOLD):
+            fetch_jd_texts({f"{stub_site}/limited": "other"}, db=db_session)
+        assert db_session.query(JDIHostPolicy).filter_by(host=self._host(stub_site)).first() is None
+
+    def test_outcomes_credited_to_final_host_only(self):
+        fetcher = JDFetcher()
+        fetcher._blocked = {"https://acme.example/job/1": True, "https://beta.example/job/2": False}
+        outcomes = fetcher._host_outcomes({
+            "https://click.indeed.com/a": "https://acme.example/job/1",
+            "https://click.indeed.com/b": "https://beta.example/job/2",
+            "https://acme.example/job/1": "https://acme.example/job/1",
+        })
+        assert outcomes == {"acme.example": [True], "beta.example": [False]}
@@ -792,3 +792,101 @@ class TestCompanyAsTitleSwap:
         # Card may or may not be created, but if it is, title should not be "Vancouver, BC"
         for card in cards:
             assert card.title != "Vancouver, BC"
+
+
+# ── Parser backends ──────────────────────────────────────────────────────────
+
+from unittest.mock import patch
+from app.services.jdi import html_backend
+from app.services.jdi.html_backend import TextLengthIndex, parse_html
+
+_BACKEND_FIXTURES = [
+    (_linkedin_email(), "linkedin"),
+    (_linkedin_wrapped_email(), "linkedin"),
+    (_indeed_email(), "indeed"),
+    (_indeed_jobalert_email(), "indeed"),
+    (_trueup_email(), "trueup"),
+    (_trueup_digest_email(), "trueup"),
+    (_other_email(), "other"),
+]
+
+
+class TestParserBackends:
+    """Cards must not depend on which HTML tree builder is installed."""
+
+    @pytest.mark.parametrize("html,source", _BACKEND_FIXTURES)
+    def test_lxml_matches_html_parser(self, html, source):
+        pytest.importorskip("lxml")
+        results = {}
+        for parser in ("html.parser", "lxml"):
+            with patch.object(html_backend, "HTML_PARSER", parser):
+                results[parser] = parse_job_cards(html, source, email_subject="QA Manager")
+        assert results["html.parser"]
+        assert results["lxml"] == results["html.parser"]
+
+    @pytest.mark.parametrize("html,source", _BACKEND_FIXTURES)
+    def test_text_length_index_matches_get_text(self, html, source):
+        soup = parse_html(html)
+        index = TextLengthIndex(soup)
+        for tag in soup.find_all(True):
+            assert index.text_len(tag) == len(tag.get_text(strip=True))
+
+
+# ── Single-parse ParsedEmail ─────────────────────────────────────────────────
+
+from app.services.jdi import email_parser
+from app.services.jdi.email_parser import ANCHOR_NAVIGATION, ParsedEmail
+from app.services.jdi.link_extractor import (
+    EXCLUDE_PATTERNS, EXCLUDE_RE, HREF_EXCLUDED, HREF_JOB, HREF_UNMATCHED,
+    JOB_URL_PATTERNS, JOB_URL_RES, extract_job_links,
+)
+
+
+class TestParsedEmail:
+
+    @pytest.mark.parametrize("html,source", _BACKEND_FIXTURES)
+    def test_matches_separate_parsers(self, html, source):
+        parsed = ParsedEmail(html, source, email_subject="QA Manager")
+        assert parsed.cards == parse_job_cards(html, source, email_subject="QA Manager")
+        assert set(parsed.job_links) == set(extract_job_links(html, source))
+
+    def test_html_parsed_once(self):
+        parsed = ParsedEmail(_trueup_digest_email(), "trueup")
+        with patch.object(email_parser, "parse_html", wraps=email_parser.parse_html) as parse:
+            parsed.cards, parsed.job_links, parsed.anchors
+        assert parse.call_count == 1
+
+    def test_anchor_classifications(self):
+        html = """
+        <a href="https://www.linkedin.com/jobs/view/1">Senior QA Manager</a>
+        <a href="https://www.linkedin.com/jobs/view/2">View more jobs</a>
+        <a href="https://www.linkedin.com/unsubscribe">Unsubscribe</a>
+        <a href="https://example.com/blog">Blog</a>
+        <a href="mailto:help@linkedin.com">Help</a>
+        """
+        kinds = [(a.href[-6:], a.kind) for a in ParsedEmail(html, "linkedin").anchors]
+        assert kinds == [
+            ("view/1", HREF_JOB),
+            ("view/2", ANCHOR_NAVIGATION),
+            ("scribe", HREF_EXCLUDED),
+            ("m/blog", HREF_UNMATCHED),
+        ]
+
+    def test_empty_body(self):
+        parsed = ParsedEmail(None, "linkedin")
+        assert parsed.cards == [] and parsed.job_links == [] and parsed.anchors == []
+
+    @pytest.mark.parametrize("url", [
+        "https://www.linkedin.com/jobs/view/123",
+        "https://click.linkedin-email.com/?qs=abc",
+        "https://www.linkedin.com/jobs/?x=1",
+        "https://www.linkedin.com/jobs?keywords=qa",
+        "https://r.indeed.com/rc/clk?jk=1",
+        "https://links.trueup.io/privacy",
+        "https://example.com/Terms-of-Use",
+        "https://example.com/careers/1",
+    ])
+    def test_combined_regexes_match_pattern_lists(self, url):
+        assert bool(EXCLUDE_RE.search(url)) == any(p.search(url) for p in EXCLUDE_PATTERNS)
+        for source, patterns in JOB_URL_PATTERNS.items():
+            assert bool(JOB_URL_RES[source].search(url)) == any(p.search(url) for p in patterns)
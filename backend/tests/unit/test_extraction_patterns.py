@@ -0,0 +1,106 @@
+# File: backend/tests/unit/test_extraction_patterns.py
+# Parity tests: precompiled extraction patterns vs the original inline regex loops
+import csv
+import re
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from app.utils import job_extraction
+from app.utils.extraction_patterns import KnownCompanyMatcher, role_word_pattern
+from app.utils.job_extraction import TITLE_MUST_HAVE_WORDS, _has_title_role_word, _title_windows
+
+GOLD_CSV = Path(__file__).parent / "gold_jobs_latest.csv"
+
+
+def _reference_has_role_word(text: str) -> bool:
+    """The original _has_title_role_word: one \\b<word>\\b search per role word."""
+    text_lower = text.lower()
+    return any(
+        re.search(r'\b' + re.escape(word) + r'\b', text_lower) for word in TITLE_MUST_HAVE_WORDS
+    )
+
+
+def _reference_known_company(text: str, known_companies: list):
+    """The original known-company loop in extract_company_name."""
+    for co in sorted(known_companies, key=len, reverse=True):
+        if isinstance(co, str) and len(co) > 2:
+            if re.search(r'\b' + re.escape(co) + r'\b', text[:2000], re.IGNORECASE):
+                return co
+    return None
+
+
+def _exhaustive_title_windows(words: list[str]):
+    """The original extract_title scan: every 2-10 word window, longest first."""
+    for window_size in range(10, 1, -1):
+        for i in range(len(words) - window_size + 1):
+            yield i, window_size
+
+
+def _gold_rows() -> list[dict]:
+    csv.field_size_limit(10 ** 8)
+    with GOLD_CSV.open("r", encoding="utf-8") as f:
+        return [r for r in csv.DictReader(f) if r.get("job_description")]
+
+
+class TestRoleWordPattern:
+
+    @pytest.mark.parametrize("text", [
+        "Director of Engineering", "Engineering Leadership", "VP, Quality", "Vice President Sales",
+        "Sr. Software Engineer", "Engineers wanted", "Head-of QA", "leadership", "", "SVP",
+    ])
+    def test_matches_reference(self, text):
+        assert _has_title_role_word(text) == _reference_has_role_word(text)
+
+    def test_gold_lines_match_reference(self):
+        lines = [
+            line for r in _gold_rows() for line in r["job_description"].splitlines()[:30] if line.strip()
+        ]
+        assert lines
+        assert [_has_title_role_word(l) for l in lines] == [_reference_has_role_word(l) for l in lines]
+
+    def test_longer_words_win_alternation(self):
+        pattern = role_word_pattern(["vp", "vice president", "president"])
+        assert pattern.search("Vice President".lower()).group(0) == "vice president"
+
+
+class TestKnownCompanyMatcher:
+
+    def test_gold_matches_reference(self):
+        rows = _gold_rows()
+        known = sorted({r["company_name"] for r in rows if r.get("company_name")})
+        matcher = KnownCompanyMatcher(known)
+        for r in rows:
+            jd = r["job_description"]
+            assert matcher.find(jd[:2000]) == _reference_known_company(jd, known)
+
+    @pytest.mark.parametrize("text", [
+        "Join Acme Corp. today", "We are ACME CORP, hiring", "acme corporation", "C3.ai builds AI",
+        "Work at Shopify Inc", "Shopifyer", "",
+    ])
+    def test_edge_cases_match_reference(self, text):
+        known = ["Acme Corp.", "Acme Corp", "C3.ai", "Shopify", "Shopify Inc", "AI", 42]
+        assert KnownCompanyMatcher(known).find(text) == _reference_known_company(text, known[:-1])
+
+    def test_equal_length_names_keep_list_order(self):
+        assert KnownCompanyMatcher(["Beta", "Acme"]).find("Acme and Beta") == "Beta"
+
+
+class TestTitleWindows:
+
+    def test_gold_titles_match_exhaustive_scan(self):
+        jds = [r["job_description"] for r in _gold_rows()]
+        anchored = [job_extraction.extract_title(jd) for jd in jds]
+        with patch.object(job_extraction, "_title_windows", _exhaustive_title_windows):
+            assert anchored == [job_extraction.extract_title(jd) for jd in jds]
+
+    def test_windows_start_on_starter_and_reach_role_word(self):
+        words = "We need a Senior Data Engineer and a Staff Platform Lead today".split()
+        windows = list(_title_windows(words))
+        assert windows == sorted(windows, key=lambda w: (-w[1], w[0]))
+        for i, size in windows:
+            assert words[i].lower() in job_extraction.TITLE_STARTER_WORDS
+            assert _has_title_role_word(" ".join(words[i:i + size]))
+        assert (3, 3) in windows  # "Senior Data Engineer"
+        assert (0, 2) not in windows  # "We need"
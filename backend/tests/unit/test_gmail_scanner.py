@@ -1,7 +1,16 @@
 # File: backend/tests/unit/test_gmail_scanner.py
 # Tests for Gmail search query construction
 import pytest
-from app.services.jdi.gmail_scanner import build_search_query, _get_message_body_html
+from unittest.mock import patch
+import httplib2
+from googleapiclient.errors import HttpError
+from app.services.jdi import gmail_scanner
+from app.services.jdi.gmail_scanner import (
+    build_search_query,
+    _get_message_body_html,
+    fetch_job_alert_emails,
+    get_mailbox_history_id,
+)
 import base64
 
 
@@ -93,3 +102,200 @@ class TestGetMessageBodyHtml:
         }
         result = _get_message_body_html(payload)
         assert "Plain text content" in result
+
+
+# ---------------------------------------------------------------------------
+# Fake Gmail discovery service (users().messages() + batch endpoint)
+# ---------------------------------------------------------------------------
+
+class _FakeRequest:
+    def __init__(self, fn):
+        self._fn = fn
+
+    def execute(self):
+        return self._fn()
+
+
+class _FakeBatch:
+    def __init__(self, service, callback):
+        self._service = service
+        self._callback = callback
+        self._requests = []
+
+    def add(self, request, request_id=None):
+        self._requests.append((request_id, request))
+
+    def execute(self):
+        self._service.batch_calls += 1
+        for request_id, request in self._requests:
+            try:
+                response, exception = request.execute(), None
+            except Exception as e:
+                response, exception = None, e
+            self._callback(request_id, response, exception)
+
+
+class FakeGmailService:
+    """
+    In-memory stand-in for build("gmail", "v1"): messages by id (some failing),
+    plus users.history.list over the ids listed in `added_since`.
+    """
+
+    def __init__(self, messages: dict, failing: set = frozenset(),
+                 added_since: dict = None, history_id: str = "1000"):
+        self.by_id = messages
+        self.failing = set(failing)
+        self.added_since = added_since or {}   # startHistoryId → added message ids
+        self.history_id = history_id
+        self.get_calls = []
+        self.batch_calls = 0
+
+    def users(self):
+        return self
+
+    def messages(self):
+        return _FakeMessages(self)
+
+    def history(self):
+        return _FakeHistory(self)
+
+    def getProfile(self, userId):
+        return _FakeRequest(lambda: {"historyId": self.history_id})
+
+    def new_batch_http_request(self, callback):
+        return _FakeBatch(self, callback)
+
+
+class _FakeMessages:
+    def __init__(self, service):
+        self._service = service
+
+    def list(self, userId, q, maxResults):
+        ids = list(self._service.by_id)[:maxResults]
+        return _FakeRequest(lambda: {"messages": [{"id": i} for i in ids]})
+
+    def get(self, userId, id, format):
+        self._service.get_calls.append(id)
+
+        def _get():
+            if id in self._service.failing:
+                raise RuntimeError(f"404 {id}")
+            return self._service.by_id[id]
+        return _FakeRequest(_get)
+
+
+class _FakeHistory:
+    def __init__(self, service):
+        self._service = service
+
+    def list(self, userId, startHistoryId, historyTypes, pageToken=None):
+        def _list():
+            if startHistoryId not in self._service.added_since:
+                raise HttpError(httplib2.Response({"status": 404}), b"historyId not found")
+            ids = self._service.added_since[startHistoryId]
+            # Two pages to exercise nextPageToken handling
+            if pageToken is None:
+                return {"history": [{"messagesAdded": [{"message": {"id": i}} for i in ids[:1]]}],
+                        "nextPageToken": "p2"}
+            return {"history": [{"messagesAdded": [{"message": {"id": i}} for i in ids[1:]]}]}
+        return _FakeRequest(_list)
+
+
+def _gmail_message(n: int) -> dict:
+    body = base64.urlsafe_b64encode(f"<p>Job {n}</p>".encode()).decode()
+    return {
+        "internalDate": str(1_700_000_000_000 + n),
+        "payload": {
+            "mimeType": "text/html",
+            "headers": [
+                {"name": "Subject", "value": f"Alert {n}"},
+                {"name": "From", "value": "jobalerts-noreply@linkedin.com"},
+            ],
+            "body": {"data": body},
+        },
+    }
+
+
+def _fetch(service, **kwargs):
+    with patch.object(gmail_scanner, "build", return_value=service):
+        return fetch_job_alert_emails(credentials=None, sources=["linkedin"], **kwargs)
+
+
+class TestFetchJobAlertEmails:
+    """fetch_job_alert_emails against a fake Gmail service."""
+
+    def test_batches_message_gets(self):
+        service = FakeGmailService({f"m{n}": _gmail_message(n) for n in range(120)})
+        emails = _fetch(service)
+        assert len(emails) == 120
+        # 120 messages → 3 batch round trips, not 120 sequential gets
+        assert service.batch_calls == 3
+        assert [e["message_id"] for e in emails] == [f"m{n}" for n in range(120)]
+
+    def test_returned_dict_shape(self):
+        email = _fetch(FakeGmailService({"m1": _gmail_message(1)}))[0]
+        assert set(email) == {"message_id", "subject", "from_addr", "body_html", "received_at"}
+        assert email["subject"] == "Alert 1"
+        assert email["from_addr"] == "jobalerts-noreply@linkedin.com"
+        assert email["body_html"] == "<p>Job 1</p>"
+        assert email["received_at"].year == 2023
+
+    def test_failed_message_is_isolated(self):
+        service = FakeGmailService(
+            {f"m{n}": _gmail_message(n) for n in range(5)}, failing={"m2"}
+        )
+        failed = set()
+        emails = _fetch(service, failed_message_ids=failed)
+        assert [e["message_id"] for e in emails] == ["m0", "m1", "m3", "m4"]
+        assert failed == {"m2"}
+
+    def test_no_messages(self):
+        assert _fetch(FakeGmailService({})) == []
+
+
+class TestHistorySync:
+    """Incremental sync via users.history.list."""
+
+    def _service(self):
+        return FakeGmailService(
+            {f"m{n}": _gmail_message(n) for n in range(6)},
+            added_since={"500": ["m4", "m5", "m-not-a-job-alert"]},
+        )
+
+    def test_only_messages_added_since_checkpoint_are_fetched(self):
+        service = self._service()
+        emails = _fetch(service, start_history_id="500")
+        assert [e["message_id"] for e in emails] == ["m4", "m5"]
+        assert service.get_calls == ["m4", "m5"]
+
+    def test_expired_history_falls_back_to_window(self):
+        service = self._service()
+        emails = _fetch(service, start_history_id="1")
+        assert len(emails) == 6
+
+    def test_nothing_new_skips_gets(self):
+        service = FakeGmailService({"m1": _gmail_message(1)}, added_since={"500": []})
+        assert _fetch(service, start_history_id="500") == []
+        assert service.get_calls == []
+
+    def test_get_mailbox_history_id(self):
+        with patch.object(gmail_scanner, "build", return_value=FakeGmailService({}, history_id="777")):
+            assert get_mailbox_history_id(None) == "777"
+
+    def test_get_mailbox_history_id_failure_returns_none(self):
+        with patch.object(gmail_scanner, "build", side_effect=RuntimeError("boom")):
+            assert get_mailbox_history_id(None) is None
+
+
+class TestSkipProcessedMessages:
+
+    def test_known_message_ids_are_not_downloaded(self):
+        service = FakeGmailService({f"m{n}": _gmail_message(n) for n in range(4)})
+        emails = _fetch(service, skip_message_ids={"m0", "m2"})
+        assert [e["message_id"] for e in emails] == ["m1", "m3"]
+        assert service.get_calls == ["m1", "m3"]
+
+    def test_all_known_skips_batch(self):
+        service = FakeGmailService({"m1": _gmail_message(1)})
+        assert _fetch(service, skip_message_ids={"m1"}) == []
+        assert service.batch_calls == 0
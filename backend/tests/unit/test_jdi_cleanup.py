@@ -4,6 +4,8 @@ import pytest
 from datetime import datetime, timezone, timedelta
 from app.services.jdi.cleanup import prune_expired_candidates
 from app.models.jdi_candidate import JDICandidate
+from app.models.jdi_processed_message import JDIProcessedMessage
+from app.models.jdi_page_cache import JDIPageCache
 
 
 class TestPruneExpiredCandidates:
@@ -86,3 +88,40 @@ class TestPruneExpiredCandidates:
 
         result = prune_expired_candidates(db_session)
         assert result["stale_new"] == 0
+
+
+class TestPruneProcessedMessages:
+    """Processed-message ledger retention."""
+
+    def test_prune_old_ledger_rows(self, db_session, test_user):
+        db_session.add_all([
+            JDIProcessedMessage(
+                user_id=test_user.id, message_id="old", card_count=3,
+                processed_at=datetime.now(timezone.utc) - timedelta(days=15),
+            ),
+            JDIProcessedMessage(user_id=test_user.id, message_id="recent", card_count=1),
+        ])
+        db_session.flush()
+
+        result = prune_expired_candidates(db_session)
+        assert result["processed_messages"] == 1
+        remaining = db_session.query(JDIProcessedMessage).filter_by(user_id=test_user.id).all()
+        assert [r.message_id for r in remaining] == ["recent"]
+
+
+class TestPrunePageCache:
+    """JD page cache retention."""
+
+    def test_prune_long_expired_entries(self, db_session):
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        db_session.add_all([
+            JDIPageCache(url_hash="a" * 64, url="https://jobs.example.com/old",
+                         expires_at=now - timedelta(days=8)),
+            JDIPageCache(url_hash="b" * 64, url="https://jobs.example.com/stale",
+                         expires_at=now - timedelta(days=1)),
+        ])
+        db_session.flush()
+
+        result = prune_expired_candidates(db_session)
+        assert result["page_cache"] == 1
+        assert [r.url for r in db_session.query(JDIPageCache).all()] == ["https://jobs.example.com/stale"]
@@ -0,0 +1,341 @@
+# File: backend/tests/unit/test_jdi_ingestion.py
+# Tests for the batched card pipeline in run_jdi_ingestion (real DB, mocked Gmail)
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.models.jdi_candidate import JDICandidate
+from app.models.jdi_processed_message import JDIProcessedMessage
+from app.models.user_integration import UserIntegration
+from app.models.user_profile import UserProfile
+from app.routes.user_profile import update_profile
+from app.schemas.user_profile import UserProfileUpdate
+from app.services.jdi import gmail_scanner, ingestion
+from app.services.jdi.email_parser import EmailJobCard
+from app.services.jdi.ingestion import run_jdi_ingestion
+from app.services.jdi.jd_fetcher import compute_jd_hash
+from app.services.jdi.scoring import select_best_resume
+from tests.unit.test_gmail_scanner import FakeGmailService, _gmail_message
+
+
+def _card(n, title="QA Manager", company=None, link=None):
+    return EmailJobCard(
+        apply_link=link or f"https://www.linkedin.com/jobs/view/{n}",
+        title=title,
+        company=company or f"Company {n}",
+        location="Vancouver, BC",
+        snippet="Python, AWS, Docker, Kubernetes test automation",
+        source="linkedin",
+        email_subject="QA Manager in Vancouver",
+    )
+
+
+def _email(message_id):
+    return {
+        "message_id": message_id,
+        "from_addr": "jobalerts-noreply@linkedin.com",
+        "subject": "QA Manager in Vancouver",
+        "body_html": "<html></html>",
+    }
+
+
+@pytest.fixture()
+def jdi_user(db_session, test_user, test_resume):
+    db_session.add(UserIntegration(
+        user_id=test_user.id,
+        provider="gmail",
+        status="active",
+        refresh_token_enc="encrypted-refresh-token",
+    ))
+    db_session.add(UserProfile(
+        user_id=test_user.id,
+        jdi_min_score=0,
+        jdi_sources_enabled=["linkedin"],
+        target_titles=["Manager"],
+    ))
+    db_session.flush()
+    return test_user
+
+
+def _run(db_session, user, cards_by_message, history_id="1000", fetch=None, **kwargs):
+    emails = [_email(mid) for mid in cards_by_message]
+    fetch = fetch or MagicMock(return_value=emails)
+    with patch.object(ingestion, "get_gmail_credentials", return_value=MagicMock()), \
+         patch.object(ingestion, "get_mailbox_history_id", return_value=history_id), \
+         patch.object(ingestion, "fetch_job_alert_emails", fetch), \
+         patch.object(ingestion, "parse_job_cards",
+                      side_effect=[cards_by_message[mid] for mid in cards_by_message]):
+        return run_jdi_ingestion(user_id=user.id, db=db_session, window_hours=24, **kwargs)
+
+
+def _candidates(db_session, user):
+    return db_session.query(JDICandidate).filter_by(user_id=user.id).all()
+
+
+class TestBatchedIngestion:
+
+    def test_creates_candidates_across_emails(self, db_session, jdi_user):
+        result = _run(db_session, jdi_user, {"m1": [_card(1), _card(2)], "m2": [_card(3)]})
+        assert result["new_candidates"] == 3
+        assert result["total_emails_scanned"] == 2
+        assert {c.source_message_id for c in _candidates(db_session, jdi_user)} == {"m1", "m2"}
+
+    def test_title_filter_applied(self, db_session, jdi_user):
+        result = _run(db_session, jdi_user, {"m1": [_card(1), _card(2, title="Truck Driver")]})
+        assert result["new_candidates"] == 1
+
+    def test_dedups_within_run(self, db_session, jdi_user):
+        """Same job in two emails (same URL, or same title+company) is created once."""
+        result = _run(db_session, jdi_user, {
+            "m1": [_card(1), _card(2, company="Acme")],
+            "m2": [_card(1), _card(9, company="Acme")],
+        })
+        assert result["new_candidates"] == 2
+
+    def test_dedups_against_existing_candidates(self, db_session, jdi_user):
+        _run(db_session, jdi_user, {"m1": [_card(1)]})
+        result = _run(db_session, jdi_user, {"m2": [_card(1), _card(5)]})
+        assert result["new_candidates"] == 1
+        assert len(_candidates(db_session, jdi_user)) == 2
+
+    def test_dedups_by_content_hash(self, db_session, jdi_user):
+        card = _card(1)
+        db_session.add(JDICandidate(
+            user_id=jdi_user.id,
+            source="linkedin",
+            job_url_canonical="https://example.com/other-url",
+            title="Different title",
+            company="Different company",
+            jd_hash=compute_jd_hash(card.to_scoring_text()),
+        ))
+        db_session.flush()
+        result = _run(db_session, jdi_user, {"m1": [card, _card(2)]})
+        assert result["new_candidates"] == 1
+
+    def test_dedup_index_preloads_existing_keys(self, db_session, jdi_user):
+        _run(db_session, jdi_user, {"m1": [_card(1), _card(2)]})
+        index = ingestion._DedupIndex.load(jdi_user.id, db_session)
+        assert index.urls == {f"https://www.linkedin.com/jobs/view/{n}" for n in (1, 2)}
+        assert index.title_companies == {("QA Manager", "Company 1"), ("QA Manager", "Company 2")}
+        assert len(index.hashes) == 2
+
+    def test_scores_match_single_card_selection(self, db_session, jdi_user):
+        cards = [_card(1), _card(2, title="Director of Engineering Manager")]
+        _run(db_session, jdi_user, {"m1": cards})
+        by_title = {c.title: c for c in _candidates(db_session, jdi_user)}
+        for card in cards:
+            expected = select_best_resume(jdi_user.id, card.to_scoring_text(), db_session)
+            stored = by_title[card.title]
+            assert (stored.selected_resume_id, stored.match_score) == expected
+
+    def test_resumes_loaded_once_per_run(self, db_session, jdi_user):
+        with patch.object(
+            ingestion, "load_scoring_context", wraps=ingestion.load_scoring_context
+        ) as loader:
+            _run(db_session, jdi_user, {"m1": [_card(n) for n in range(10)]})
+        assert loader.call_count == 1
+
+    def test_min_score_filters(self, db_session, jdi_user):
+        profile = db_session.query(UserProfile).filter_by(user_id=jdi_user.id).first()
+        profile.jdi_min_score = 100
+        card = _card(1)
+        card.source = "other"
+        with patch.object(ingestion, "fetch_jd_texts", return_value={}):
+            result = _run(db_session, jdi_user, {"m1": [card]})
+        assert result["new_candidates"] == 0
+
+
+    def test_other_source_jds_fetched_in_one_batch(self, db_session, jdi_user):
+        cards = [_card(n, link=f"https://jobs.example.com/{n}") for n in range(3)]
+        for card in cards:
+            card.source = "other"
+        jd = "QA Manager leading Python test automation on AWS and Kubernetes. " * 5
+        with patch.object(ingestion, "fetch_jd_texts", return_value={
+            cards[0].apply_link: (jd, 90),
+        }) as fetch:
+            result = _run(db_session, jdi_user, {"m1": cards + [_card(9)]})
+        assert fetch.call_count == 1
+        assert fetch.call_args.args[0] == {c.apply_link: "other" for c in cards}
+        assert result["new_candidates"] == 4
+        by_url = {c.job_url_canonical: c for c in _candidates(db_session, jdi_user)}
+        assert by_url[cards[0].apply_link].jd_extraction_confidence == 90
+        assert by_url[cards[1].apply_link].jd_extraction_confidence == 80
+
+
+class TestHistoryCheckpoint:
+
+    def _integration(self, db_session, user):
+        return db_session.query(UserIntegration).filter_by(user_id=user.id).first()
+
+    def test_first_run_uses_window_and_stores_checkpoint(self, db_session, jdi_user):
+        fetch = MagicMock(return_value=[])
+        _run(db_session, jdi_user, {}, history_id="1000", fetch=fetch)
+        assert fetch.call_args.kwargs["start_history_id"] is None
+        assert self._integration(db_session, jdi_user).gmail_history_id == "1000"
+
+    def test_next_run_syncs_from_stored_checkpoint(self, db_session, jdi_user):
+        _run(db_session, jdi_user, {}, history_id="1000", fetch=MagicMock(return_value=[]))
+        fetch = MagicMock(return_value=[])
+        _run(db_session, jdi_user, {}, history_id="1200", fetch=fetch)
+        assert fetch.call_args.kwargs["start_history_id"] == "1000"
+        assert self._integration(db_session, jdi_user).gmail_history_id == "1200"
+
+    def test_checkpoint_kept_when_profile_unavailable(self, db_session, jdi_user):
+        _run(db_session, jdi_user, {}, history_id="1000", fetch=MagicMock(return_value=[]))
+        _run(db_session, jdi_user, {}, history_id=None, fetch=MagicMock(return_value=[]))
+        assert self._integration(db_session, jdi_user).gmail_history_id == "1000"
+
+    def test_failed_download_retried_next_run(self, db_session, jdi_user):
+        """A message whose batch get failed is still in the next run's history delta."""
+        self._integration(db_session, jdi_user).gmail_history_id = "500"
+        db_session.flush()
+        service = FakeGmailService(
+            {"m1": _gmail_message(1), "m2": _gmail_message(2)},
+            failing={"m2"}, added_since={"500": ["m1", "m2"]}, history_id="600",
+        )
+
+        def run():
+            with patch.object(gmail_scanner, "build", return_value=service), \
+                 patch.object(ingestion, "get_gmail_credentials", return_value=MagicMock()), \
+                 patch.object(ingestion, "get_mailbox_history_id", return_value=service.history_id), \
+                 patch.object(ingestion, "parse_job_cards",
+                              side_effect=lambda html, *a, **kw: [_card(html[6:-4])]):
+                return run_jdi_ingestion(user_id=jdi_user.id, db=db_session, window_hours=24)
+
+        assert run()["new_candidates"] == 1
+        assert self._integration(db_session, jdi_user).gmail_history_id == "500"
+
+        service.failing.clear()
+        service.get_calls.clear()
+        assert run()["new_candidates"] == 1
+        assert service.get_calls == ["m2"]
+        assert {c.source_message_id for c in _candidates(db_session, jdi_user)} == {"m1", "m2"}
+        assert self._integration(db_session, jdi_user).gmail_history_id == "600"
+
+
+class TestProcessedMessageLedger:
+
+    def _ledger(self, db_session, user):
+        db_session.expire_all()  # ledger is written with a Core upsert
+        rows = db_session.query(JDIProcessedMessage).filter_by(user_id=user.id).all()
+        return {r.message_id: r.card_count for r in rows}
+
+    def test_records_processed_messages_with_card_counts(self, db_session, jdi_user):
+        _run(db_session, jdi_user, {"m1": [_card(1), _card(2)], "m2": []})
+        assert self._ledger(db_session, jdi_user) == {"m1": 2, "m2": 0}
+
+    def test_next_run_skips_known_messages(self, db_session, jdi_user):
+        _run(db_session, jdi_user, {"m1": [_card(1)]})
+        fetch = MagicMock(return_value=[])
+        _run(db_session, jdi_user, {}, fetch=fetch)
+        assert fetch.call_args.kwargs["skip_message_ids"] == {"m1"}
+
+    def test_forced_rescan_reprocesses_and_refreshes_ledger(self, db_session, jdi_user):
+        _run(db_session, jdi_user, {"m1": [_card(1)]})
+        fetch = MagicMock(return_value=[_email("m1")])
+        _run(db_session, jdi_user, {"m1": [_card(1), _card(2)]}, fetch=fetch, force_full_window=True)
+        assert fetch.call_args.kwargs["skip_message_ids"] == set()
+        assert self._ledger(db_session, jdi_user) == {"m1": 2}
+
+    def test_filter_change_rechecks_processed_messages(self, db_session, jdi_user):
+        profile = db_session.query(UserProfile).filter_by(user_id=jdi_user.id).first()
+        profile.jdi_min_score = 100
+        card = _card(1)
+        card.source = "other"
+        with patch.object(ingestion, "fetch_jd_texts", return_value={}):
+            assert _run(db_session, jdi_user, {"m1": [card]})["new_candidates"] == 0
+        assert self._ledger(db_session, jdi_user) == {"m1": 1}
+
+        update_profile(jdi_user.id, UserProfileUpdate(jdi_min_score=0), db_session)
+        assert self._ledger(db_session, jdi_user) == {}
+        integration = db_session.query(UserIntegration).filter_by(user_id=jdi_user.id).first()
+        assert integration.gmail_history_id is None
+
+        fetch = MagicMock(return_value=[_email("m1")])
+        with patch.object(ingestion, "fetch_jd_texts", return_value={}):
+            result = _run(db_session, jdi_user, {"m1": [card]}, fetch=fetch)
+        assert fetch.call_args.kwargs["skip_message_ids"] == set()
+        assert fetch.call_args.kwargs["start_history_id"] is None
+        assert result["new_candidates"] == 1
+
+    def test_unrelated_profile_change_keeps_ledger(self, db_session, jdi_user):
+        _run(db_session, jdi_user, {"m1": [_card(1)]})
+        update_profile(jdi_user.id, UserProfileUpdate(jdi_min_score=0, jdi_scan_window_days=3), db_session)
+        assert self._ledger(db_session, jdi_user) == {"m1": 1}
+
+
+class TestSyncFailures:
+
+    def _integration(self, db_session, user):
+        return db_session.query(UserIntegration).filter_by(user_id=user.id).first()
+
+    def _fail_credentials(self, db_session, user, **kwargs):
+        with patch.object(ingestion, "get_gmail_credentials", side_effect=RuntimeError("invalid_grant")):
+            return run_jdi_ingestion(user_id=user.id, db=db_session, window_hours=24, **kwargs)
+
+    def test_failure_counted(self, db_session, jdi_user):
+        self._fail_credentials(db_session, jdi_user)
+        integration = self._integration(db_session, jdi_user)
+        assert (integration.status, integration.sync_failures) == ("error", 1)
+
+    def test_errored_integration_skipped_without_retry(self, db_session, jdi_user):
+        self._fail_credentials(db_session, jdi_user)
+        result = self._fail_credentials(db_session, jdi_user)
+        assert result["message"].startswith("No active Gmail integration")
+        assert self._integration(db_session, jdi_user).sync_failures == 1
+
+    def test_retry_failure_increments(self, db_session, jdi_user):
+        self._fail_credentials(db_session, jdi_user)
+        self._fail_credentials(db_session, jdi_user, retry_errored=True)
+        integration = self._integration(db_session, jdi_user)
+        assert (integration.status, integration.sync_failures) == ("error", 2)
+
+    def test_successful_retry_reactivates(self, db_session, jdi_user):
+        self._fail_credentials(db_session, jdi_user)
+        _run(db_session, jdi_user, {}, fetch=MagicMock(return_value=[]), retry_errored=True)
+        integration = self._integration(db_session, jdi_user)
+        assert (integration.status, integration.sync_failures) == ("active", 0)
+        assert integration.last_sync_at is not None
+
+
+class TestIngestionEvents:
+
+    def _events(self, db_session, user, cards_by_message):
+        emails = [_email(mid) for mid in cards_by_message]
+        with patch.object(ingestion, "get_gmail_credentials", return_value=MagicMock()), \
+             patch.object(ingestion, "get_mailbox_history_id", return_value="1000"), \
+             patch.object(ingestion, "fetch_job_alert_emails", MagicMock(return_value=emails)), \
+             patch.object(ingestion, "parse_job_cards",
+                          side_effect=[cards_by_message[mid] for mid in cards_by_message]):
+            return list(ingestion.iter_jdi_ingestion(user_id=user.id, db=db_session, window_hours=24))
+
+    def test_event_sequence(self, db_session, jdi_user):
+        events = self._events(db_session, jdi_user, {"m1": [_card(1)], "m2": [_card(2), _card(3)]})
+        assert [e["type"] for e in events] == [
+            "stage", "emails_fetched",
+            "cards_parsed", "cards_scored", "candidate_created",
+            "cards_parsed", "cards_scored", "candidate_created", "candidate_created",
+            "done",
+        ]
+        assert events[-1]["result"]["new_candidates"] == 3
+        assert [e["new_candidates"] for e in events if e["type"] == "candidate_created"] == [1, 2, 3]
+
+    def test_first_email_committed_before_the_rest(self, db_session, jdi_user):
+        """The first chunk is one email, so its candidates exist before later emails are parsed."""
+        cards_by_message = {"m1": [_card(1)], "m2": [_card(2)]}
+        parse = MagicMock(side_effect=list(cards_by_message.values()))
+        with patch.object(ingestion, "get_gmail_credentials", return_value=MagicMock()), \
+             patch.object(ingestion, "get_mailbox_history_id", return_value="1000"), \
+             patch.object(ingestion, "fetch_job_alert_emails",
+                          MagicMock(return_value=[_email(mid) for mid in cards_by_message])), \
+             patch.object(ingestion, "parse_job_cards", parse):
+            events = ingestion.iter_jdi_ingestion(user_id=jdi_user.id, db=db_session, window_hours=24)
+            first = next(e for e in events if e["type"] == "candidate_created")
+            assert parse.call_count == 1
+            assert db_session.get(JDICandidate, first["candidate"]["id"]).title == "QA Manager"
+            events.close()
+
+    def test_chunks(self):
+        emails = [{"message_id": str(n)} for n in range(60)]
+        chunks = list(ingestion._email_chunks(emails))
+        assert [len(c) for c in chunks] == [1, 25, 25, 9]
@@ -0,0 +1,155 @@
+# File: backend/tests/unit/test_jdi_run_queue.py
+# Tests for the DB-backed JDI run queue and its workers (real DB, mocked ingestion)
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from app.models.jdi_run import JDIRun
+from app.models.jdi_run_event import JDIRunEvent
+from app.services.jdi import run_queue
+from app.services.jdi.run_queue import (
+    JDIRunWorkers,
+    claim_next_run,
+    enqueue_run,
+    fail_stale_runs,
+)
+from tests.conftest import TestSessionLocal
+
+
+@pytest.fixture()
+def workers(db_session):
+    """Workers whose sessions share the test connection (rolled back after the test)."""
+    connection = db_session.connection()
+    return JDIRunWorkers(size=0, session_factory=lambda: TestSessionLocal(bind=connection))
+
+
+def _fake_ingestion(**kwargs):
+    yield {"type": "emails_fetched", "stage": "parsing", "emails_scanned": 3}
+    yield {"type": "cards_parsed", "stage": "scoring", "cards": 12, "cards_found": 12}
+    yield {"type": "cards_scored", "cards": 12, "cards_processed": 12}
+    yield {"type": "candidate_created", "candidate": {"id": "c1"}, "new_candidates": 4}
+    yield {
+        "type": "done", "stage": "done",
+        "result": {"new_candidates": 4, "total_emails_scanned": 3, "message": "Ingestion complete"},
+    }
+
+
+def _failing_ingestion(**kwargs):
+    yield {"type": "emails_fetched", "stage": "parsing", "emails_scanned": 3}
+    raise RuntimeError("boom")
+
+
+def _events(db_session, run_id):
+    return (
+        db_session.query(JDIRunEvent.seq, JDIRunEvent.type)
+        .filter_by(run_id=run_id)
+        .order_by(JDIRunEvent.seq)
+        .all()
+    )
+
+
+class TestEnqueue:
+
+    def test_creates_queued_run(self, db_session, test_user):
+        run, created = enqueue_run(test_user.id, {"window_hours": 24}, db_session)
+        assert created and run.status == "queued"
+        assert run.params == {"window_hours": 24}
+
+    def test_dedups_active_run(self, db_session, test_user):
+        first, _ = enqueue_run(test_user.id, {}, db_session)
+        second, created = enqueue_run(test_user.id, {}, db_session)
+        assert second.id == first.id and not created
+
+    def test_new_run_after_previous_finished(self, db_session, test_user):
+        first, _ = enqueue_run(test_user.id, {}, db_session)
+        first.status = "succeeded"
+        db_session.flush()
+        second, created = enqueue_run(test_user.id, {}, db_session)
+        assert created and second.id != first.id
+
+    def test_dead_running_run_does_not_block(self, db_session, test_user):
+        first, _ = enqueue_run(test_user.id, {}, db_session)
+        first.status = "running"
+        first.heartbeat_at = datetime.now(timezone.utc) - timedelta(hours=2)
+        db_session.flush()
+        second, created = enqueue_run(test_user.id, {}, db_session)
+        assert created and second.id != first.id
+        db_session.expire_all()
+        assert db_session.get(JDIRun, first.id).status == "failed"
+
+    def test_live_running_run_dedups(self, db_session, test_user):
+        first, _ = enqueue_run(test_user.id, {}, db_session)
+        first.status = "running"
+        first.heartbeat_at = datetime.now(timezone.utc) - timedelta(minutes=1)
+        db_session.flush()
+        second, created = enqueue_run(test_user.id, {}, db_session)
+        assert second.id == first.id and not created
+
+
+class TestWorkers:
+
+    def test_executes_run_and_records_progress(self, db_session, test_user, workers):
+        run, _ = enqueue_run(test_user.id, {"window_hours": 48, "force_full_window": True}, db_session)
+        with patch.object(run_queue, "iter_jdi_ingestion", side_effect=_fake_ingestion) as ingest:
+            assert workers.run_pending() == 1
+        assert ingest.call_args.kwargs["window_hours"] == 48
+        assert ingest.call_args.kwargs["user_id"] == test_user.id
+
+        db_session.expire_all()
+        run = db_session.get(JDIRun, run.id)
+        assert run.status == "succeeded" and run.stage == "done"
+        assert (run.emails_scanned, run.cards_found, run.cards_processed, run.new_candidates) == (3, 12, 12, 4)
+        assert run.started_at and run.finished_at and run.heartbeat_at
+
+    def test_events_logged_in_order(self, db_session, test_user, workers):
+        run, _ = enqueue_run(test_user.id, {}, db_session)
+        with patch.object(run_queue, "iter_jdi_ingestion", side_effect=_fake_ingestion):
+            workers.run_pending()
+        assert [tuple(e) for e in _events(db_session, run.id)] == [
+            (1, "emails_fetched"), (2, "cards_parsed"), (3, "cards_scored"),
+            (4, "candidate_created"), (5, "done"),
+        ]
+
+    def test_failure_recorded(self, db_session, test_user, workers):
+        run, _ = enqueue_run(test_user.id, {}, db_session)
+        with patch.object(run_queue, "iter_jdi_ingestion", side_effect=_failing_ingestion):
+            workers.run_pending()
+        db_session.expire_all()
+        run = db_session.get(JDIRun, run.id)
+        assert run.status == "failed"
+        assert "boom" in run.error
+        assert run.emails_scanned == 3
+        assert [tuple(e) for e in _events(db_session, run.id)] == [(1, "emails_fetched"), (2, "failed")]
+
+    def test_claims_oldest_queued_first(self, db_session, test_user):
+        older = JDIRun(user_id=test_user.id, status="succeeded",
+                       created_at=datetime.now(timezone.utc) - timedelta(hours=1))
+        db_session.add(older)
+        run, _ = enqueue_run(test_user.id, {}, db_session)
+        claimed = claim_next_run(db_session, "w1")
+        assert claimed.id == run.id and claimed.status == "running" and claimed.worker_id == "w1"
+        assert claim_next_run(db_session, "w2") is None
+
+    def test_stale_running_runs_failed(self, db_session, test_user):
+        run, _ = enqueue_run(test_user.id, {}, db_session)
+        run.status = "running"
+        run.heartbeat_at = datetime.now(timezone.utc) - timedelta(hours=2)
+        db_session.flush()
+        assert fail_stale_runs(db_session) == 1
+        db_session.expire_all()
+        assert db_session.get(JDIRun, run.id).status == "failed"
+
+    def test_stale_check_runs_periodically(self, db_session, test_user, workers):
+        run, _ = enqueue_run(test_user.id, {}, db_session)
+        run.status = "running"
+        run.heartbeat_at = datetime.now(timezone.utc) - timedelta(hours=2)
+        db_session.flush()
+        assert workers.check_stale_runs() == 1
+        run2 = JDIRun(user_id=test_user.id, status="running",
+                      heartbeat_at=datetime.now(timezone.utc) - timedelta(hours=2))
+        db_session.add(run2)
+        db_session.flush()
+        assert workers.check_stale_runs() == 0  # checked within the last STALE_CHECK_SECONDS
+        workers._next_stale_check = 0.0  # interval elapsed
+        assert workers.check_stale_runs() == 1
@@ -0,0 +1,124 @@
+# File: backend/tests/unit/test_jdi_scheduler.py
+# Tests for scheduled background JDI scans (real DB, runs are only enqueued)
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from app.models.jdi_run import JDIRun
+from app.models.user import User
+from app.models.user_integration import UserIntegration
+from app.models.user_profile import UserProfile
+from app.services.jdi import scheduler
+from app.services.jdi.run_queue import claim_next_run, enqueue_run
+from app.services.jdi.scheduler import (
+    ERROR_BACKOFF_MAX,
+    JDI_SCAN_INTERVAL,
+    SCAN_JITTER,
+    schedule_due_scans,
+)
+
+NOW = datetime(2026, 10, 18, 12, 0)
+
+
+@pytest.fixture()
+def integration(db_session, test_user):
+    row = UserIntegration(
+        user_id=test_user.id,
+        provider="gmail",
+        status="active",
+        refresh_token_enc="encrypted-refresh-token",
+        next_scan_at=NOW - timedelta(minutes=1),
+    )
+    db_session.add(row)
+    db_session.add(UserProfile(user_id=test_user.id, jdi_scan_window_days=3))
+    db_session.flush()
+    return row
+
+
+def _runs(db_session, user_id):
+    return db_session.query(JDIRun).filter_by(user_id=user_id).all()
+
+
+class TestScheduleDueScans:
+
+    def test_enqueues_due_integration(self, db_session, integration):
+        assert schedule_due_scans(db_session, now=NOW) == 1
+        (run,) = _runs(db_session, integration.user_id)
+        assert run.trigger == "scheduled" and run.status == "queued"
+        assert run.params["window_hours"] == 72
+        assert run.params["retry_errored"] is False
+
+    def test_next_scan_one_interval_out_with_jitter(self, db_session, integration):
+        schedule_due_scans(db_session, now=NOW)
+        spread = JDI_SCAN_INTERVAL * SCAN_JITTER
+        assert NOW + JDI_SCAN_INTERVAL - spread <= integration.next_scan_at <= NOW + JDI_SCAN_INTERVAL + spread
+
+    def test_not_due_yet(self, db_session, integration):
+        integration.next_scan_at = NOW + timedelta(minutes=5)
+        db_session.flush()
+        assert schedule_due_scans(db_session, now=NOW) == 0
+
+    def test_first_sighting_gets_random_slot(self, db_session, integration):
+        integration.next_scan_at = None
+        db_session.flush()
+        assert schedule_due_scans(db_session, now=NOW) == 0
+        assert NOW <= integration.next_scan_at <= NOW + JDI_SCAN_INTERVAL
+
+    def test_revoked_skipped(self, db_session, integration):
+        integration.status = "revoked"
+        db_session.flush()
+        assert schedule_due_scans(db_session, now=NOW) == 0
+
+    def test_user_with_active_run_not_requeued(self, db_session, integration):
+        manual, _ = enqueue_run(integration.user_id, {}, db_session)
+        assert schedule_due_scans(db_session, now=NOW) == 0
+        assert [r.id for r in _runs(db_session, integration.user_id)] == [manual.id]
+
+    def test_batch_cap(self, db_session, integration):
+        with patch.object(scheduler, "JDI_SCHEDULE_BATCH", 0):
+            assert schedule_due_scans(db_session, now=NOW) == 0
+
+
+class TestErrorBackoff:
+
+    def test_errored_integration_retried_with_backoff(self, db_session, integration):
+        integration.status = "error"
+        integration.sync_failures = 2
+        db_session.flush()
+        assert schedule_due_scans(db_session, now=NOW) == 1
+        (run,) = _runs(db_session, integration.user_id)
+        assert run.params["retry_errored"] is True
+        assert integration.next_scan_at == NOW + min(JDI_SCAN_INTERVAL * 4, ERROR_BACKOFF_MAX)
+
+    def test_backoff_capped(self, db_session, integration):
+        integration.status = "error"
+        integration.sync_failures = 30
+        db_session.flush()
+        schedule_due_scans(db_session, now=NOW)
+        assert integration.next_scan_at == NOW + ERROR_BACKOFF_MAX
+
+
+class TestFairClaiming:
+
+    def _queued(self, db_session, user_id, trigger, age_minutes):
+        run = JDIRun(
+            user_id=user_id, status="queued", trigger=trigger,
+            created_at=datetime.now(timezone.utc) - timedelta(minutes=age_minutes),
+        )
+        db_session.add(run)
+        db_session.flush()
+        return run
+
+    def test_manual_runs_claimed_before_older_scheduled(self, db_session, test_user):
+        other = User(email="other@example.com", full_name="Other User", hashed_password="x")
+        db_session.add(other)
+        db_session.flush()
+        scheduled = self._queued(db_session, test_user.id, "scheduled", age_minutes=30)
+        manual = self._queued(db_session, other.id, "manual", age_minutes=1)
+        assert claim_next_run(db_session, "w1").id == manual.id
+        assert claim_next_run(db_session, "w1").id == scheduled.id
+
+    def test_reserved_worker_skips_scheduled(self, db_session, test_user):
+        self._queued(db_session, test_user.id, "scheduled", age_minutes=5)
+        assert claim_next_run(db_session, "w0", include_scheduled=False) is None
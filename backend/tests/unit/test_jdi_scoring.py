@@ -2,7 +2,9 @@
 # Tests for JDI resume selection and scoring
 import pytest
 from unittest.mock import MagicMock, patch
-from app.services.jdi.scoring import select_best_resume, _apply_keyword_rules, _compute_match_score
+from app.services.jdi.scoring import select_best_resume, _apply_keyword_rules, _compute_match_score, _compute_match_scores
+from app.services.score_calc import calculate_similarity_score, calculate_skill_match_score
+from app.services.resume_features import build_resume_features
 
 
 class TestSelectBestResume:
@@ -30,6 +32,22 @@ class TestSelectBestResume:
         assert score == 0
 
 
+    def test_picks_highest_scoring_resume(self):
+        db = MagicMock()
+        db.query.return_value.filter_by.return_value.first.return_value = None
+        weak = MagicMock(id=1, parsed_text="Pastry chef, bakery operations, food safety")
+        strong = MagicMock(id=2, parsed_text="Senior Python developer: Django, AWS, Docker")
+        empty = MagicMock(id=3, parsed_text=None)
+        db.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value = [
+            weak, strong, empty,
+        ]
+
+        jd = "Senior Python developer with Django and AWS experience"
+        resume_id, score = select_best_resume(user_id=1, jd_text=jd, db=db)
+        assert resume_id == 2
+        assert score == round(_compute_match_score(strong.parsed_text, jd, ["Python", "Django", "AWS"]))
+
+
 class TestComputeMatchScore:
     """Tests for _compute_match_score — the TF-IDF / keyword blend helper."""
 
@@ -54,6 +72,24 @@ class TestComputeMatchScore:
         score = _compute_match_score("my resume text", "", [])
         assert score == 0.0
 
+    def test_batched_scores_match_single_calls(self):
+        resumes = [
+            "Python developer with Django and REST API experience",
+            "Quality Assurance Manager with 10 years experience in Vancouver",
+            "",
+        ]
+        jd = "Senior Python developer needed. Skills: Python, Django"
+        # Pairwise reference: one TfidfVectorizer fit per resume
+        features = [build_resume_features(i, r) for i, r in enumerate(resumes)]
+        assert _compute_match_scores(features, jd, []) == [
+            calculate_similarity_score(r, jd) for r in resumes
+        ]
+        keywords = ["python", "django"]
+        assert _compute_match_scores(features, jd, keywords) == [
+            round((calculate_similarity_score(r, jd) + calculate_skill_match_score(r, keywords)) / 2, 2)
+            for r in resumes
+        ]
+
     def test_score_bounded_0_to_100(self):
         resume = "Python developer with many skills"
         jd = "Python developer with many skills"
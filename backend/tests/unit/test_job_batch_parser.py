@@ -0,0 +1,46 @@
+# File: backend/tests/unit/test_job_batch_parser.py
+# Tests for bulk JD extraction (in-process and through the process pool)
+from unittest.mock import patch
+
+from app.services import job_batch_parser
+from app.services.job_batch_parser import extract_job_fields, parse_job_descriptions
+from app.utils.job_extraction import extract_location
+
+JDS = [
+    "Senior Software Engineer\n\nAcme Corp is hiring in Toronto, ON. 5+ years of Python and AWS. $140,000 - $180,000",
+    "Staff Data Engineer\n\nRemote (Canada). Kafka, SQL and Spark experience required.",
+    "Engineering Manager\n\nLead a team of 8 engineers based in Vancouver.",
+]
+
+
+def _expected(jd):
+    return {**extract_job_fields(jd), "location": extract_location(jd)}
+
+
+class TestParseJobDescriptions:
+
+    def test_in_process_matches_single_extraction(self):
+        assert parse_job_descriptions(JDS) == [_expected(jd) for jd in JDS]
+
+    def test_extraction_error_is_per_item(self):
+        real = job_batch_parser.extract_title
+
+        def flaky(description):
+            if "Staff" in description:
+                raise ValueError("boom")
+            return real(description)
+
+        with patch.object(job_batch_parser, "extract_title", flaky):
+            results = parse_job_descriptions(JDS)
+        assert results[1] == {"error": "Extraction failed: boom"}
+        assert results[0] == _expected(JDS[0]) and results[2] == _expected(JDS[2])
+
+    def test_process_pool_matches_in_process(self):
+        batch = JDS * 4
+        with patch.object(job_batch_parser, "JD_PARSE_WORKERS", 2), \
+             patch.object(job_batch_parser, "JD_PARSE_POOL_MIN_BATCH", 2):
+            try:
+                pooled = parse_job_descriptions(batch)
+            finally:
+                job_batch_parser.shutdown_pool()
+        assert pooled == [_expected(jd) for jd in batch]
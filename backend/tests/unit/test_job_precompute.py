@@ -0,0 +1,88 @@
+# File: backend/tests/unit/test_job_precompute.py
+# Tests for write-time extraction columns on Job / SavedJob and their backfill
+from datetime import datetime, timezone
+
+from app.models.job import Job
+from app.models.saved_job import SavedJob
+from app.services.job_precompute import (
+    backfill_extraction_columns,
+    clear_job_salary,
+    precompute_job,
+    precompute_saved_job,
+)
+from app.utils.salary_extractor import salary_fields
+
+JD = "Backend Engineer in Toronto, ON. Python, Docker and AWS. Salary: $120,000 - $150,000 per year."
+
+
+class TestSalaryFields:
+
+    def test_from_description(self):
+        fields = salary_fields(JD)
+        assert fields["salary"]
+        assert (fields["salary_min"], fields["salary_max"]) == (120000, 150000)
+        assert fields["salary_frequency"] == "annual"
+
+    def test_given_salary_wins(self):
+        fields = salary_fields(JD, "Pay range: $40-50 per hour")
+        assert fields["salary"] == "Pay range: $40-50 per hour"
+        assert (fields["salary_min"], fields["salary_frequency"]) == (40, "hourly")
+
+    def test_unparseable_given_salary_kept_as_text(self):
+        fields = salary_fields(JD, "Competitive")
+        assert fields["salary"] == "Competitive"
+        assert fields["salary_min"] is None and fields["salary_frequency"] is None
+
+    def test_no_salary(self):
+        assert set(salary_fields("No pay info here.").values()) == {None}
+
+
+class TestPrecompute:
+
+    def test_saved_job_fills_empty_columns(self):
+        saved = SavedJob(job_description=JD, job_location=None, job_salary=None)
+        precompute_saved_job(saved)
+        assert saved.job_salary and saved.salary_min == 120000
+        assert saved.job_location == "Toronto, ON"
+        assert {"skill": "Python", "frequency": 1} in saved.extracted_skills["skills"]
+        assert saved.extracted_at is not None
+
+    def test_job_keeps_given_location(self):
+        job = Job(job_description=JD, location="Remote", extracted_skills={"skills": []})
+        precompute_job(job)
+        assert job.location == "Remote"
+        assert job.extracted_skills == {"skills": []}
+        assert job.salary_max == 150000
+
+    def test_cleared_salary_stays_cleared(self):
+        job = Job(job_description=JD, salary="", extracted_skills={"skills": []})
+        clear_job_salary(job)
+        assert job.salary is None and job.salary_min is None
+        assert job.location == "Toronto, ON"  # never extracted: the rest is filled in
+        assert job.extracted_at is not None  # so the backfill won't bring the salary back
+
+
+class TestBackfill:
+
+    def _saved(self, db_session, user_id, search_id, **fields):
+        row = SavedJob(
+            user_id=user_id, search_id=search_id, job_title="Engineer", employer_name="Co",
+            job_apply_link="https://example.com", job_posted_at=datetime.now(timezone.utc),
+            job_description=JD, **fields,
+        )
+        db_session.add(row)
+        db_session.flush()
+        return row
+
+    def test_fills_unextracted_rows_only(self, db_session, test_user, test_job):
+        pending = self._saved(db_session, test_user.id, "bf-1")
+        done = self._saved(db_session, test_user.id, "bf-2", extracted_at=datetime(2026, 1, 1))
+
+        counts = backfill_extraction_columns(db_session, batch_size=1)
+
+        assert counts["saved_jobs"] >= 1 and counts["jobs"] >= 1
+        assert pending.extracted_at is not None and pending.salary_min == 120000
+        assert done.extracted_at == datetime(2026, 1, 1) and done.salary_min is None
+        # test_job had its salary text already: kept, and parsed into the structured columns
+        assert test_job.salary == "$140,000 - $180,000" and test_job.salary_min == 140000
+        assert backfill_extraction_columns(db_session) == {"jobs": 0, "saved_jobs": 0}
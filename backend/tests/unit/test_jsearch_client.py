@@ -0,0 +1,187 @@
+# File: backend/tests/unit/test_jsearch_client.py
+# Tests for the cached, coalesced jsearch proxy, against a local jsearch stub
+import asyncio
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import pytest
+
+from app.services import jsearch_client
+from app.services.jsearch_client import SearchCache, cache_key, normalize_query, search_cache
+from app.services.jsearch_client import search_jobs as async_search_jobs
+
+
+def search_jobs(*args):
+    return asyncio.run(async_search_jobs(*args))
+
+
+class _StubJSearch(BaseHTTPRequestHandler):
+    """GET /search → one job per query; query "boom" → 500. Records query strings."""
+    delay = 0.0
+    lock = threading.Lock()
+    queries: list = []
+
+    def do_GET(self):
+        cls = type(self)
+        query = parse_qs(urlparse(self.path).query)
+        with cls.lock:
+            cls.queries.append(query)
+        time.sleep(cls.delay)
+        if query["query"] == ["boom"]:
+            self.send_error(500)
+            return
+        body = json.dumps({"status": "OK", "data": [{
+            "job_id": f"id-{query['query'][0]}",
+            "job_title": "QA Lead",
+            "job_description": "Salary: $100,000 - $120,000 per year",
+        }]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def stub_jsearch(monkeypatch):
+    _StubJSearch.delay = 0.0
+    _StubJSearch.queries = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubJSearch)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(jsearch_client, "JSEARCH_URL", f"http://127.0.0.1:{server.server_address[1]}/search")
+    search_cache.clear()
+    yield _StubJSearch
+    server.shutdown()
+    server.server_close()
+    search_cache.clear()
+
+
+class TestSearchJobs:
+
+    def test_maps_results(self, stub_jsearch):
+        [job] = search_jobs("qa lead")
+        assert job["job_id"] == job["search_id"] == "id-qa lead"
+        assert job["job_salary"] == "Salary: $100,000 - $120,000"
+        sent = stub_jsearch.queries[0]
+        assert sent["num_pages"] == ["4"] and sent["country"] == ["ca"]
+
+    def test_repeat_query_served_from_cache(self, stub_jsearch):
+        first = search_jobs("QA  Lead")
+        assert search_jobs(" qa lead ") == first
+        assert len(stub_jsearch.queries) == 1
+        assert search_cache.stats()["hits"] == 1
+
+    def test_params_are_part_of_key(self, stub_jsearch):
+        search_jobs("qa lead")
+        search_jobs("qa lead", {"country": "us"})
+        assert [q["country"] for q in stub_jsearch.queries] == [["ca"], ["us"]]
+
+    def test_concurrent_identical_queries_coalesced(self, stub_jsearch):
+        stub_jsearch.delay = 0.3
+
+        async def search_all():
+            return await asyncio.gather(*(async_search_jobs("qa lead") for _ in range(8)))
+
+        results = asyncio.run(search_all())
+        assert len(stub_jsearch.queries) == 1
+        assert len(results) == 8 and all(r == results[0] for r in results)
+        assert search_cache.stats()["coalesced"] == 7
+
+    def test_upstream_error_gives_no_results_and_is_not_cached(self, stub_jsearch):
+        assert search_jobs("boom") == []
+        assert search_jobs("boom") == []
+        assert len(stub_jsearch.queries) == 2
+
+    def test_trace_is_opt_in_and_sampled(self, stub_jsearch, monkeypatch, caplog):
+        caplog.set_level(logging.INFO, logger="app.jsearch.trace")
+        search_jobs("untraced")
+        assert not [r for r in caplog.records if r.name == "app.jsearch.trace"]
+
+        monkeypatch.setattr(jsearch_client, "JSEARCH_TRACE_SAMPLE_RATE", 1.0)
+        search_jobs("traced")
+        [record] = [r for r in caplog.records if r.name == "app.jsearch.trace"]
+        trace = json.loads(record.getMessage())
+        assert trace["query"] == "traced" and trace["status"] == 200
+        assert trace["response"]["data"][0]["job_id"] == "id-traced"
+
+
+class TestSearchCache:
+
+    @staticmethod
+    def _value(value):
+        async def fetch():
+            return value
+        return fetch
+
+    def test_entries_expire_after_ttl(self):
+        now = [0.0]
+        cache = SearchCache(ttl=60, clock=lambda: now[0])
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            return len(calls)
+
+        assert asyncio.run(cache.get_or_fetch(("k",), fetch)) == 1
+        now[0] = 59
+        assert asyncio.run(cache.get_or_fetch(("k",), fetch)) == 1
+        now[0] = 61
+        assert asyncio.run(cache.get_or_fetch(("k",), fetch)) == 2
+
+    def test_least_recently_used_evicted(self):
+        cache = SearchCache(max_size=2)
+        for key in ("a", "b", "a", "c"):
+            asyncio.run(cache.get_or_fetch((key,), self._value(key)))
+        assert cache.stats()["size"] == 2
+        assert asyncio.run(cache.get_or_fetch(("b",), self._value("refetched"))) == "refetched"
+
+    def test_waiters_get_leader_exception(self):
+        cache = SearchCache()
+
+        async def failing_fetch():
+            await asyncio.sleep(0.05)
+            raise RuntimeError("upstream down")
+
+        async def run():
+            return await asyncio.gather(
+                cache.get_or_fetch(("k",), failing_fetch),
+                cache.get_or_fetch(("k",), self._value("unused")),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+        assert [str(r) for r in results] == ["upstream down", "upstream down"]
+        assert cache.stats() == {"size": 0, "hits": 0, "misses": 1, "coalesced": 1}
+
+    def test_cancelled_leader_does_not_cancel_waiters(self):
+        cache = SearchCache()
+
+        async def slow_fetch():
+            await asyncio.sleep(0.05)
+            return "value"
+
+        async def run():
+            leader = asyncio.ensure_future(cache.get_or_fetch(("k",), slow_fetch))
+            await asyncio.sleep(0)
+            waiter = asyncio.ensure_future(cache.get_or_fetch(("k",), self._value("unused")))
+            await asyncio.sleep(0)
+            leader.cancel()  # the first client disconnects
+            return await asyncio.gather(leader, waiter, return_exceptions=True)
+
+        leader, waiter = asyncio.run(run())
+        assert isinstance(leader, asyncio.CancelledError)
+        assert waiter == "value"
+        assert cache.stats() == {"size": 1, "hits": 0, "misses": 1, "coalesced": 1}
+
+    def test_normalized_key(self):
+        assert normalize_query("  Data\tENGINEER ") == "data engineer"
+        assert cache_key("Data Engineer", {"page": 1}) == cache_key("data  engineer", {"page": "1"})
@@ -1,7 +1,16 @@
 # File: backend/tests/unit/test_link_extractor.py
 # Tests for JDI link extraction and URL canonicalization
+from unittest.mock import MagicMock, patch
+
 import pytest
-from app.services.jdi.link_extractor import extract_job_links, normalize_url
+from app.services.jdi import link_extractor
+from app.services.jdi.link_extractor import (
+    ResolvedURLCache,
+    extract_job_links,
+    normalize_url,
+    resolve_canonical_url,
+    resolved_url_cache,
+)
 
 
 class TestExtractJobLinks:
@@ -216,3 +225,39 @@ class TestLinkedInShortener:
         links = extract_job_links(html, "linkedin")
         assert len(links) == 1
         assert "lnkd.in" in links[0]
+
+
+class TestResolveCanonicalUrlMemo:
+    """resolve_canonical_url memoizes successful resolutions per normalized raw URL."""
+
+    @pytest.fixture(autouse=True)
+    def _empty_cache(self):
+        resolved_url_cache.clear()
+        yield
+        resolved_url_cache.clear()
+
+    def _head(self, final_url):
+        return patch.object(link_extractor.outbound_http, "request_sync", return_value=MagicMock(url=final_url))
+
+    def test_second_call_skips_network(self):
+        with self._head("https://jobs.example.com/123") as head:
+            first = resolve_canonical_url("https://click.indeed.com/?jk=1&utm_source=a")
+            # Same link modulo tracking params → same memo key
+            second = resolve_canonical_url("https://click.indeed.com/?jk=1&utm_source=b")
+        assert first == second == "https://jobs.example.com/123"
+        assert head.call_count == 1
+
+    def test_failures_not_memoized(self):
+        with patch.object(link_extractor.outbound_http, "request_sync",
+                          side_effect=link_extractor.httpx.ConnectError("down")):
+            assert resolve_canonical_url("https://r.example.com/x") == "https://r.example.com/x"
+        assert resolved_url_cache.stats()["size"] == 0
+
+    def test_lru_eviction(self):
+        cache = ResolvedURLCache(max_size=2)
+        cache.put("a", "A")
+        cache.put("b", "B")
+        cache.get("a")
+        cache.put("c", "C")  # evicts b
+        assert cache.get("b") is None
+        assert cache.get("a") == "A"
@@ -0,0 +1,108 @@
+# File: backend/tests/unit/test_nlp_provider.py
+# Tests for the shared lazily loaded spaCy pipeline and the batched location fallback
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import spacy
+
+from app.utils import job_extraction
+from app.utils.job_extraction import extract_location, extract_locations
+from app.utils.nlp_provider import NLP_EXCLUDE, NLPProvider
+
+
+class FakeNLP:
+    """Stands in for a spaCy pipeline: every text has one GPE entity, its last word."""
+
+    pipe_names = ["ner"]
+
+    def __init__(self):
+        self.batches = []
+
+    def _doc(self, text):
+        words = text.split()
+        ents = [SimpleNamespace(text=words[-1].strip("."), label_="GPE")] if words else []
+        return SimpleNamespace(ents=ents)
+
+    def __call__(self, text):
+        return self._doc(text)
+
+    def pipe(self, texts, batch_size=32):
+        texts = list(texts)
+        self.batches.append(texts)
+        return (self._doc(t) for t in texts)
+
+
+class TestNLPProvider:
+
+    def test_not_loaded_until_first_use(self):
+        provider = NLPProvider()
+        with patch.object(spacy, "load", return_value=FakeNLP()) as load:
+            assert not provider.loaded
+            assert provider.get() is provider.get()
+        load.assert_called_once_with("en_core_web_sm", exclude=NLP_EXCLUDE)
+
+    def test_only_ner_loaded(self):
+        assert {"parser", "lemmatizer", "tagger"} <= set(NLP_EXCLUDE)
+        assert "ner" not in NLP_EXCLUDE
+
+    def test_concurrent_first_use_loads_once(self):
+        provider = NLPProvider()
+        barrier = threading.Barrier(8)
+
+        def use():
+            barrier.wait()
+            provider.get()
+
+        with patch.object(spacy, "load", return_value=FakeNLP()) as load:
+            threads = [threading.Thread(target=use) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        assert load.call_count == 1
+
+    def test_missing_model_is_non_fatal(self):
+        provider = NLPProvider(model="no_such_model")
+        with patch.object(spacy, "load", side_effect=OSError("model not found")) as load:
+            assert provider.get() is None
+            assert provider.get() is None
+            assert not provider.preload()
+            assert list(provider.pipe(["a", "b"])) == [None, None]
+        load.assert_called_once()
+
+    def test_pipe_batches_through_model(self):
+        provider = NLPProvider()
+        fake = FakeNLP()
+        with patch.object(spacy, "load", return_value=fake):
+            docs = list(provider.pipe(["Work from Toronto", "Office in Berlin"]))
+        assert [d.ents[0].text for d in docs] == ["Toronto", "Berlin"]
+        assert fake.batches == [["Work from Toronto", "Office in Berlin"]]
+
+
+class TestExtractLocations:
+
+    TEXTS = [
+        "Senior Engineer, Vancouver, BC",  # pattern match, never reaches spaCy
+        "Join our team in Lisbon.",
+        "",
+        "We build APIs for AI.",  # tech-term entity is skipped
+    ]
+
+    def test_matches_extract_location(self):
+        provider = NLPProvider()
+        fake = FakeNLP()
+        with patch.object(spacy, "load", return_value=fake), \
+             patch.object(job_extraction, "nlp_provider", provider), \
+             patch.object(job_extraction, "get_nlp", provider.get):
+            batched = extract_locations(self.TEXTS)
+            assert batched == [extract_location(t) for t in self.TEXTS]
+        assert batched == ["Vancouver, BC", "Lisbon", "Unspecified", "Unspecified"]
+        # One nlp.pipe call, only for the texts the patterns couldn't place
+        assert fake.batches == [["Join our team in Lisbon.", "We build APIs for AI."]]
+
+    def test_without_model(self):
+        provider = NLPProvider()
+        with patch.object(spacy, "load", side_effect=OSError("model not found")), \
+             patch.object(job_extraction, "nlp_provider", provider):
+            assert extract_locations(self.TEXTS) == ["Vancouver, BC", "Unspecified", "Unspecified", "Unspecified"]
@@ -0,0 +1,132 @@
+# File: backend/tests/unit/test_outbound_http.py
+# Tests for the shared outbound HTTP layer, against a local HTTP stub server
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from app.services.outbound_http import OutboundHTTP
+
+
+class _StubUpstream(BaseHTTPRequestHandler):
+    """/ok → 200, /flaky → 503 until the 3rd request, /down → 503 always, /bad → 500."""
+    lock = threading.Lock()
+    hits: dict = {}
+
+    def _serve(self):
+        cls = type(self)
+        with cls.lock:
+            cls.hits[self.path] = cls.hits.get(self.path, 0) + 1
+            n = cls.hits[self.path]
+        if self.path == "/ok" or (self.path == "/flaky" and n >= 3):
+            body = b"ok"
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        self.send_error(500 if self.path == "/bad" else 503)
+
+    def do_GET(self):
+        self._serve()
+
+    def do_POST(self):
+        self._serve()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def upstream():
+    _StubUpstream.hits = {}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubUpstream)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture()
+def http():
+    client = OutboundHTTP(backoff=0.0)
+    yield client
+    asyncio.run(client.aclose())
+
+
+def _request(http: OutboundHTTP, method: str, url: str, **kwargs) -> httpx.Response:
+    async def run():
+        await http.start()
+        try:
+            return await http.request(method, url, **kwargs)
+        finally:
+            await http.aclose()
+    return asyncio.run(run())
+
+
+class TestRetries:
+
+    def test_retries_until_success(self, http, upstream):
+        resp = _request(http, "GET", f"{upstream}/flaky")
+        assert resp.status_code == 200
+        assert _StubUpstream.hits["/flaky"] == 3
+        assert http.stats()["127.0.0.1"]["retries"] == 2
+
+    def test_last_retryable_response_returned(self, http, upstream):
+        resp = http.request_sync("GET", f"{upstream}/down")
+        assert resp.status_code == 503
+        assert _StubUpstream.hits["/down"] == 3
+
+    def test_other_errors_not_retried(self, http, upstream):
+        assert http.request_sync("GET", f"{upstream}/bad").status_code == 500
+        assert _StubUpstream.hits["/bad"] == 1
+
+    def test_post_not_retried_by_default(self, http, upstream):
+        assert _request(http, "POST", f"{upstream}/down").status_code == 503
+        assert _StubUpstream.hits["/down"] == 1
+        assert _request(http, "POST", f"{upstream}/flaky", retries=2).status_code == 200
+
+    def test_transport_errors_retried_then_raised(self, http):
+        with pytest.raises(httpx.ConnectError):
+            http.request_sync("GET", "http://127.0.0.1:9/nothing-listening")
+        stats = http.stats()["127.0.0.1"]
+        assert (stats["requests"], stats["retries"], stats["errors"]) == (3, 2, 1)
+
+    def test_backoff_doubles_and_is_capped(self):
+        client = OutboundHTTP(backoff=0.5)
+        assert [client._delay(n) for n in range(6)] == [0.5, 1.0, 2.0, 4.0, 8.0, 8.0]
+
+
+class TestLifecycleAndMetrics:
+
+    def test_metrics_per_host(self, http, upstream):
+        http.request_sync("GET", f"{upstream}/ok")
+        _request(http, "GET", f"{upstream}/bad")
+        http.request_sync("GET", upstream.replace("127.0.0.1", "localhost") + "/ok")
+        stats = http.stats()
+        assert set(stats) == {"127.0.0.1", "localhost"}
+        assert stats["127.0.0.1"]["requests"] == 2
+        assert stats["127.0.0.1"]["statuses"] == {"2xx": 1, "5xx": 1}
+        assert stats["localhost"]["statuses"] == {"2xx": 1}
+        http.reset_stats()
+        assert http.stats() == {}
+
+    def test_async_client_lives_between_start_and_close(self, http, upstream):
+        async def run():
+            await http.start()
+            client = http._client
+            await http.get(f"{upstream}/ok")
+            await http.get(f"{upstream}/ok")
+            assert http._client is client
+            await http.aclose()
+            assert http._client is None and client.is_closed
+
+        asyncio.run(run())
+
+    def test_request_without_start_uses_short_lived_client(self, http, upstream):
+        resp = asyncio.run(http.get(f"{upstream}/ok"))
+        assert resp.text == "ok"
+        assert http._client is None
@@ -0,0 +1,74 @@
+# File: backend/tests/unit/test_resume_features.py
+# Tests for the per-resume feature cache used by match scoring
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from app.services.resume_features import ResumeFeatureCache, build_resume_features
+from app.services.score_calc import calculate_scores, tokenize_terms
+
+RESUME_TEXT = "Senior Python Developer. Django, AWS and Docker. CI/CD pipelines."
+JD = "Looking for a Python developer with Django and Kubernetes experience."
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _resume(resume_id=1, text=RESUME_TEXT, updated_at=T0):
+    return SimpleNamespace(id=resume_id, parsed_text=text, updated_at=updated_at)
+
+
+class TestBuildResumeFeatures:
+
+    def test_features_content(self):
+        f = build_resume_features(7, RESUME_TEXT, T0)
+        assert f.resume_id == 7
+        assert f.text_lower == RESUME_TEXT.lower()
+        assert f.term_counts == tokenize_terms(RESUME_TEXT)
+
+    def test_none_text(self):
+        f = build_resume_features(1, None)
+        assert f.text_lower == ""
+        assert f.term_counts == {}
+
+
+class TestResumeFeatureCache:
+
+    def test_second_lookup_is_a_hit(self):
+        cache = ResumeFeatureCache()
+        first = cache.get(_resume())
+        assert cache.get(_resume()) is first
+        assert cache.stats() == {"size": 1, "hits": 1, "misses": 1}
+
+    def test_updated_at_change_recomputes(self):
+        cache = ResumeFeatureCache()
+        cache.get(_resume())
+        f = cache.get(_resume(text="Pastry chef", updated_at=T0 + timedelta(minutes=1)))
+        assert f.text_lower == "pastry chef"
+        assert cache.misses == 2
+
+    def test_invalidate_forces_recompute(self):
+        cache = ResumeFeatureCache()
+        cache.get(_resume())
+        cache.invalidate(1)
+        # Same updated_at but rewritten text — invalidation must drop the stale entry
+        assert cache.get(_resume(text="Go developer")).text_lower == "go developer"
+        assert cache.hits == 0
+
+    def test_lru_eviction(self):
+        cache = ResumeFeatureCache(max_size=2)
+        cache.get(_resume(1))
+        cache.get(_resume(2))
+        cache.get(_resume(1))       # 1 is now most recent
+        cache.get(_resume(3))       # evicts 2
+        assert cache.stats()["size"] == 2
+        cache.get(_resume(1))
+        assert cache.hits == 2
+        cache.get(_resume(2))
+        assert cache.misses == 4
+
+
+class TestCalculateScoresWithCachedTerms:
+
+    def test_same_scores_as_raw_text(self):
+        keywords = ["python", "django", "kubernetes"]
+        expected = calculate_scores(RESUME_TEXT, JD, keywords)
+        f = build_resume_features(1, RESUME_TEXT)
+        assert calculate_scores(RESUME_TEXT, JD, keywords, resume_terms=f.term_counts) == expected
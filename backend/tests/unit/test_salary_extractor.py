@@ -1,7 +1,15 @@
 """Unit tests for app.utils.salary_extractor -- structured salary parsing."""
 
+import csv
+import re
+import time
+from pathlib import Path
+
 import pytest
-from app.utils.salary_extractor import extract_salary_info, extract_salary, SalaryInfo
+from app.utils import salary_extractor
+from app.utils.salary_extractor import SALARY_PATTERNS, extract_salary_info, extract_salary, SalaryInfo
+
+UNIT_DIR = Path(__file__).parent
 
 
 class TestExtractSalaryInfo:
@@ -109,3 +117,55 @@ class TestExtractSalaryBackwardCompat:
     def test_returns_none_when_not_found(self):
         result = extract_salary("No salary mentioned here.")
         assert result is None
+
+
+def _reference_salary_info(text: str):
+    """The original scan: re.finditer over the whole JD, pattern by pattern."""
+    for pattern in SALARY_PATTERNS:
+        for match in re.finditer(pattern.regex.pattern, text, re.IGNORECASE | re.MULTILINE):
+            info = salary_extractor._parse_salary_match(match, text)
+            if info:
+                return info
+    return None
+
+
+def _as_tuple(info):
+    return info and (info.raw_text, info.min_amount, info.max_amount, info.currency, info.frequency)
+
+
+def _gold_descriptions() -> list[str]:
+    csv.field_size_limit(10 ** 8)
+    texts = []
+    for path in sorted(UNIT_DIR.glob("gold_job*.csv")):
+        with path.open("r", encoding="utf-8") as f:
+            texts += [r["job_description"] for r in csv.DictReader(f) if r.get("job_description")]
+    return texts
+
+
+class TestSalaryScannerParity:
+    @pytest.mark.parametrize("text", [
+        "Base pay\n$140,000 - $200,000",  # keyword and range on adjacent lines
+        "The pay is set\n at $50 /hour to $60 /hour",
+        "Salary ranging\n\nfrom $3,000 to $4,000 weekly",
+        "Our payment terms: net 30.\n$1,200 - $1,500 per week",  # "$" too far from keyword
+        "Compensation is competitive: $90,000 to $110,000 to $130,000 CAD",
+        "The rate\nstarts at\n$25 /hour to $30 /hour",
+        "Salary: 120-140K, or pay range: 140,000 - 160,000 CAD",
+        "Corporate perks\nPay range: $40-50 per hour\nBase pay $120K - $140K",
+    ])
+    def test_edge_cases_match_reference(self, text):
+        assert _as_tuple(extract_salary_info(text)) == _as_tuple(_reference_salary_info(text))
+
+    def test_gold_descriptions_match_reference(self):
+        texts = _gold_descriptions()
+        assert texts
+        assert [_as_tuple(extract_salary_info(t)) for t in texts] == \
+            [_as_tuple(_reference_salary_info(t)) for t in texts]
+
+    def test_long_single_line_stays_linear(self):
+        # Each "pay" used to send ".*?" to the end of the line, retrying the tail at every char
+        text = "Our payment platform pays partners daily. " * 500 + "Salary: $4,000-$6,000 monthly"
+        start = time.perf_counter()
+        info = extract_salary_info(text)
+        assert time.perf_counter() - start < 1.0
+        assert (info.min_amount, info.max_amount, info.frequency) == (4000, 6000, "monthly")
@@ -4,6 +4,7 @@ import pytest
 from app.services.score_calc import (
     calculate_scores,
     calculate_similarity_score,
+    calculate_similarity_scores,
     calculate_keyword_score,
     calculate_skill_match_score,
     calculate_match_score,
@@ -69,6 +70,37 @@ class TestSimilarityScore:
         assert isinstance(score, float)
 
 
+class TestSimilarityScoresBatch:
+    """calculate_similarity_scores must reproduce the pairwise numbers exactly."""
+
+    RESUMES = [
+        WELL_FORMATTED_RESUME,
+        PLAIN_TEXT_RESUME,
+        "Baking bread and pastries in a commercial kitchen",
+        "Python FastAPI PostgreSQL Docker Kubernetes Python Python",
+        "",
+    ]
+
+    def test_matches_pairwise_scores(self):
+        expected = [calculate_similarity_score(r, JOB_DESCRIPTION) for r in self.RESUMES]
+        assert calculate_similarity_scores(self.RESUMES, JOB_DESCRIPTION) == expected
+
+    def test_matches_pairwise_on_thin_email_text(self):
+        jd = "Job Title: Quality Assurance Manager\nCompany: Acme\nLocation: Vancouver, BC"
+        expected = [calculate_similarity_score(r, jd) for r in self.RESUMES]
+        assert calculate_similarity_scores(self.RESUMES, jd) == expected
+
+    def test_identical_texts_high_score(self):
+        text = "Python FastAPI PostgreSQL Docker Kubernetes"
+        assert calculate_similarity_scores([text], text) == [100.0]
+
+    def test_empty_job_description_returns_zeros(self):
+        assert calculate_similarity_scores(["Python developer", "Go"], "  ") == [0.0, 0.0]
+
+    def test_no_resumes_returns_empty(self):
+        assert calculate_similarity_scores([], JOB_DESCRIPTION) == []
+
+
 # ---------------------------------------------------------------------------
 # calculate_keyword_score
 # ---------------------------------------------------------------------------
@@ -0,0 +1,88 @@
+# File: backend/tests/unit/test_skill_matcher.py
+# Parity tests: single-pass SkillMatcher vs the original per-keyword \b regex loop
+import csv
+import re
+from pathlib import Path
+
+import pytest
+
+from app.config.skills_config import SKILL_KEYWORDS
+from app.utils.job_extraction import extract_skills_with_frequency
+from app.utils.skill_matcher import SKILL_MATCHER, SkillMatcher
+
+GOLD_DIR = Path(__file__).parent
+
+
+def _reference_counts(text: str, skills=SKILL_KEYWORDS) -> dict:
+    """The original extract_skills_with_frequency loop: one re.findall per skill."""
+    t = text.lower()
+    freq = {}
+    for skill in skills:
+        if not skill:
+            continue
+        count = len(re.findall(r"\b" + re.escape(str(skill).lower()) + r"\b", t))
+        if count > 0:
+            freq[str(skill)] = count
+    return freq
+
+
+def _gold_descriptions() -> list[str]:
+    csv.field_size_limit(10 ** 8)
+    texts = []
+    for path in sorted(GOLD_DIR.glob("gold_*.csv")):
+        with path.open("r", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                jd = row.get("job_description")
+                if jd:
+                    texts.append(jd)
+    return texts
+
+
+class TestSkillMatcherParity:
+    """Counts must match the per-keyword regexes exactly."""
+
+    def test_gold_csv_parity(self):
+        texts = _gold_descriptions()
+        assert texts, "gold CSV fixtures not found"
+        for jd in texts:
+            assert SKILL_MATCHER.count(jd.lower()) == _reference_counts(jd)
+
+    def test_gold_csv_full_schema_parity(self):
+        """extract_skills_with_frequency output (ordering included) is unchanged."""
+        for jd in _gold_descriptions()[:100]:
+            freq = _reference_counts(jd)
+            expected = sorted(
+                [{"skill": s, "frequency": n} for s, n in freq.items()],
+                key=lambda x: x["frequency"],
+                reverse=True,
+            )
+            result = extract_skills_with_frequency(jd)
+            assert result["skills"] == (expected or [{"skill": "N/A", "frequency": 0}])
+
+    @pytest.mark.parametrize("text", [
+        "C++ developer with C# and .Net experience",
+        "c++developer, c#sharp, asp.net core, ADO.NET",
+        "CI/CD pipelines; ci/cd; CI/CDs",
+        "AI/ML platform team — AI, ML, ai/ml/ai",
+        "Node.js vs Next.js, Scikit-learn, Spring Boot",
+        "javascript java; postgresql mysql nosql sql",
+        "go go-lang golang django; Go.",
+        "Kubernetes_operator kubernetes-operator",
+        "",
+    ])
+    def test_symbol_and_overlap_edge_cases(self, text):
+        assert SKILL_MATCHER.count(text.lower()) == _reference_counts(text)
+
+
+class TestSkillMatcher:
+
+    def test_overlapping_keywords_both_counted(self):
+        matcher = SkillMatcher(["AI/ML", "AI"])
+        assert matcher.count("ai/ml team") == {"AI/ML": 1, "AI": 1}
+
+    def test_preserves_keyword_casing_and_order(self):
+        matcher = SkillMatcher(["Python", "AWS"])
+        assert list(matcher.count("aws python aws")) == ["Python", "AWS"]
+
+    def test_empty_skill_list(self):
+        assert SkillMatcher([]).count("python") == {}
@@ -14,7 +14,7 @@ import {
   markCandidateSeen,
   ignoreCandidate,
   promoteCandidate,
-  runJDIIngestion,
+  streamJDIIngestion,
   getGmailStatus,
   type JDICandidate,
   type JDICandidateDetail,
@@ -97,7 +97,12 @@ export function JDIFeed({ userId }: JDIFeedProps) {
   const handleRefresh = async () => {
     setScanning(true)
     try {
-      const result = await runJDIIngestion(userId)
+      // Follow the run's event stream; new candidates bump the unread badge as they arrive
+      const result = await streamJDIIngestion(userId, 24, event => {
+        if (event.type === "candidate_created") {
+          setUnreadCount(count => count + 1)
+        }
+      })
       toast.success(`Scan complete: ${result.new_candidates} new jobs found from ${result.total_emails_scanned} emails`)
       await loadCandidates()
       await loadUnreadCount()  // Refresh unread count after scanning
@@ -42,6 +42,46 @@ export interface JDIRunResult {
   message: string
 }
 
+export interface JDIRunStatus {
+  run_id: string
+  status: "queued" | "running" | "succeeded" | "failed"
+  stage: string | null
+  emails_scanned: number
+  cards_found: number
+  cards_processed: number
+  new_candidates: number
+  message: string | null
+  error: string | null
+  deduplicated: boolean
+  created_at: string
+  started_at: string | null
+  finished_at: string | null
+}
+
+// One event from GET /api/jdi/runs/{run_id}/events (Server-Sent Events)
+export interface JDIRunEvent {
+  type:
+    | "stage"
+    | "emails_fetched"
+    | "cards_parsed"
+    | "cards_scored"
+    | "candidate_created"
+    | "done"
+    | "failed"
+  seq: number
+  stage?: string
+  emails_scanned?: number
+  cards_found?: number
+  cards_processed?: number
+  new_candidates?: number
+  candidate?: Pick<
+    JDICandidate,
+    "id" | "source" | "title" | "company" | "location" | "salary_text" | "match_score"
+  > & { job_url: string | null }
+  result?: JDIRunResult
+  error?: string
+}
+
 export interface GmailIntegrationStatus {
   id: string
   user_id: number
@@ -129,10 +169,10 @@ export async function promoteCandidate(
   return res.data
 }
 
-export async function runJDIIngestion(
+export async function startJDIRun(
   userId: string,
   windowHours: number = 24
-): Promise<JDIRunResult> {
+): Promise<JDIRunStatus> {
   const res = await axios.post(
     `${BACKEND_BASE_URL}/api/jdi/run?user_id=${userId}`,
     { window_hours: windowHours }
@@ -140,6 +180,77 @@ export async function runJDIIngestion(
   return res.data
 }
 
+export async function getJDIRunStatus(runId: string, userId: string): Promise<JDIRunStatus> {
+  const res = await axios.get(
+    `${BACKEND_BASE_URL}/api/jdi/runs/${runId}?user_id=${userId}`
+  )
+  return res.data
+}
+
+// Ingestion runs in a background worker: queue a run, then poll until it finishes
+export async function runJDIIngestion(
+  userId: string,
+  windowHours: number = 24,
+  onProgress?: (status: JDIRunStatus) => void,
+  pollIntervalMs: number = 2000
+): Promise<JDIRunResult> {
+  let run = await startJDIRun(userId, windowHours)
+  while (run.status === "queued" || run.status === "running") {
+    onProgress?.(run)
+    await new Promise(resolve => setTimeout(resolve, pollIntervalMs))
+    run = await getJDIRunStatus(run.run_id, userId)
+  }
+  if (run.status === "failed") {
+    throw new Error(run.error || "Ingestion failed")
+  }
+  return {
+    new_candidates: run.new_candidates,
+    total_emails_scanned: run.emails_scanned,
+    message: run.message || "Ingestion complete",
+  }
+}
+
+// Queue a run and follow its event stream; candidates arrive through onEvent
+// as they are created. Falls back to polling where EventSource is unavailable.
+export async function streamJDIIngestion(
+  userId: string,
+  windowHours: number = 24,
+  onEvent?: (event: JDIRunEvent) => void
+): Promise<JDIRunResult> {
+  if (typeof EventSource === "undefined") {
+    return runJDIIngestion(userId, windowHours)
+  }
+  const run = await startJDIRun(userId, windowHours)
+  const eventTypes: JDIRunEvent["type"][] = [
+    "stage", "emails_fetched", "cards_parsed", "cards_scored", "candidate_created", "done", "failed",
+  ]
+  return new Promise((resolve, reject) => {
+    const source = new EventSource(
+      `${BACKEND_BASE_URL}/api/jdi/runs/${run.run_id}/events?user_id=${userId}`
+    )
+    for (const type of eventTypes) {
+      source.addEventListener(type, (msg: MessageEvent) => {
+        const event: JDIRunEvent = { type, seq: Number(msg.lastEventId), ...JSON.parse(msg.data) }
+        onEvent?.(event)
+        if (type === "done") {
+          source.close()
+          resolve(event.result as JDIRunResult)
+        } else if (type === "failed") {
+          source.close()
+          reject(new Error(event.error || "Ingestion failed"))
+        }
+      })
+    }
+    // EventSource reconnects on its own (resuming after Last-Event-ID); only
+    // give up once the browser has closed the stream for good
+    source.onerror = () => {
+      if (source.readyState === EventSource.CLOSED) {
+        reject(new Error("Lost connection to the ingestion run"))
+      }
+    }
+  })
+}
+
 // --- Gmail Integration API ---
 
 export async function getGmailConnectUrl(userId: string, frontendUrl: string): Promise<string> {